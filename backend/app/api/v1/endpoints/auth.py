@@ -7,7 +7,8 @@ from typing import Any
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, text
+from sqlalchemy import select, update, func, lambda_stmt
+from sqlalchemy.dialects.postgresql import insert
 
 from app.core.database import get_db
 from app.core.deps import get_current_user
@@ -16,8 +17,9 @@ from app.core.security import (
     create_refresh_token,
     verify_password,
     get_password_hash,
-    verify_token,
-    validate_password_strength
+    verify_token_async,
+    validate_password_strength,
+    DUMMY_PASSWORD_HASH
 )
 from app.core.config import settings
 from app.models.user import User
@@ -33,14 +35,6 @@ async def register(
 ) -> Any:
     """Register a new user"""
     
-    # Check if user already exists
-    result = await db.execute(select(User).where(User.email == user_in.email))
-    if result.scalar_one_or_none():
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="The user with this email already exists in the system"
-        )
-    
     # Validate password strength
     is_valid, errors = validate_password_strength(user_in.password)
     if not is_valid:
@@ -49,29 +43,32 @@ async def register(
             detail={"message": "Password does not meet requirements", "errors": errors}
         )
     
-    # Create user
-    user = User(
-        email=user_in.email,
-        password_hash=get_password_hash(user_in.password),
-        first_name=user_in.first_name,
-        last_name=user_in.last_name,
-        is_active=True,
-        is_verified=False  # Email verification required
+    # Create user; an existing email makes the insert a no-op with no row back
+    result = await db.execute(
+        insert(User)
+        .values(
+            email=user_in.email,
+            password_hash=get_password_hash(user_in.password),
+            first_name=user_in.first_name,
+            last_name=user_in.last_name,
+            is_active=True,
+            is_verified=False  # Email verification required
+        )
+        .on_conflict_do_nothing(index_elements=[User.email])
+        .returning(User)
     )
+    user = result.scalar_one_or_none()
+    
+    if user is None:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="The user with this email already exists in the system"
+        )
     
-    db.add(user)
     await db.commit()
-    await db.refresh(user)
-    
-    return UserResponse(
-        id=user.id,
-        email=user.email,
-        first_name=user.first_name,
-        last_name=user.last_name,
-        is_active=user.is_active,
-        is_verified=user.is_verified,
-        created_at=user.created_at
-    )
+    
+    return UserResponse.model_validate(user)
 
 
 @router.post("/login", response_model=Token)
@@ -81,11 +78,32 @@ async def login(
 ) -> Any:
     """OAuth2 compatible token login, get an access token for future requests"""
     
-    # Get user by email
-    result = await db.execute(select(User).where(User.email == form_data.username))
-    user = result.scalar_one_or_none()
+    # Fetch the user and stamp last_login in a single round-trip; the update
+    # is rolled back below if the credentials turn out to be wrong
+    result = await db.execute(
+        update(User)
+        .where(User.email == form_data.username)
+        .values(last_login=func.now())
+        .returning(
+            User.id,
+            User.password_hash,
+            User.is_active,
+            User.email,
+            User.first_name,
+            User.last_name
+        )
+        .execution_options(synchronize_session=False)
+    )
+    user = result.first()
+    
+    # Always run bcrypt, even for unknown emails, so timing doesn't leak existence
+    password_ok = verify_password(
+        form_data.password,
+        user.password_hash if user else DUMMY_PASSWORD_HASH
+    )
     
-    if not user or not verify_password(form_data.password, user.password_hash):
+    if not user or not password_ok:
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
@@ -93,11 +111,14 @@ async def login(
         )
     
     if not user.is_active:
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Inactive user"
         )
     
+    await db.commit()
+    
     # Create access token
     access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = create_access_token(
@@ -105,17 +126,13 @@ async def login(
         expires_delta=access_token_expires,
         additional_claims={
             "email": user.email,
-            "name": user.full_name
+            "name": f"{user.first_name} {user.last_name}"
         }
     )
     
     # Create refresh token
     refresh_token = create_refresh_token(subject=user.id)
     
-    # Update last login
-    await db.execute(text("UPDATE users SET last_login = NOW() WHERE id = :user_id"), {"user_id": user.id})
-    await db.commit()
-    
     return {
         "access_token": access_token,
         "refresh_token": refresh_token,
@@ -132,7 +149,7 @@ async def refresh_token(
     """Refresh access token using refresh token"""
     
     # Verify refresh token
-    user_id = verify_token(refresh_token, token_type="refresh")
+    user_id = await verify_token_async(refresh_token, token_type="refresh")
     if not user_id:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -140,7 +157,7 @@ async def refresh_token(
         )
     
     # Get user
-    result = await db.execute(select(User).where(User.id == user_id))
+    result = await db.execute(lambda_stmt(lambda: select(User).where(User.id == user_id)))
     user = result.scalar_one_or_none()
     
     if not user or not user.is_active:
@@ -179,12 +196,4 @@ async def test_token(
     current_user: User = Depends(get_current_user)
 ) -> Any:
     """Test access token"""
-    return UserResponse(
-        id=current_user.id,
-        email=current_user.email,
-        first_name=current_user.first_name,
-        last_name=current_user.last_name,
-        is_active=current_user.is_active,
-        is_verified=current_user.is_verified,
-        created_at=current_user.created_at
-    )
\ No newline at end of file
+    return UserResponse.model_validate(current_user)
\ No newline at end of file
@@ -2,143 +2,311 @@
 Document management endpoints with file upload and processing
 """
 
+import asyncio
 import os
 import uuid
-import mimetypes
-from typing import Any, List, Optional
+from typing import Any, Optional
 from pathlib import Path
 from datetime import datetime
 
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form, BackgroundTasks
+import aiofiles
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form, BackgroundTasks, Query, Request, Response
+from fastapi.responses import RedirectResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update
+from sqlalchemy import select, update, insert, lambda_stmt
+from sqlalchemy.orm import load_only
+from redis.exceptions import RedisError
 
-from app.core.database import get_db
+from app.api.v1.etags import not_modified
+from app.api.v1.pagination import check_cursor, newest_first_page, next_cursor
+from app.core.database import get_db, AsyncSessionLocal
 from app.core.deps import get_current_active_user
 from app.core.config import settings
+from app.core.logging import get_logger
+from app.core.redis import redis_client
 from app.models.user import User
 from app.models.document import Document
 from app.models.venture import Venture
 from app.services.document_processor import document_processor, DocumentProcessingError
-from app.services.nlp_processor import nlp_processor
+from app.services.nlp_processor import get_nlp_processor
 from app.services.scoring_engine import scoring_engine
-from app.schemas.document import DocumentResponse, DocumentCreate, DocumentUpdate
+from app.services.storage import storage_service
+from app.schemas.document import (
+    DocumentResponse,
+    DocumentCreate,
+    DocumentUpdate,
+    DocumentPage,
+    DocumentUploadInit,
+    DocumentUploadTicket,
+    DocumentUploadComplete
+)
+
+logger = get_logger(__name__)
 
 router = APIRouter()
 
+# Read size for streaming uploads to disk
+UPLOAD_CHUNK_SIZE = 1 << 20  # 1MB
 
-async def process_document_background(
-    document_id: str,
-    file_path: str,
-    file_type: str,
-    db: AsyncSession
-):
-    """Background task for document processing"""
+# Upper bound on list_documents page size
+MAX_PAGE_SIZE = 100
+
+# Lifetime of cached processing status entries in Redis
+DOCUMENT_STATUS_TTL_SECONDS = 300
+
+# Clients may keep document responses but must revalidate them via ETag
+DOCUMENT_CACHE_CONTROL = "private, no-cache"
+
+# Allowed types as listed in rejection messages
+ALLOWED_FILE_TYPES_DISPLAY = ", ".join(sorted(settings.ALLOWED_FILE_TYPES))
+
+
+def _status_cache_key(document_id: Any) -> str:
+    return f"doc:status:{document_id}"
+
+
+async def _cache_document_status(
+    document_id: Any,
+    processing_status: str,
+    started_at: Optional[datetime] = None,
+    completed_at: Optional[datetime] = None,
+    error: Optional[str] = None
+) -> None:
+    """Publish a status transition for get_processing_status to read
+    
+    Best effort: if Redis is unavailable the endpoint falls back to Postgres.
+    """
     try:
-        # Update status to processing
-        await db.execute(
+        await redis_client.set(
+            _status_cache_key(document_id),
+            orjson.dumps({
+                'status': processing_status,
+                'started_at': started_at,
+                'completed_at': completed_at,
+                'error': error
+            }),
+            ex=DOCUMENT_STATUS_TTL_SECONDS
+        )
+    except RedisError as e:
+        logger.warning(f"Failed to cache status for document {document_id}: {str(e)}")
+
+
+async def _mark_document_processing(document_id: str) -> None:
+    """Flag a document as being processed"""
+    started_at = datetime.utcnow()
+    async with AsyncSessionLocal() as session, session.begin():
+        await session.execute(
             update(Document)
             .where(Document.id == document_id)
             .values(
                 processing_status='processing',
-                processing_started_at=datetime.utcnow()
+                processing_started_at=started_at
             )
         )
-        await db.commit()
-        
-        # Process the document
-        processing_result = await document_processor.process_document(
-            file_path, file_type, document_id
+    await _cache_document_status(document_id, 'processing', started_at=started_at)
+
+
+async def _extract_document(document_id: str, file_path: str, file_type: str) -> dict:
+    """Run the document processor, fetching object-stored files locally first"""
+    local_path = file_path
+    if storage_service.is_object_path(file_path):
+        local_path = await storage_service.download_to_tempfile(file_path)
+    
+    try:
+        return await document_processor.process_document(
+            local_path, file_type, document_id
         )
+    finally:
+        if local_path != file_path:
+            os.unlink(local_path)
+
+
+async def process_document_background(
+    document_id: str,
+    file_path: str,
+    file_type: str,
+    document_type: Optional[str] = None
+):
+    """Background task for document processing
+    
+    Runs after the response is sent, when the request-scoped session is
+    already closed, so it opens its own. Each status write is a short
+    transaction; no connection is held during extraction and analysis.
+    """
+    try:
+        # The status write and extraction are independent, so overlap them;
+        # if extraction fails the TaskGroup cancels the pending status write
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(_mark_document_processing(document_id))
+            extraction = tg.create_task(
+                _extract_document(document_id, file_path, file_type)
+            )
+        processing_result = extraction.result()
         
-        # Run NLP analysis on extracted content
+        # Run NLP analysis on extracted content; the document type picks the
+        # extractors it needs
         extracted_text = processing_result.get('extracted_content', {}).get('full_text', '')
-        nlp_result = await nlp_processor.analyze_text(extracted_text)
+        nlp_result = await get_nlp_processor().analyze_text(extracted_text, document_type or "general")
         
-        # Calculate investment scores
+        # Calculate investment scores (needs the NLP result)
         score_result = await scoring_engine.calculate_investment_score(
             nlp_result, processing_result
         )
         
         # Update document with results
-        await db.execute(
-            update(Document)
-            .where(Document.id == document_id)
-            .values(
-                processing_status='completed',
-                processing_completed_at=datetime.utcnow(),
-                extracted_content=processing_result.get('extracted_content'),
-                structured_data=nlp_result,
-                entities=nlp_result.get('entities'),
-                financial_data=nlp_result.get('financial_metrics'),
-                confidence_score=str(nlp_result.get('confidence_score', 0.5)),
-                text_quality=str(processing_result.get('quality_metrics', {}).get('text_quality_score', 0.5)),
-                data_completeness=str(score_result.confidence_interval[1] / 100)
+        completed_at = datetime.utcnow()
+        async with AsyncSessionLocal() as session, session.begin():
+            result = await session.execute(
+                update(Document)
+                .where(Document.id == document_id)
+                .values(
+                    processing_status='completed',
+                    processing_completed_at=completed_at,
+                    extracted_content=processing_result.get('extracted_content'),
+                    structured_data=nlp_result,
+                    entities=nlp_result.get('entities'),
+                    financial_data=nlp_result.get('financial_metrics'),
+                    confidence_score=str(nlp_result.get('confidence_score', 0.5)),
+                    text_quality=str(processing_result.get('quality_metrics', {}).get('text_quality_score', 0.5)),
+                    data_completeness=str(score_result.confidence_interval[1] / 100)
+                )
+                .returning(Document.processing_started_at)
             )
+            started_at = result.scalar_one_or_none()
+        await _cache_document_status(
+            document_id, 'completed', started_at=started_at, completed_at=completed_at
         )
-        await db.commit()
         
     except Exception as e:
+        if isinstance(e, ExceptionGroup):
+            e = e.exceptions[0]
+        
         # Update status to failed
-        await db.execute(
-            update(Document)
-            .where(Document.id == document_id)
-            .values(
-                processing_status='failed',
-                processing_error=str(e),
-                processing_completed_at=datetime.utcnow()
+        completed_at = datetime.utcnow()
+        async with AsyncSessionLocal() as session, session.begin():
+            result = await session.execute(
+                update(Document)
+                .where(Document.id == document_id)
+                .values(
+                    processing_status='failed',
+                    processing_error=str(e),
+                    processing_completed_at=completed_at
+                )
+                .returning(Document.processing_started_at)
             )
+            started_at = result.scalar_one_or_none()
+        await _cache_document_status(
+            document_id, 'failed', started_at=started_at, completed_at=completed_at, error=str(e)
         )
-        await db.commit()
 
 
-@router.post("/upload", response_model=DocumentResponse)
-async def upload_document(
-    background_tasks: BackgroundTasks,
-    file: UploadFile = File(...),
-    venture_id: str = Form(...),
-    document_type: Optional[str] = Form(None),
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
-) -> Any:
-    """Upload and process a document"""
+# Columns serialized by list_documents
+DOCUMENT_LIST_COLUMNS = (
+    Document.id,
+    Document.venture_id,
+    Document.filename,
+    Document.original_filename,
+    Document.file_type,
+    Document.file_size,
+    Document.processing_status,
+    Document.document_type,
+    Document.confidence_score,
+    Document.text_quality,
+    Document.created_at,
+    Document.processing_completed_at,
+)
+
+
+# Columns serialized by get_document; everything except the JSONB blobs
+DOCUMENT_DETAIL_COLUMNS = DOCUMENT_LIST_COLUMNS + (
+    Document.data_completeness,
+    Document.processing_started_at,
+    Document.processing_error,
+)
+
+
+async def _get_document_or_404(
+    db: AsyncSession,
+    document_id: uuid.UUID,
+    *columns: Any
+) -> Document:
+    """Fetch a document by primary key, loading only ``columns`` if given"""
+    options = [load_only(*columns)] if columns else None
+    document = await db.get(Document, document_id, options=options)
     
-    # Validate file
-    if not file.filename:
+    if not document:
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="No file provided"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Document not found"
         )
     
-    # Check file size
-    if file.size and file.size > settings.MAX_FILE_SIZE:
+    return document
+
+
+def _check_upload_allowed(file_type: Optional[str], file_size: Optional[int]) -> None:
+    """Reject uploads over the size limit or of unsupported types"""
+    if file_size and file_size > settings.MAX_FILE_SIZE:
         raise HTTPException(
             status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
             detail=f"File size exceeds maximum allowed size of {settings.MAX_FILE_SIZE} bytes"
         )
     
-    # Validate file type
-    file_type = file.content_type
     if file_type not in settings.ALLOWED_FILE_TYPES:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"File type {file_type} not supported. Allowed types: {', '.join(settings.ALLOWED_FILE_TYPES)}"
+            detail=f"File type {file_type} not supported. Allowed types: {ALLOWED_FILE_TYPES_DISPLAY}"
         )
-    
-    # Verify venture exists and user has access
+
+
+async def _check_venture_exists(db: AsyncSession, venture_id: uuid.UUID) -> None:
+    """Raise 404 unless the venture exists"""
     result = await db.execute(
-        select(Venture)
-        .where(Venture.id == venture_id)
+        lambda_stmt(lambda: select(Venture.id).where(Venture.id == venture_id))
     )
-    venture = result.scalar_one_or_none()
     
-    if not venture:
+    if result.scalar_one_or_none() is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Venture not found"
         )
     
     # TODO: Check if user has access to this venture (organization membership)
+
+
+def _require_object_storage() -> None:
+    """Raise 501 when presigned uploads are used without S3 configured"""
+    if not storage_service.enabled:
+        raise HTTPException(
+            status_code=status.HTTP_501_NOT_IMPLEMENTED,
+            detail="Object storage is not configured"
+        )
+
+
+@router.post("/upload", response_model=DocumentResponse)
+async def upload_document(
+    background_tasks: BackgroundTasks,
+    file: UploadFile = File(...),
+    venture_id: uuid.UUID = Form(...),
+    document_type: Optional[str] = Form(None),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+) -> Any:
+    """Upload and process a document"""
+    
+    # Validate file
+    if not file.filename:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="No file provided"
+        )
+    
+    # Check file size and type
+    file_type = file.content_type
+    _check_upload_allowed(file_type, file.size)
+    
+    # Verify venture exists and user has access
+    await _check_venture_exists(db, venture_id)
     
     try:
         # Create unique filename
@@ -149,30 +317,40 @@ async def upload_document(
         upload_dir = Path(settings.UPLOAD_DIR)
         upload_dir.mkdir(exist_ok=True)
         
-        # Save file
+        # Stream file to disk in chunks; file.size is advisory, so the
+        # size limit is enforced on the bytes actually received
         file_path = upload_dir / unique_filename
+        file_size = 0
         
-        with open(file_path, "wb") as buffer:
-            content = await file.read()
-            buffer.write(content)
+        async with aiofiles.open(file_path, "wb") as buffer:
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                file_size += len(chunk)
+                if file_size > settings.MAX_FILE_SIZE:
+                    raise HTTPException(
+                        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                        detail=f"File size exceeds maximum allowed size of {settings.MAX_FILE_SIZE} bytes"
+                    )
+                await buffer.write(chunk)
         
         # Create document record
-        document = Document(
-            venture_id=venture_id,
-            filename=unique_filename,
-            original_filename=file.filename,
-            file_type=file_type,
-            mime_type=file_type,
-            file_size=len(content),
-            storage_path=str(file_path),
-            processing_status='pending',
-            document_type=document_type,
-            virus_scan_status='pending'  # TODO: Implement virus scanning
+        result = await db.execute(
+            insert(Document)
+            .values(
+                venture_id=venture_id,
+                filename=unique_filename,
+                original_filename=file.filename,
+                file_type=file_type,
+                mime_type=file_type,
+                file_size=file_size,
+                storage_path=str(file_path),
+                processing_status='pending',
+                document_type=document_type,
+                virus_scan_status='pending'  # TODO: Implement virus scanning
+            )
+            .returning(Document)
         )
-        
-        db.add(document)
+        document = result.scalar_one()
         await db.commit()
-        await db.refresh(document)
         
         # Start background processing
         background_tasks.add_task(
@@ -180,21 +358,16 @@ async def upload_document(
             str(document.id),
             str(file_path),
             file_type,
-            db
+            document.document_type
         )
         
-        return DocumentResponse(
-            id=document.id,
-            venture_id=document.venture_id,
-            filename=document.filename,
-            original_filename=document.original_filename,
-            file_type=document.file_type,
-            file_size=document.file_size,
-            processing_status=document.processing_status,
-            document_type=document.document_type,
-            created_at=document.created_at
-        )
+        return DocumentResponse.model_validate(document)
         
+    except HTTPException:
+        if 'file_path' in locals() and file_path.exists():
+            file_path.unlink()
+        raise
+    
     except Exception as e:
         # Clean up file if document creation failed
         if 'file_path' in locals() and file_path.exists():
@@ -206,18 +379,117 @@ async def upload_document(
         )
 
 
-@router.get("/", response_model=List[DocumentResponse])
+@router.post("/upload/init", response_model=DocumentUploadTicket)
+async def init_document_upload(
+    upload_in: DocumentUploadInit,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+) -> Any:
+    """Issue a presigned URL the client uploads the file to directly"""
+    
+    _require_object_storage()
+    _check_upload_allowed(upload_in.content_type, upload_in.file_size)
+    await _check_venture_exists(db, upload_in.venture_id)
+    
+    file_extension = Path(upload_in.filename).suffix
+    storage_key = f"documents/{upload_in.venture_id}/{uuid.uuid4()}{file_extension}"
+    
+    return DocumentUploadTicket(
+        upload_url=storage_service.create_upload_url(storage_key, upload_in.content_type),
+        storage_key=storage_key,
+        expires_in=settings.S3_PRESIGNED_URL_EXPIRE_SECONDS
+    )
+
+
+@router.post("/upload/complete", response_model=DocumentResponse)
+async def complete_document_upload(
+    upload_in: DocumentUploadComplete,
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+) -> Any:
+    """Register a file uploaded via presigned URL and start processing"""
+    
+    _require_object_storage()
+    _check_upload_allowed(upload_in.content_type, None)
+    
+    # Keys are only ever issued under the venture's prefix
+    if not upload_in.storage_key.startswith(f"documents/{upload_in.venture_id}/"):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Storage key does not belong to this venture"
+        )
+    
+    await _check_venture_exists(db, upload_in.venture_id)
+    
+    # The client-reported size is not trusted; read it from the bucket
+    file_size = await storage_service.get_object_size(upload_in.storage_key)
+    if file_size is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Uploaded file not found"
+        )
+    
+    storage_path = storage_service.to_storage_path(upload_in.storage_key)
+    if file_size > settings.MAX_FILE_SIZE:
+        await storage_service.delete_object(storage_path)
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"File size exceeds maximum allowed size of {settings.MAX_FILE_SIZE} bytes"
+        )
+    
+    result = await db.execute(
+        insert(Document)
+        .values(
+            venture_id=upload_in.venture_id,
+            filename=Path(upload_in.storage_key).name,
+            original_filename=upload_in.filename,
+            file_type=upload_in.content_type,
+            mime_type=upload_in.content_type,
+            file_size=file_size,
+            storage_path=storage_path,
+            processing_status='pending',
+            document_type=upload_in.document_type,
+            virus_scan_status='pending'  # TODO: Implement virus scanning
+        )
+        .returning(Document)
+    )
+    document = result.scalar_one()
+    await db.commit()
+    
+    # Start background processing
+    background_tasks.add_task(
+        process_document_background,
+        str(document.id),
+        storage_path,
+        upload_in.content_type,
+        document.document_type
+    )
+    
+    return DocumentResponse.model_validate(document)
+
+
+@router.get("/", response_model=DocumentPage, response_model_exclude_none=True)
 async def list_documents(
-    venture_id: Optional[str] = None,
+    venture_id: Optional[uuid.UUID] = None,
     processing_status: Optional[str] = None,
-    skip: int = 0,
-    limit: int = 100,
+    before_created_at: Optional[datetime] = None,
+    before_id: Optional[uuid.UUID] = None,
+    limit: int = Query(50, ge=1, le=MAX_PAGE_SIZE),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ) -> Any:
-    """List documents with optional filtering"""
+    """List documents with optional filtering
+    
+    Newest first, paginated by keyset on (created_at, id): pass the
+    ``next_cursor`` values of one page as ``before_created_at``/``before_id``
+    to fetch the next.
+    """
+    
+    check_cursor(before_created_at, before_id)
     
-    query = select(Document)
+    # Only the summary columns; the JSONB analysis blobs are never loaded here
+    query = select(*DOCUMENT_LIST_COLUMNS)
     
     if venture_id:
         query = query.where(Document.venture_id == venture_id)
@@ -227,90 +499,70 @@ async def list_documents(
     
     # TODO: Filter by user's accessible ventures (organization membership)
     
-    query = query.offset(skip).limit(limit).order_by(Document.created_at.desc())
+    query = newest_first_page(
+        query, Document.created_at, Document.id, before_created_at, before_id, limit
+    )
     
     result = await db.execute(query)
-    documents = result.scalars().all()
-    
-    return [
-        DocumentResponse(
-            id=doc.id,
-            venture_id=doc.venture_id,
-            filename=doc.filename,
-            original_filename=doc.original_filename,
-            file_type=doc.file_type,
-            file_size=doc.file_size,
-            processing_status=doc.processing_status,
-            document_type=doc.document_type,
-            confidence_score=float(doc.confidence_score) if doc.confidence_score else None,
-            text_quality=float(doc.text_quality) if doc.text_quality else None,
-            created_at=doc.created_at,
-            processing_completed_at=doc.processing_completed_at
-        )
-        for doc in documents
-    ]
+    documents = result.all()
+    
+    return {
+        'data': [DocumentResponse.model_validate(doc) for doc in documents],
+        'next_cursor': next_cursor(documents, limit)
+    }
+
+
+def _document_etag(document: Document) -> str:
+    """Weak ETag for a document, from the columns that change when it's processed"""
+    started = document.processing_started_at.timestamp() if document.processing_started_at else 0
+    completed = document.processing_completed_at.timestamp() if document.processing_completed_at else 0
+    return f'W/"{document.id}-{document.processing_status}-{started:.6f}-{completed:.6f}"'
 
 
-@router.get("/{document_id}", response_model=DocumentResponse)
+@router.get("/{document_id}", response_model=DocumentResponse, response_model_exclude_none=True)
 async def get_document(
-    document_id: str,
+    document_id: uuid.UUID,
+    request: Request,
+    response: Response,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ) -> Any:
     """Get document details"""
     
-    result = await db.execute(
-        select(Document).where(Document.id == document_id)
-    )
-    document = result.scalar_one_or_none()
+    # TODO: Check if user has access to this document
     
-    if not document:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Document not found"
-        )
+    # The detail columns include everything the ETag is built from, so
+    # revalidation costs the same single query as a full response
+    document = await _get_document_or_404(db, document_id, *DOCUMENT_DETAIL_COLUMNS)
     
-    # TODO: Check if user has access to this document
+    etag = _document_etag(document)
+    not_modified_response = not_modified(request, etag, DOCUMENT_CACHE_CONTROL)
+    if not_modified_response:
+        return not_modified_response
     
-    return DocumentResponse(
-        id=document.id,
-        venture_id=document.venture_id,
-        filename=document.filename,
-        original_filename=document.original_filename,
-        file_type=document.file_type,
-        file_size=document.file_size,
-        processing_status=document.processing_status,
-        document_type=document.document_type,
-        confidence_score=float(document.confidence_score) if document.confidence_score else None,
-        text_quality=float(document.text_quality) if document.text_quality else None,
-        data_completeness=float(document.data_completeness) if document.data_completeness else None,
-        created_at=document.created_at,
-        processing_started_at=document.processing_started_at,
-        processing_completed_at=document.processing_completed_at,
-        processing_error=document.processing_error
-    )
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = DOCUMENT_CACHE_CONTROL
+    return DocumentResponse.model_validate(document)
 
 
 @router.get("/{document_id}/content")
 async def get_document_content(
-    document_id: str,
+    document_id: uuid.UUID,
+    request: Request,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ) -> Any:
     """Get extracted document content and analysis"""
     
-    result = await db.execute(
-        select(Document).where(Document.id == document_id)
-    )
-    document = result.scalar_one_or_none()
+    # TODO: Check if user has access to this document
     
-    if not document:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Document not found"
-        )
+    # Checked before loading the (potentially large) JSONB columns
+    etag = await _get_document_etag(db, document_id)
+    not_modified = _not_modified(request, etag)
+    if not_modified:
+        return not_modified
     
-    # TODO: Check if user has access to this document
+    document = await _get_document_or_404(db, document_id)
     
     if document.processing_status != 'completed':
         raise HTTPException(
@@ -318,89 +570,109 @@ async def get_document_content(
             detail=f"Document processing not completed. Status: {document.processing_status}"
         )
     
-    return {
-        'document_id': document.id,
-        'processing_status': document.processing_status,
-        'extracted_content': document.extracted_content,
-        'structured_data': document.structured_data,
-        'entities': document.entities,
-        'financial_data': document.financial_data,
-        'quality_metrics': {
-            'confidence_score': float(document.confidence_score) if document.confidence_score else None,
-            'text_quality': float(document.text_quality) if document.text_quality else None,
-            'data_completeness': float(document.data_completeness) if document.data_completeness else None
-        }
-    }
+    # JSONB blobs are already plain JSON, so skip the jsonable_encoder pass
+    return Response(
+        content=orjson.dumps({
+            'document_id': document.id,
+            'processing_status': document.processing_status,
+            'extracted_content': document.extracted_content,
+            'structured_data': document.structured_data,
+            'entities': document.entities,
+            'financial_data': document.financial_data,
+            'quality_metrics': {
+                'confidence_score': float(document.confidence_score) if document.confidence_score else None,
+                'text_quality': float(document.text_quality) if document.text_quality else None,
+                'data_completeness': float(document.data_completeness) if document.data_completeness else None
+            }
+        }, option=orjson.OPT_SERIALIZE_NUMPY),
+        media_type="application/json",
+        headers={"ETag": etag, "Cache-Control": DOCUMENT_CACHE_CONTROL}
+    )
 
 
 @router.get("/{document_id}/status")
 async def get_processing_status(
-    document_id: str,
+    document_id: uuid.UUID,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ) -> Any:
-    """Get document processing status"""
+    """Get document processing status
     
-    result = await db.execute(
-        select(Document.processing_status, Document.processing_started_at, 
-               Document.processing_completed_at, Document.processing_error)
-        .where(Document.id == document_id)
-    )
-    document_status = result.first()
+    Served from the Redis status cache written by the processing task while
+    it's fresh, so polling clients don't hit Postgres on every request.
+    """
     
-    if not document_status:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Document not found"
+    try:
+        cached = await redis_client.get(_status_cache_key(document_id))
+    except RedisError:
+        cached = None
+    
+    if cached:
+        cached_status = orjson.loads(cached)
+        processing_status = cached_status['status']
+        started_at = cached_status['started_at'] and datetime.fromisoformat(cached_status['started_at'])
+        completed_at = cached_status['completed_at'] and datetime.fromisoformat(cached_status['completed_at'])
+        error = cached_status['error']
+    else:
+        document_status = await _get_document_or_404(
+            db,
+            document_id,
+            Document.processing_status,
+            Document.processing_started_at,
+            Document.processing_completed_at,
+            Document.processing_error
         )
+        processing_status = document_status.processing_status
+        started_at = document_status.processing_started_at
+        completed_at = document_status.processing_completed_at
+        error = document_status.processing_error
     
     # Calculate processing time if applicable
     processing_time = None
-    if document_status.processing_started_at:
-        end_time = document_status.processing_completed_at or datetime.utcnow()
-        processing_time = (end_time - document_status.processing_started_at).total_seconds()
+    if started_at:
+        end_time = completed_at or datetime.utcnow()
+        processing_time = (end_time - started_at).total_seconds()
     
     return {
         'document_id': document_id,
-        'status': document_status.processing_status,
-        'started_at': document_status.processing_started_at,
-        'completed_at': document_status.processing_completed_at,
+        'status': processing_status,
+        'started_at': started_at,
+        'completed_at': completed_at,
         'processing_time_seconds': processing_time,
-        'error': document_status.processing_error
+        'error': error
     }
 
 
 @router.delete("/{document_id}")
 async def delete_document(
-    document_id: str,
+    document_id: uuid.UUID,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ) -> Any:
     """Delete a document"""
     
-    result = await db.execute(
-        select(Document).where(Document.id == document_id)
-    )
-    document = result.scalar_one_or_none()
-    
-    if not document:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Document not found"
-        )
+    document = await _get_document_or_404(db, document_id, Document.storage_path)
     
     # TODO: Check if user has permission to delete this document
     
     try:
         # Delete file from storage
-        file_path = Path(document.storage_path)
-        if file_path.exists():
-            file_path.unlink()
+        if storage_service.is_object_path(document.storage_path):
+            await storage_service.delete_object(document.storage_path)
+        else:
+            file_path = Path(document.storage_path)
+            if file_path.exists():
+                file_path.unlink()
         
         # Delete database record
         await db.delete(document)
         await db.commit()
         
+        try:
+            await redis_client.delete(_status_cache_key(document_id))
+        except RedisError:
+            pass
+        
         return {"message": "Document deleted successfully"}
         
     except Exception as e:
@@ -412,29 +684,26 @@ async def delete_document(
 
 @router.post("/{document_id}/reprocess")
 async def reprocess_document(
-    document_id: str,
+    document_id: uuid.UUID,
     background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ) -> Any:
     """Reprocess a document"""
     
-    result = await db.execute(
-        select(Document).where(Document.id == document_id)
+    document = await _get_document_or_404(
+        db, document_id, Document.storage_path, Document.file_type, Document.document_type
     )
-    document = result.scalar_one_or_none()
-    
-    if not document:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Document not found"
-        )
     
     # TODO: Check if user has permission to reprocess this document
     
     # Check if file still exists
-    file_path = Path(document.storage_path)
-    if not file_path.exists():
+    if storage_service.is_object_path(document.storage_path):
+        file_exists = await storage_service.object_exists(document.storage_path)
+    else:
+        file_exists = Path(document.storage_path).exists()
+    
+    if not file_exists:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Original file no longer exists"
@@ -456,14 +725,15 @@ async def reprocess_document(
         )
     )
     await db.commit()
+    await _cache_document_status(document_id, 'pending')
     
     # Start background processing
     background_tasks.add_task(
         process_document_background,
-        document_id,
-        str(file_path),
+        str(document_id),
+        document.storage_path,
         document.file_type,
-        db
+        document.document_type
     )
     
     return {"message": "Document reprocessing started"}
@@ -471,25 +741,29 @@ async def reprocess_document(
 
 @router.get("/{document_id}/download")
 async def download_document(
-    document_id: str,
+    document_id: uuid.UUID,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ) -> Any:
     """Download original document file"""
     
-    result = await db.execute(
-        select(Document).where(Document.id == document_id)
+    document = await _get_document_or_404(
+        db, document_id, Document.storage_path, Document.original_filename, Document.file_type
     )
-    document = result.scalar_one_or_none()
-    
-    if not document:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Document not found"
-        )
     
     # TODO: Check if user has access to this document
     
+    # Object-stored files are served by the bucket, not through the API
+    if storage_service.is_object_path(document.storage_path):
+        return RedirectResponse(
+            storage_service.create_download_url(
+                document.storage_path,
+                document.original_filename,
+                document.file_type
+            ),
+            status_code=status.HTTP_307_TEMPORARY_REDIRECT
+        )
+    
     file_path = Path(document.storage_path)
     if not file_path.exists():
         raise HTTPException(
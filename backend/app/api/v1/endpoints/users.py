@@ -2,9 +2,11 @@
 User management endpoints
 """
 
+import uuid
 from typing import Any, List
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import update
 
 from app.core.database import get_db
 from app.core.deps import get_current_active_user, get_current_superuser
@@ -30,15 +32,22 @@ async def update_user_me(
 ) -> Any:
     """Update current user profile"""
     
-    # Update user fields
-    update_data = user_in.dict(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(current_user, field, value)
+    update_data = user_in.model_dump(exclude_unset=True)
+    if not update_data:
+        return current_user
     
+    # Update and read back the row in one statement
+    result = await db.execute(
+        update(User)
+        .where(User.id == current_user.id)
+        .values(**update_data)
+        .returning(User)
+        .execution_options(synchronize_session=False, populate_existing=True)
+    )
+    user = result.scalar_one()
     await db.commit()
-    await db.refresh(current_user)
     
-    return current_user
+    return user
 
 
 @router.get("/", response_model=List[UserSchema])
@@ -55,7 +64,7 @@ async def read_users(
 
 @router.get("/{user_id}", response_model=UserSchema)
 async def read_user(
-    user_id: str,
+    user_id: uuid.UUID,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ) -> Any:
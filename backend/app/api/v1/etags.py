@@ -0,0 +1,45 @@
+"""
+ETag revalidation helpers
+"""
+
+import re
+from typing import Optional
+
+from fastapi import Request, Response, status
+
+# One entity-tag of an If-None-Match list; quoted, so commas inside one don't split it
+ENTITY_TAG_RE = re.compile(r'(?:W/)?"[^"]*"')
+
+
+def _opaque_tag(etag: str) -> str:
+    """An entity-tag without its weak prefix, for weak comparison"""
+    return etag[2:] if etag.startswith("W/") else etag
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Whether an If-None-Match header matches ``etag``
+    
+    The header is ``*`` or a comma-separated list of entity-tags; they are
+    compared weakly, as RFC 9110 requires for If-None-Match.
+    """
+    if not if_none_match:
+        return False
+    
+    if if_none_match.strip() == "*":
+        return True
+    
+    opaque = _opaque_tag(etag)
+    return any(
+        _opaque_tag(candidate) == opaque
+        for candidate in ENTITY_TAG_RE.findall(if_none_match)
+    )
+
+
+def not_modified(request: Request, etag: str, cache_control: str) -> Optional[Response]:
+    """304 response if the client already holds this version"""
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers={"ETag": etag, "Cache-Control": cache_control}
+        )
+    return None
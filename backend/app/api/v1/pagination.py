@@ -0,0 +1,51 @@
+"""
+Keyset pagination helpers for list endpoints
+"""
+
+from datetime import datetime
+from typing import Any, Optional
+
+from fastapi import HTTPException, status
+from sqlalchemy import tuple_
+
+
+def check_cursor(before_created_at: Optional[datetime], before_id: Optional[Any]) -> None:
+    """Reject a cursor with only one half given
+    
+    Ignoring half of one would serve page 1 again.
+    """
+    if (before_created_at is None) != (before_id is None):
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="before_created_at and before_id must be given together"
+        )
+
+
+def newest_first_page(
+    query: Any,
+    created_at_column: Any,
+    id_column: Any,
+    before_created_at: Optional[datetime],
+    before_id: Optional[Any],
+    limit: int
+) -> Any:
+    """Order newest first on (created_at, id) and keep one page past the cursor
+    
+    The id breaks ties between rows created at the same instant, so paging
+    neither skips nor repeats them.
+    """
+    if before_created_at is not None:
+        query = query.where(
+            tuple_(created_at_column, id_column) < (before_created_at, before_id)
+        )
+    
+    return query.order_by(created_at_column.desc(), id_column.desc()).limit(limit)
+
+
+def next_cursor(rows: list, limit: int) -> Optional[dict]:
+    """Cursor past the last row of a full page; None once a page comes up short"""
+    if len(rows) < limit:
+        return None
+    
+    last = rows[-1]
+    return {'before_created_at': last.created_at, 'before_id': last.id}
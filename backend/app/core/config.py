@@ -2,9 +2,10 @@
 Application configuration settings
 """
 
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import Field, validator
-from typing import List, Optional
+from functools import lru_cache
+from typing import FrozenSet, Optional
 import os
 
 
@@ -19,8 +20,8 @@ class Settings(BaseSettings):
     
     # API
     API_V1_STR: str = "/v1"
-    ALLOWED_HOSTS: List[str] = Field(
-        default=["localhost", "127.0.0.1", "0.0.0.0"],
+    ALLOWED_HOSTS: FrozenSet[str] = Field(
+        default=frozenset({"localhost", "127.0.0.1", "0.0.0.0"}),
         env="ALLOWED_HOSTS"
     )
     
@@ -52,7 +53,13 @@ class Settings(BaseSettings):
     # File upload
     MAX_FILE_SIZE: int = 50 * 1024 * 1024  # 50MB
     UPLOAD_DIR: str = "uploads"
-    ALLOWED_FILE_TYPES: List[str] = [
+    # Worker processes for document parsing; defaults to the CPU count
+    DOCUMENT_PROCESSING_WORKERS: Optional[int] = Field(default=None, env="DOCUMENT_PROCESSING_WORKERS")
+    # A PDF page slower than this to read skips table/image extraction; pages
+    # not reached before the document deadline are left empty
+    PDF_PAGE_TIMEOUT_SECONDS: float = 2.0
+    PDF_DOCUMENT_TIMEOUT_SECONDS: float = 120.0
+    ALLOWED_FILE_TYPES: FrozenSet[str] = frozenset({
         "application/pdf",
         "application/vnd.ms-powerpoint",
         "application/vnd.openxmlformats-officedocument.presentationml.presentation",
@@ -60,7 +67,7 @@ class Settings(BaseSettings):
         "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
         "application/msword",
         "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
-    ]
+    })
     
     # Object Storage (S3/MinIO)
     S3_ENDPOINT: Optional[str] = Field(default=None, env="S3_ENDPOINT")
@@ -68,6 +75,7 @@ class Settings(BaseSettings):
     S3_SECRET_KEY: Optional[str] = Field(default=None, env="S3_SECRET_KEY")
     S3_BUCKET_NAME: str = Field(default="ai-investment-docs", env="S3_BUCKET_NAME")
     S3_REGION: str = Field(default="us-east-1", env="S3_REGION")
+    S3_PRESIGNED_URL_EXPIRE_SECONDS: int = 900
     
     # Elasticsearch
     ELASTICSEARCH_URL: str = Field(
@@ -85,6 +93,9 @@ class Settings(BaseSettings):
     # AI/ML settings
     HUGGINGFACE_API_KEY: Optional[str] = Field(default=None, env="HUGGINGFACE_API_KEY")
     MODEL_CACHE_DIR: str = Field(default="./models", env="MODEL_CACHE_DIR")
+    # Threads for NLP analysis, and worker processes for batch analysis;
+    # defaults to the CPU count
+    NLP_WORKERS: Optional[int] = Field(default=None, env="NLP_WORKERS")
     
     # External APIs
     YAHOO_FINANCE_API_KEY: Optional[str] = Field(default=None, env="YAHOO_FINANCE_API_KEY")
@@ -102,7 +113,7 @@ class Settings(BaseSettings):
     @validator("ALLOWED_HOSTS", pre=True)
     def parse_allowed_hosts(cls, v):
         if isinstance(v, str):
-            return [host.strip() for host in v.split(",")]
+            return frozenset(host.strip() for host in v.split(","))
         return v
     
     @validator("ENVIRONMENT")
@@ -112,10 +123,18 @@ class Settings(BaseSettings):
             raise ValueError(f"Environment must be one of: {allowed}")
         return v
     
-    class Config:
-        env_file = ".env"
-        case_sensitive = True
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        case_sensitive=True,
+        frozen=True
+    )
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide settings, reading the environment once"""
+    return Settings()
 
 
 # Create settings instance
-settings = Settings()
+settings = get_settings()
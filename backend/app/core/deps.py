@@ -2,43 +2,80 @@
 Dependency injection for FastAPI endpoints
 """
 
+from functools import lru_cache
 from typing import Generator, Optional
+import uuid
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import bindparam, inspect, select
 
 from app.core.database import get_db
-from app.core.security import verify_token
+from app.core.security import verify_token_async
 from app.models.user import User
 from app.models.organization import Organization
 
 # Security scheme
 security = HTTPBearer()
 
+# Lookups run on nearly every request; built once and executed with params
+_USER_BY_ID = select(User).where(User.id == bindparam("user_id"))
+_ORGANIZATION_ID_BY_ID = select(Organization.id).where(
+    Organization.id == bindparam("organization_id")
+)
+
+
+@lru_cache(maxsize=1)
+def _user_organization_membership():
+    """Select a user's row in the User.organizations association table
+    
+    The table and its columns come from the relationship rather than by
+    name. Built on first use, once every model is imported and the mappers
+    can be configured.
+    """
+    organizations = inspect(User).relationships["organizations"]
+    ((_, user_column),) = organizations.synchronize_pairs
+    ((_, organization_column),) = organizations.secondary_synchronize_pairs
+    return select(organization_column).where(
+        user_column == bindparam("user_id"),
+        organization_column == bindparam("organization_id")
+    )
+
+
+async def _load_user(db: AsyncSession, user_id: str) -> Optional[User]:
+    """Load a user fresh on every request
+    
+    Only the token decode is cached (in verify_token); the row is not, so a
+    deactivation, role change or deletion applies to the next request.
+    """
+    result = await db.execute(_USER_BY_ID, {"user_id": user_id})
+    return result.scalar_one_or_none()
+
+
+def _credentials_exception() -> HTTPException:
+    """401 for a missing, invalid or orphaned token; built only on failure"""
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Could not validate credentials",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
 
 async def get_current_user(
     db: AsyncSession = Depends(get_db),
     credentials: HTTPAuthorizationCredentials = Depends(security)
 ) -> User:
     """Get current authenticated user"""
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
-    
     # Verify token
-    user_id = verify_token(credentials.credentials)
+    user_id = await verify_token_async(credentials.credentials)
     if user_id is None:
-        raise credentials_exception
+        raise _credentials_exception()
     
     # Get user from database
-    result = await db.execute(select(User).where(User.id == user_id))
-    user = result.scalar_one_or_none()
+    user = await _load_user(db, user_id)
     
     if user is None:
-        raise credentials_exception
+        raise _credentials_exception()
     
     if not user.is_active:
         raise HTTPException(
@@ -52,12 +89,10 @@ async def get_current_user(
 async def get_current_active_user(
     current_user: User = Depends(get_current_user)
 ) -> User:
-    """Get current active user"""
-    if not current_user.is_active:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Inactive user"
-        )
+    """Get current active user
+    
+    get_current_user already rejects inactive users.
+    """
     return current_user
 
 
@@ -74,35 +109,47 @@ async def get_current_superuser(
 
 
 async def get_current_organization(
-    organization_id: str,
+    organization_id: uuid.UUID,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ) -> Organization:
     """Get current organization and verify user access"""
-    # Get organization
+    # Membership is checked on the association table, not cached, so
+    # removing a member takes effect at once; the row is only loaded for
+    # members
     result = await db.execute(
-        select(Organization).where(Organization.id == organization_id)
+        _user_organization_membership(),
+        {"user_id": current_user.id, "organization_id": organization_id}
     )
-    organization = result.scalar_one_or_none()
+    if result.first() is not None:
+        organization = await db.get(Organization, organization_id)
+        if organization is not None:
+            return organization
     
-    if not organization:
+    # Not a member: only distinguish missing from forbidden
+    result = await db.execute(
+        _ORGANIZATION_ID_BY_ID, {"organization_id": organization_id}
+    )
+    
+    if result.scalar_one_or_none() is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Organization not found"
         )
     
-    # Check if user belongs to organization
-    if organization not in current_user.organizations:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not enough permissions"
-        )
-    
-    return organization
+    raise HTTPException(
+        status_code=status.HTTP_403_FORBIDDEN,
+        detail="Not enough permissions"
+    )
 
 
+@lru_cache(maxsize=64)
 def require_permissions(*required_permissions: str):
-    """Dependency factory for permission-based access control"""
+    """Dependency factory for permission-based access control
+    
+    Memoized so equal permission sets share one callable, which lets FastAPI's
+    per-request dependency cache resolve each guard once.
+    """
     
     async def check_permissions(
         current_user: User = Depends(get_current_active_user)
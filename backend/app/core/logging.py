@@ -3,6 +3,7 @@ Structured logging configuration
 """
 
 import logging
+import orjson
 import structlog
 from typing import Any, Dict
 import sys
@@ -10,6 +11,11 @@ import sys
 from app.core.config import settings
 
 
+def _orjson_dumps(value: Any, **kwargs: Any) -> str:
+    """JSON serializer for structlog; the stdlib logger factory needs str"""
+    return orjson.dumps(value, **kwargs).decode()
+
+
 def setup_logging() -> None:
     """Configure structured logging for the application"""
     
@@ -24,7 +30,7 @@ def setup_logging() -> None:
             structlog.processors.StackInfoRenderer(),
             structlog.processors.format_exc_info,
             structlog.processors.UnicodeDecoder(),
-            structlog.processors.JSONRenderer() if settings.ENVIRONMENT == "production" 
+            structlog.processors.JSONRenderer(serializer=_orjson_dumps) if settings.ENVIRONMENT == "production" 
             else structlog.dev.ConsoleRenderer(colors=True)
         ],
         context_class=dict,
@@ -54,9 +60,13 @@ def get_logger(name: str) -> structlog.BoundLogger:
 
 
 class LoggerMixin:
-    """Mixin to add logging capabilities to classes"""
+    """Mixin to add logging capabilities to classes
+    
+    Each subclass gets its logger once, as a class attribute.
+    """
+    
+    logger: structlog.BoundLogger
     
-    @property
-    def logger(self) -> structlog.BoundLogger:
-        """Get logger instance for this class"""
-        return get_logger(self.__class__.__name__)
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls.logger = get_logger(cls.__name__)
@@ -0,0 +1,19 @@
+"""
+Redis client configuration
+"""
+
+from redis.asyncio import Redis
+import logging
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Shared async client; connections are pooled and opened on first use
+redis_client: Redis = Redis.from_url(settings.REDIS_URL)
+
+
+async def close_redis() -> None:
+    """Close Redis connections"""
+    await redis_client.aclose()
+    logger.info("Redis connections closed")
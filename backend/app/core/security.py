@@ -3,17 +3,32 @@ Security utilities for authentication and authorization
 """
 
 from datetime import datetime, timedelta
-from typing import Any, Union, Optional
+from typing import Any, Dict, Tuple, Union, Optional
+from fastapi.concurrency import run_in_threadpool
 from jose import jwt, JWTError
 from passlib.context import CryptContext
+import hashlib
 import secrets
 import string
+import time
 
 from app.core.config import settings
 
 # Password hashing context
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# Recently verified JWT claims, keyed by SHA-256 of the token
+TOKEN_CACHE_TTL_SECONDS = 5
+TOKEN_CACHE_MAX_ENTRIES = 10_000
+_token_cache: Dict[bytes, Tuple[float, dict]] = {}
+
+# Characters that satisfy the special-character password rule
+PASSWORD_SPECIAL_CHARACTERS = frozenset("!@#$%^&*()_+-=[]{}|;:,.<>?")
+
+# Hash verified against when no user matches, so unknown emails cost the same
+# bcrypt work as known ones and response timing doesn't reveal which exist
+DUMMY_PASSWORD_HASH = pwd_context.hash(secrets.token_urlsafe(12))
+
 
 def create_access_token(
     subject: Union[str, Any], 
@@ -63,33 +78,93 @@ def create_refresh_token(subject: Union[str, Any]) -> str:
     return encoded_jwt
 
 
+def _get_cached_payload(token: str) -> Optional[dict]:
+    """Claims of a recently verified token, or None if not cached"""
+    key = hashlib.sha256(token.encode()).digest()
+    
+    cached = _token_cache.get(key)
+    if cached is not None:
+        expires_at, payload = cached
+        if expires_at > time.time():
+            return payload
+        _token_cache.pop(key, None)
+    
+    return None
+
+
+def _decode_token(token: str) -> dict:
+    """Decode and verify a JWT, reusing recently verified claims
+
+    Entries are keyed by the token's SHA-256 digest so raw tokens are never
+    kept in memory, and never outlive the token's own ``exp`` claim.
+    """
+    payload = _get_cached_payload(token)
+    if payload is not None:
+        return payload
+    
+    key = hashlib.sha256(token.encode()).digest()
+    now = time.time()
+    payload = jwt.decode(
+        token,
+        settings.JWT_SECRET_KEY,
+        algorithms=[settings.JWT_ALGORITHM]
+    )
+    
+    if len(_token_cache) >= TOKEN_CACHE_MAX_ENTRIES:
+        # Drop expired entries first; if that frees nothing, start over
+        for stale_key in [k for k, (exp, _) in _token_cache.items() if exp <= now]:
+            del _token_cache[stale_key]
+        if len(_token_cache) >= TOKEN_CACHE_MAX_ENTRIES:
+            _token_cache.clear()
+    
+    expires_at = now + TOKEN_CACHE_TTL_SECONDS
+    token_exp = payload.get("exp")
+    if isinstance(token_exp, (int, float)):
+        expires_at = min(expires_at, token_exp)
+    _token_cache[key] = (expires_at, payload)
+    
+    return payload
+
+
+def _get_subject(payload: dict, token_type: str) -> Optional[str]:
+    """Subject of a decoded token, if it is of the expected type"""
+    # Check token type
+    if payload.get("type") != token_type:
+        return None
+    
+    # Get subject (user ID)
+    return payload.get("sub")
+
+
 def verify_token(token: str, token_type: str = "access") -> Optional[str]:
     """Verify JWT token and return subject"""
     try:
-        payload = jwt.decode(
-            token,
-            settings.JWT_SECRET_KEY,
-            algorithms=[settings.JWT_ALGORITHM]
-        )
-        
-        # Check token type
-        if payload.get("type") != token_type:
-            return None
-            
-        # Get subject (user ID)
-        subject: str = payload.get("sub")
-        if subject is None:
-            return None
-            
-        return subject
-        
+        return _get_subject(_decode_token(token), token_type)
     except JWTError:
         return None
 
 
+async def verify_token_async(token: str, token_type: str = "access") -> Optional[str]:
+    """Verify JWT token and return subject, without blocking the event loop
+    
+    Cached tokens are answered inline; signature verification for new ones
+    runs in the threadpool.
+    """
+    payload = _get_cached_payload(token)
+    if payload is not None:
+        return _get_subject(payload, token_type)
+    
+    return await run_in_threadpool(verify_token, token, token_type)
+
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verify a password against its hash"""
-    return pwd_context.verify(plain_password, hashed_password)
+    """Verify a password against its hash
+
+    passlib's bcrypt handler compares digests in constant time, so the only
+    timing signal left is whether bcrypt ran at all. Pass
+    ``DUMMY_PASSWORD_HASH`` when there is no stored hash to keep that uniform.
+    """
+    return pwd_context.verify(plain_password, hashed_password or DUMMY_PASSWORD_HASH)
 
 
 def get_password_hash(password: str) -> str:
@@ -144,16 +219,28 @@ def validate_password_strength(password: str) -> tuple[bool, list[str]]:
     if len(password) < settings.PASSWORD_MIN_LENGTH:
         errors.append(f"Password must be at least {settings.PASSWORD_MIN_LENGTH} characters long")
     
-    if not any(c.isupper() for c in password):
+    # Classify every character in one pass instead of rescanning per rule
+    has_upper = has_lower = has_digit = has_special = False
+    for c in password:
+        if c.isupper():
+            has_upper = True
+        elif c.islower():
+            has_lower = True
+        elif c.isdigit():
+            has_digit = True
+        elif c in PASSWORD_SPECIAL_CHARACTERS:
+            has_special = True
+    
+    if not has_upper:
         errors.append("Password must contain at least one uppercase letter")
     
-    if not any(c.islower() for c in password):
+    if not has_lower:
         errors.append("Password must contain at least one lowercase letter")
     
-    if not any(c.isdigit() for c in password):
+    if not has_digit:
         errors.append("Password must contain at least one digit")
     
-    if not any(c in "!@#$%^&*()_+-=[]{}|;:,.<>?" for c in password):
+    if not has_special:
         errors.append("Password must contain at least one special character")
     
     return len(errors) == 0, errors
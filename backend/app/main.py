@@ -2,18 +2,27 @@
 AI Investment Evaluation System - Main FastAPI Application
 """
 
-from fastapi import FastAPI, Request
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.middleware.trustedhost import TrustedHostMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.exception_handlers import http_exception_handler
+from fastapi.responses import ORJSONResponse, PlainTextResponse, RedirectResponse
+from starlette.datastructures import URL, Headers
+from starlette.exceptions import HTTPException as StarletteHTTPException
+from starlette.types import ASGIApp, Receive, Scope, Send
 from contextlib import asynccontextmanager
+from typing import Dict, FrozenSet
+import asyncio
+import re
 import time
 import logging
+import orjson
 
 from app.core.config import settings
 from app.core.database import init_db
+from app.core.redis import close_redis
 from app.api.v1.api import api_router
 from app.core.logging import setup_logging
+from app.services.nlp_processor import get_nlp_processor
 
 # Setup logging
 setup_logging()
@@ -27,11 +36,15 @@ async def lifespan(app: FastAPI):
     logger.info("Starting AI Investment Evaluation System...")
     await init_db()
     logger.info("Database initialized successfully")
+    # Load the NLP model now rather than on the first document; already
+    # loaded when the Gunicorn master preloaded it before forking
+    await asyncio.to_thread(get_nlp_processor)
     
     yield
     
     # Shutdown
     logger.info("Shutting down AI Investment Evaluation System...")
+    await close_redis()
 
 
 # Create FastAPI application
@@ -41,67 +54,140 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs" if settings.ENVIRONMENT == "development" else None,
     redoc_url="/redoc" if settings.ENVIRONMENT == "development" else None,
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
+# ALLOWED_HOSTS doubles as the CORS origin list
+ALLOW_ANY_HOST = "*" in settings.ALLOWED_HOSTS
+
 # Security middleware
+# Explicit origins are matched with one regex rather than a list scan; a bare
+# "*" keeps Starlette's allow-all fast path
+if ALLOW_ANY_HOST:
+    CORS_ALLOW_ORIGINS, CORS_ORIGIN_REGEX = ["*"], None
+else:
+    CORS_ALLOW_ORIGINS = []
+    CORS_ORIGIN_REGEX = "|".join(re.escape(origin) for origin in sorted(settings.ALLOWED_HOSTS))
+
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=settings.ALLOWED_HOSTS,
+    allow_origins=CORS_ALLOW_ORIGINS,
+    allow_origin_regex=CORS_ORIGIN_REGEX,
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "DELETE", "PATCH"],
     allow_headers=["*"],
 )
 
-app.add_middleware(
-    TrustedHostMiddleware,
-    allowed_hosts=settings.ALLOWED_HOSTS
-)
+class TrustedHostCheckMiddleware:
+    """Starlette's TrustedHostMiddleware with a set lookup for exact hosts
+    
+    "*.domain" entries share one regex. Same matching rules and www redirect
+    as the original, and likewise a pure ASGI middleware.
+    """
+    
+    def __init__(self, app: ASGIApp, allowed_hosts: FrozenSet[str], www_redirect: bool = True) -> None:
+        self.app = app
+        self.allow_any = "*" in allowed_hosts
+        self.www_redirect = www_redirect
+        self.exact_hosts = frozenset(host for host in allowed_hosts if "*" not in host)
+        self.wildcard_hosts_re = re.compile("|".join(
+            ".*" + re.escape(host[1:])
+            for host in allowed_hosts
+            if host.startswith("*") and host != "*"
+        ) or r"(?!)")
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if self.allow_any or scope["type"] not in ("http", "websocket"):
+            await self.app(scope, receive, send)
+            return
+        
+        host = Headers(scope=scope).get("host", "").split(":")[0]
+        if host in self.exact_hosts or self.wildcard_hosts_re.fullmatch(host):
+            await self.app(scope, receive, send)
+            return
+        
+        if self.www_redirect and "www." + host in self.exact_hosts:
+            url = URL(scope=scope)
+            response = RedirectResponse(url=str(url.replace(netloc="www." + url.netloc)))
+        else:
+            response = PlainTextResponse("Invalid host header", status_code=400)
+        await response(scope, receive, send)
+
+
+app.add_middleware(TrustedHostCheckMiddleware, allowed_hosts=settings.ALLOWED_HOSTS)
 
 
 # Request timing middleware
 @app.middleware("http")
 async def add_process_time_header(request: Request, call_next):
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
     response = await call_next(request)
-    process_time = time.time() - start_time
-    response.headers["X-Process-Time"] = str(process_time)
+    response.headers["X-Process-Time"] = "%.6f" % ((time.perf_counter_ns() - start_ns) / 1e9)
     return response
 
 
+# Static endpoint bodies; they only depend on settings fixed at startup
+HEALTH_BODY = orjson.dumps({
+    "status": "healthy",
+    "service": "ai-investment-evaluation",
+    "version": "1.0.0",
+    "environment": settings.ENVIRONMENT
+})
+
+ROOT_BODY = orjson.dumps({
+    "message": "AI Investment Evaluation System API",
+    "version": "1.0.0",
+    "docs": "/docs" if settings.ENVIRONMENT == "development" else "Contact administrator",
+    "health": "/health"
+})
+
+
 # Health check endpoint
 @app.get("/health")
 async def health_check():
     """Health check endpoint for load balancers and monitoring"""
-    return {
-        "status": "healthy",
-        "service": "ai-investment-evaluation",
-        "version": "1.0.0",
-        "environment": settings.ENVIRONMENT
-    }
+    return Response(content=HEALTH_BODY, media_type="application/json")
 
 
 # Root endpoint
 @app.get("/")
 async def root():
     """Root endpoint with API information"""
-    return {
-        "message": "AI Investment Evaluation System API",
-        "version": "1.0.0",
-        "docs": "/docs" if settings.ENVIRONMENT == "development" else "Contact administrator",
-        "health": "/health"
-    }
+    return Response(content=ROOT_BODY, media_type="application/json")
 
 
 # Include API routes
 app.include_router(api_router, prefix="/v1")
 
 
+# Full tracebacks are logged at most once per exception type per window, so
+# an error storm doesn't spend its time formatting the same stack
+TRACEBACK_LOG_INTERVAL_SECONDS = 60
+_traceback_logged_at: Dict[type, float] = {}
+
+
+def _should_log_traceback(exc: Exception) -> bool:
+    """Whether this exception type's traceback hasn't been logged recently"""
+    now = time.monotonic()
+    logged_at = _traceback_logged_at.get(type(exc))
+    if logged_at is not None and now - logged_at < TRACEBACK_LOG_INTERVAL_SECONDS:
+        return False
+    _traceback_logged_at[type(exc)] = now
+    return True
+
+
 # Global exception handler
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
-    logger.error(f"Global exception handler caught: {exc}", exc_info=True)
-    return JSONResponse(
+    if isinstance(exc, StarletteHTTPException):
+        return await http_exception_handler(request, exc)
+    
+    if _should_log_traceback(exc):
+        logger.error(f"Global exception handler caught: {exc}", exc_info=True)
+    else:
+        logger.error(f"Global exception handler caught: {exc} (traceback suppressed, logged recently)")
+    return ORJSONResponse(
         status_code=500,
         content={
             "detail": "Internal server error",
@@ -116,5 +202,7 @@ if __name__ == "__main__":
         "app.main:app",
         host="0.0.0.0",
         port=8000,
+        loop="uvloop",
+        http="httptools",
         reload=True if settings.ENVIRONMENT == "development" else False
     )
@@ -2,7 +2,7 @@
 Authentication schemas
 """
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, EmailStr, Field
 from typing import Optional
 from datetime import datetime
 import uuid
@@ -39,6 +39,8 @@ class UserCreate(BaseModel):
 
 class UserResponse(BaseModel):
     """User response schema"""
+    model_config = ConfigDict(from_attributes=True)
+    
     id: uuid.UUID
     email: str
     first_name: str
@@ -46,9 +48,6 @@ class UserResponse(BaseModel):
     is_active: bool
     is_verified: bool
     created_at: datetime
-    
-    class Config:
-        from_attributes = True
 
 
 class PasswordReset(BaseModel):
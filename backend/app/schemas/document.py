@@ -2,8 +2,8 @@
 Document schemas for API requests and responses
 """
 
-from pydantic import BaseModel, Field
-from typing import Optional, Dict, Any
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Optional, Dict, Any, List
 from datetime import datetime
 import uuid
 
@@ -22,6 +22,30 @@ class DocumentCreate(BaseModel):
     document_type: Optional[str] = None
 
 
+class DocumentUploadInit(BaseModel):
+    """Request for a presigned upload URL"""
+    venture_id: uuid.UUID
+    filename: str = Field(..., min_length=1, max_length=255)
+    content_type: str
+    file_size: int = Field(..., gt=0)
+
+
+class DocumentUploadTicket(BaseModel):
+    """Presigned upload URL and the storage key to complete the upload with"""
+    upload_url: str
+    storage_key: str
+    expires_in: int
+
+
+class DocumentUploadComplete(BaseModel):
+    """Notification that a presigned upload has finished"""
+    venture_id: uuid.UUID
+    storage_key: str
+    filename: str = Field(..., min_length=1, max_length=255)
+    content_type: str
+    document_type: Optional[str] = None
+
+
 class DocumentUpdate(BaseModel):
     """Document update schema"""
     document_type: Optional[str] = None
@@ -29,6 +53,8 @@ class DocumentUpdate(BaseModel):
 
 class DocumentResponse(BaseModel):
     """Document response schema"""
+    model_config = ConfigDict(from_attributes=True)
+    
     id: uuid.UUID
     venture_id: uuid.UUID
     filename: str
@@ -44,9 +70,18 @@ class DocumentResponse(BaseModel):
     processing_started_at: Optional[datetime] = None
     processing_completed_at: Optional[datetime] = None
     processing_error: Optional[str] = None
-    
-    class Config:
-        from_attributes = True
+
+
+class DocumentCursor(BaseModel):
+    """Keyset cursor pointing past the last document of a page"""
+    before_created_at: datetime
+    before_id: uuid.UUID
+
+
+class DocumentPage(BaseModel):
+    """Page of documents with the cursor for the next page"""
+    data: List[DocumentResponse]
+    next_cursor: Optional[DocumentCursor] = None
 
 
 class DocumentContent(BaseModel):
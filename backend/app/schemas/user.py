@@ -2,7 +2,7 @@
 User schemas
 """
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, EmailStr, Field
 from typing import Optional, Dict, Any
 from datetime import datetime
 import uuid
@@ -36,6 +36,8 @@ class UserUpdate(BaseModel):
 
 class UserInDB(UserBase):
     """User in database schema"""
+    model_config = ConfigDict(from_attributes=True)
+    
     id: uuid.UUID
     password_hash: str
     is_verified: bool
@@ -43,19 +45,15 @@ class UserInDB(UserBase):
     mfa_enabled: bool
     created_at: datetime
     updated_at: datetime
-    
-    class Config:
-        from_attributes = True
 
 
 class User(UserBase):
     """User public schema"""
+    model_config = ConfigDict(from_attributes=True)
+    
     id: uuid.UUID
     is_verified: bool
     created_at: datetime
-    
-    class Config:
-        from_attributes = True
 
 
 class UserProfile(User):
@@ -66,6 +64,3 @@ class UserProfile(User):
     language: str
     preferences: Dict[str, Any]
     last_login: Optional[datetime] = None
-    
-    class Config:
-        from_attributes = True
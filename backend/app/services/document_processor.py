@@ -3,25 +3,397 @@ Document processing service for extracting content from various file formats
 """
 
 import asyncio
+import bisect
 import logging
+import math
 import mimetypes
-from pathlib import Path
-from typing import Dict, Any, Optional, List
-from datetime import datetime
+import multiprocessing
+import os
+import re
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from types import MappingProxyType
+from typing import Dict, Any, ClassVar, Literal, Mapping, Optional, List, Tuple
+from datetime import datetime, timezone
 import uuid
 
-import fitz  # PyMuPDF
-from pptx import Presentation
-import openpyxl
-from docx import Document as DocxDocument
-from PIL import Image
-import io
+import numpy as np
 
 from app.core.config import settings
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# The parsers (PyMuPDF, python-pptx, openpyxl, python-docx) are imported inside
+# the functions that use them. Parsing runs in worker processes, so the API
+# process never loads them, and a worker only loads the ones it needs.
+
+# "full" keeps each page/slide/sheet/paragraph's text in the result;
+# "summary" keeps only their counts, for callers that just need full_text
+DetailLevel = Literal["full", "summary"]
+
+# PDF pages are extracted in worker processes, in shards of at least this size
+PDF_PAGES_PER_SHARD = 20
+
+# Table detection only runs on pages with at least this many text rows that
+# are split into several horizontally separate cells
+PDF_TABLE_MIN_GRID_ROWS = 3
+
+_process_pool: Optional[ProcessPoolExecutor] = None
+
+# Byte lookup table: True for ASCII characters where str.isalpha() or
+# str.isspace() holds, so readable characters can be counted in C
+_READABLE_ASCII = np.array(
+    [chr(b).isalpha() or chr(b).isspace() for b in range(256)],
+    dtype=bool
+)
+_READABLE_ASCII[128:] = False
+
+# Common financial keywords, looked for in spreadsheet cells
+FINANCIAL_KEYWORDS = (
+    'revenue', 'income', 'profit', 'loss', 'cash', 'flow',
+    'balance', 'assets', 'liabilities', 'equity', 'expenses',
+    'cost', 'margin', 'ebitda', 'roi', 'irr', 'npv'
+)
+
+# Lookahead so overlapping keywords ("cashflow") are all reported
+FINANCIAL_KEYWORDS_RE = re.compile(
+    "(?=(" + "|".join(map(re.escape, FINANCIAL_KEYWORDS)) + "))",
+    re.IGNORECASE
+)
+
+
+# Runs of non-whitespace, i.e. what str.split() would return
+_WORD_RE = re.compile(r"\S+")
+
+
+def _count_words(text: str) -> int:
+    """Number of whitespace-separated words, without building the word list"""
+    return sum(1 for _ in _WORD_RE.finditer(text))
+
+
+def _get_worker_count() -> int:
+    """Number of document processing worker processes"""
+    return settings.DOCUMENT_PROCESSING_WORKERS or os.cpu_count() or 1
+
+
+def _get_process_pool() -> ProcessPoolExecutor:
+    """Shared process pool for the document parsers, created on first use"""
+    global _process_pool
+    if _process_pool is None:
+        # spawn: forking a process that runs an event loop and threads is unsafe
+        _process_pool = ProcessPoolExecutor(
+            max_workers=_get_worker_count(),
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _process_pool
+
+
+def _iter_shapes(shapes):
+    """Yield the shapes of a slide, descending into grouped shapes"""
+    from pptx.enum.shapes import MSO_SHAPE_TYPE
+    
+    for shape in shapes:
+        if shape.shape_type == MSO_SHAPE_TYPE.GROUP:
+            yield from _iter_shapes(shape.shapes)
+        else:
+            yield shape
+
+
+def _read_pdf_page(page, text_flags: int) -> Tuple[str, bool]:
+    """Text of a PDF page and whether its layout looks like a table
+    
+    One ``dict`` extraction gives both the text and the line positions, so
+    the expensive find_tables() pass can be skipped on pages of prose.
+    """
+    layout = page.get_text("dict", flags=text_flags, sort=False)
+    
+    block_texts = []
+    cells_per_row: Dict[int, int] = {}
+    for block in layout["blocks"]:
+        if block["type"] != 0:
+            continue
+        
+        line_texts = []
+        for line in block["lines"]:
+            line_texts.append("".join(span["text"] for span in line["spans"]))
+            row = round(line["bbox"][1])
+            cells_per_row[row] = cells_per_row.get(row, 0) + 1
+        block_texts.append("\n".join(line_texts))
+    
+    grid_rows = sum(1 for cells in cells_per_row.values() if cells > 1)
+    text = "\n".join(block_texts)
+    return text + "\n" if text else text, grid_rows >= PDF_TABLE_MIN_GRID_ROWS
+
+
+# WordprocessingML namespace, in lxml's "{uri}tag" form
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+
+
+def _docx_style_names(archive: zipfile.ZipFile) -> Tuple[Dict[str, str], str]:
+    """Paragraph style id -> display name, and the default style's name"""
+    from lxml import etree
+    
+    style_names: Dict[str, str] = {}
+    default_style = 'Normal'
+    
+    try:
+        styles = etree.fromstring(archive.read('word/styles.xml'))
+    except KeyError:
+        return style_names, default_style
+    
+    for style in styles.iter(_W + 'style'):
+        if style.get(_W + 'type') != 'paragraph':
+            continue
+        
+        name = style.find(_W + 'name')
+        display_name = name.get(_W + 'val') if name is not None else style.get(_W + 'styleId')
+        style_names[style.get(_W + 'styleId')] = display_name
+        if style.get(_W + 'default') in ('1', 'true'):
+            default_style = display_name
+    
+    return style_names, default_style
+
+
+def _docx_paragraph_text(paragraph) -> str:
+    """Text of a ``w:p`` element, as python-docx's Paragraph.text reads it"""
+    parts = []
+    for child in paragraph:
+        runs = child.iterchildren(_W + 'r') if child.tag == _W + 'hyperlink' else (child,)
+        for run in runs:
+            if run.tag != _W + 'r':
+                continue
+            for item in run:
+                if item.tag == _W + 't':
+                    parts.append(item.text or '')
+                elif item.tag in (_W + 'tab', _W + 'ptab'):
+                    parts.append('\t')
+                elif item.tag == _W + 'cr':
+                    parts.append('\n')
+                elif item.tag == _W + 'br':
+                    if item.get(_W + 'type', 'textWrapping') == 'textWrapping':
+                        parts.append('\n')
+                elif item.tag == _W + 'noBreakHyphen':
+                    parts.append('-')
+    return ''.join(parts)
+
+
+def _docx_table_rows(table) -> List[List[str]]:
+    """Cell texts of a ``w:tbl`` element, row by row
+    
+    Matches python-docx's ``row.cells``: a cell spanning several grid
+    columns repeats, and a vertically merged cell repeats the text above.
+    """
+    rows = []
+    above: Dict[int, str] = {}
+    
+    for tr in table.iterchildren(_W + 'tr'):
+        row = []
+        for tc in tr.iterchildren(_W + 'tc'):
+            tc_pr = tc.find(_W + 'tcPr')
+            span = 1
+            continues_above = False
+            if tc_pr is not None:
+                grid_span = tc_pr.find(_W + 'gridSpan')
+                if grid_span is not None:
+                    span = int(grid_span.get(_W + 'val', 1))
+                v_merge = tc_pr.find(_W + 'vMerge')
+                continues_above = v_merge is not None and v_merge.get(_W + 'val', 'continue') == 'continue'
+            
+            if continues_above:
+                text = above.get(len(row), '')
+            else:
+                text = '\n'.join(_docx_paragraph_text(p) for p in tc.iterchildren(_W + 'p'))
+            
+            for _ in range(span):
+                above[len(row)] = text
+                row.append(text)
+        rows.append(row)
+    
+    return rows
+
+
+def _docx_core_properties(archive: zipfile.ZipFile) -> Dict[str, str]:
+    """Title, author, subject and timestamps from docProps/core.xml"""
+    from lxml import etree
+    
+    try:
+        core = etree.fromstring(archive.read('docProps/core.xml'))
+    except KeyError:
+        core = None
+    
+    def read(tag: str) -> str:
+        value = core.findtext(tag) if core is not None else None
+        return (value or '').strip()
+    
+    def read_timestamp(tag: str) -> str:
+        value = read(tag)
+        if not value:
+            return ''
+        try:
+            return datetime.fromisoformat(value.replace('Z', '+00:00')).isoformat()
+        except ValueError:
+            return ''
+    
+    return {
+        'title': read('{http://purl.org/dc/elements/1.1/}title'),
+        'author': read('{http://purl.org/dc/elements/1.1/}creator'),
+        'subject': read('{http://purl.org/dc/elements/1.1/}subject'),
+        'created': read_timestamp('{http://purl.org/dc/terms/}created'),
+        'modified': read_timestamp('{http://purl.org/dc/terms/}modified'),
+    }
+
+
+# Paragraphs, tables (as rows of cell texts) and core properties of a .docx
+DocxContent = Tuple[List[Dict[str, Any]], List[List[List[str]]], Dict[str, str]]
+
+
+def _read_docx(file_path: str) -> DocxContent:
+    """Paragraphs, tables and core properties of a .docx, streamed from its XML
+    
+    Body-level paragraphs and tables are handled as iterparse reaches them
+    and then cleared. Only the style id is read from each paragraph; names
+    come from one lookup table instead of a Style object per paragraph.
+    """
+    from lxml import etree
+    
+    paragraphs = []
+    tables = []
+    
+    with zipfile.ZipFile(file_path) as archive:
+        style_names, default_style = _docx_style_names(archive)
+        properties = _docx_core_properties(archive)
+        
+        with archive.open('word/document.xml') as document_xml:
+            for _, elem in etree.iterparse(document_xml, events=('end',), tag=(_W + 'p', _W + 'tbl')):
+                body = elem.getparent()
+                if body.tag != _W + 'body':
+                    continue
+                
+                if elem.tag == _W + 'tbl':
+                    tables.append(_docx_table_rows(elem))
+                else:
+                    text = _docx_paragraph_text(elem)
+                    if text.strip():
+                        style = elem.find(f'{_W}pPr/{_W}pStyle')
+                        style_id = style.get(_W + 'val') if style is not None else None
+                        paragraphs.append({
+                            'text': text,
+                            'style': style_names.get(style_id, default_style)
+                        })
+                
+                # Drop everything parsed so far to keep memory flat
+                elem.clear()
+                while elem.getprevious() is not None:
+                    del body[0]
+    
+    return paragraphs, tables, properties
+
+
+def _read_docx_with_python_docx(file_path: str) -> DocxContent:
+    """Same as _read_docx, through the python-docx object model"""
+    from docx import Document as DocxDocument
+    
+    doc = DocxDocument(file_path)
+    
+    paragraphs = [
+        {'text': para.text, 'style': para.style.name if para.style else 'Normal'}
+        for para in doc.paragraphs
+        if para.text.strip()
+    ]
+    tables = [
+        [[cell.text for cell in row.cells] for row in table.rows]
+        for table in doc.tables
+    ]
+    
+    core_props = doc.core_properties
+    properties = {
+        'title': core_props.title or '',
+        'author': core_props.author or '',
+        'subject': core_props.subject or '',
+        'created': core_props.created.isoformat() if core_props.created else '',
+        'modified': core_props.modified.isoformat() if core_props.modified else '',
+    }
+    
+    return paragraphs, tables, properties
+
+
+def _read_pdf_info(file_path: str) -> Tuple[Dict[str, Any], int]:
+    """Metadata and page count of a PDF, read in a worker process"""
+    import fitz  # PyMuPDF
+    
+    with fitz.open(file_path) as doc:
+        return doc.metadata, len(doc)
+
+
+def _extract_pdf_shard(
+    file_path: str,
+    start: int,
+    end: int,
+    extract_tables: bool = True,
+    extract_images: bool = True,
+    deadline: Optional[float] = None,
+    detail_level: DetailLevel = "full"
+) -> Tuple[List[str], List[Dict[str, Any]], List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """Extract pages ``start``..``end`` of a PDF in a worker process
+    
+    PyMuPDF documents can't be shared across processes, so each shard
+    opens the file itself. A running MuPDF call can't be interrupted, so
+    limits are applied between pages: a page whose text was slow to read
+    skips tables and images, and pages reached after ``deadline`` (a
+    ``time.time()`` value) are returned empty. Both are marked truncated.
+    """
+    import fitz  # PyMuPDF
+    
+    # Plain text extraction without decoding images into the text page
+    text_flags = fitz.TEXTFLAGS_TEXT & ~fitz.TEXT_PRESERVE_IMAGES
+    
+    page_texts = []
+    pages_content = []
+    tables = []
+    images = []
+    
+    with fitz.open(file_path) as doc:
+        for page_num in range(start, end):
+            if deadline is not None and time.time() > deadline:
+                page_texts.append('')
+                page_content = {'page_number': page_num + 1, 'char_count': 0, 'truncated': True}
+                if detail_level == "full":
+                    page_content['text'] = ''
+                pages_content.append(page_content)
+                continue
+            
+            page = doc[page_num]
+            page_start = time.perf_counter()
+            
+            # Extract text in content-stream order; layout sorting isn't needed
+            page_text, looks_tabular = _read_pdf_page(page, text_flags)
+            page_texts.append(page_text)
+            
+            page_content = {
+                'page_number': page_num + 1,
+                'char_count': len(page_text)
+            }
+            if detail_level == "full":
+                page_content['text'] = page_text
+            pages_content.append(page_content)
+            
+            # A page that was this slow to read won't be quicker to scan again
+            if time.perf_counter() - page_start > settings.PDF_PAGE_TIMEOUT_SECONDS:
+                page_content['truncated'] = True
+                continue
+            
+            # Extract tables (basic implementation)
+            if extract_tables and looks_tabular:
+                tables.extend(DocumentProcessor._extract_pdf_tables(page))
+            
+            # Extract images
+            if extract_images:
+                images.extend(DocumentProcessor._extract_pdf_images(page, page_num))
+    
+    return page_texts, pages_content, tables, images
+
 
 class DocumentProcessingError(Exception):
     """Custom exception for document processing errors"""
@@ -31,22 +403,25 @@ class DocumentProcessingError(Exception):
 class DocumentProcessor:
     """Main document processor for handling multiple file formats"""
     
-    def __init__(self):
-        self.supported_formats = {
-            'application/pdf': self._process_pdf,
-            'application/vnd.ms-powerpoint': self._process_ppt,
-            'application/vnd.openxmlformats-officedocument.presentationml.presentation': self._process_pptx,
-            'application/vnd.ms-excel': self._process_excel,
-            'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet': self._process_excel,
-            'application/msword': self._process_word,
-            'application/vnd.openxmlformats-officedocument.wordprocessingml.document': self._process_word,
-        }
+    # MIME type -> name of the handler method, built once for the class
+    supported_formats: ClassVar[Mapping[str, str]] = MappingProxyType({
+        'application/pdf': '_process_pdf',
+        'application/vnd.ms-powerpoint': '_process_ppt',
+        'application/vnd.openxmlformats-officedocument.presentationml.presentation': '_process_pptx',
+        'application/vnd.ms-excel': '_process_excel',
+        'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet': '_process_excel',
+        'application/msword': '_process_word',
+        'application/vnd.openxmlformats-officedocument.wordprocessingml.document': '_process_word',
+    })
     
     async def process_document(
         self, 
         file_path: str, 
         file_type: str,
-        document_id: str
+        document_id: str,
+        extract_tables: bool = True,
+        extract_images: bool = True,
+        detail_level: DetailLevel = "full"
     ) -> Dict[str, Any]:
         """
         Process a document and extract content based on file type
@@ -55,6 +430,9 @@ class DocumentProcessor:
             file_path: Path to the document file
             file_type: MIME type of the document
             document_id: Unique identifier for the document
+            extract_tables: Whether to run PDF table detection
+            extract_images: Whether to list PDF images
+            detail_level: "summary" drops per-page/slide/sheet/paragraph text
             
         Returns:
             Dictionary containing extracted content and metadata
@@ -62,32 +440,42 @@ class DocumentProcessor:
         logger.info(f"Starting document processing for {document_id}", 
                    document_id=document_id, file_type=file_type)
         
-        start_time = datetime.utcnow()
+        start_time = time.perf_counter()
         
         try:
+            # Check if file type is supported; a dict lookup, so it goes first
+            handler_name = self.supported_formats.get(file_type)
+            if handler_name is None:
+                raise DocumentProcessingError(f"Unsupported file type: {file_type}")
+            
             # Validate file exists
-            if not Path(file_path).exists():
+            if not os.path.isfile(file_path):
                 raise DocumentProcessingError(f"File not found: {file_path}")
             
-            # Check if file type is supported
-            if file_type not in self.supported_formats:
-                raise DocumentProcessingError(f"Unsupported file type: {file_type}")
-            
             # Get the appropriate processor
-            processor = self.supported_formats[file_type]
+            processor = getattr(self, handler_name)
             
             # Process the document
-            result = await processor(file_path, document_id)
+            if handler_name == '_process_pdf':
+                result = await processor(
+                    file_path,
+                    document_id,
+                    detail_level,
+                    extract_tables=extract_tables,
+                    extract_images=extract_images
+                )
+            else:
+                result = await processor(file_path, document_id, detail_level)
             
             # Add processing metadata
-            processing_time = (datetime.utcnow() - start_time).total_seconds()
+            processing_time = time.perf_counter() - start_time
             result.update({
                 'processing_metadata': {
                     'document_id': document_id,
                     'file_path': file_path,
                     'file_type': file_type,
                     'processing_time_seconds': processing_time,
-                    'processed_at': datetime.utcnow().isoformat(),
+                    'processed_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
                     'processor_version': '1.0.0'
                 }
             })
@@ -102,50 +490,69 @@ class DocumentProcessor:
                         document_id=document_id, error=str(e))
             raise DocumentProcessingError(f"Processing failed: {str(e)}")
     
-    async def _process_pdf(self, file_path: str, document_id: str) -> Dict[str, Any]:
-        """Process PDF documents using PyMuPDF"""
+    async def _process_pdf(
+        self,
+        file_path: str,
+        document_id: str,
+        detail_level: DetailLevel = "full",
+        extract_tables: bool = True,
+        extract_images: bool = True
+    ) -> Dict[str, Any]:
+        """Process PDF documents using PyMuPDF
+        
+        Table detection re-parses every page, so callers that only need text
+        can turn it (and the image listing) off.
+        """
         logger.info(f"Processing PDF document {document_id}")
         
         try:
-            doc = fitz.open(file_path)
+            loop = asyncio.get_running_loop()
+            pool = _get_process_pool()
             
             # Extract basic metadata
-            metadata = doc.metadata
-            page_count = len(doc)
+            metadata, page_count = await loop.run_in_executor(pool, _read_pdf_info, file_path)
+            deadline = time.time() + settings.PDF_DOCUMENT_TIMEOUT_SECONDS
+            
+            # Split the pages into contiguous shards, one per worker at most
+            shard_count = max(1, min(_get_worker_count(), math.ceil(page_count / PDF_PAGES_PER_SHARD)))
+            shard_size = math.ceil(page_count / shard_count) if page_count else 0
+            
+            shards = await asyncio.gather(*[
+                loop.run_in_executor(
+                    pool,
+                    _extract_pdf_shard,
+                    file_path,
+                    start,
+                    min(start + shard_size, page_count),
+                    extract_tables,
+                    extract_images,
+                    deadline,
+                    detail_level
+                )
+                for start in range(0, page_count, shard_size or 1)
+            ])
             
             # Extract text content
-            full_text = ""
+            page_texts = []
             pages_content = []
             tables = []
             images = []
             
-            for page_num in range(page_count):
-                page = doc[page_num]
-                
-                # Extract text
-                page_text = page.get_text()
-                full_text += page_text + "\n"
-                
-                pages_content.append({
-                    'page_number': page_num + 1,
-                    'text': page_text,
-                    'char_count': len(page_text)
-                })
-                
-                # Extract tables (basic implementation)
-                page_tables = self._extract_pdf_tables(page)
-                if page_tables:
-                    tables.extend(page_tables)
-                
-                # Extract images
-                page_images = self._extract_pdf_images(page, page_num)
-                if page_images:
-                    images.extend(page_images)
+            for shard_texts, shard_pages, shard_tables, shard_images in shards:
+                page_texts.extend(shard_texts)
+                pages_content.extend(shard_pages)
+                tables.extend(shard_tables)
+                images.extend(shard_images)
+            
+            truncated_pages = sum(1 for page in pages_content if page.get('truncated'))
+            if truncated_pages:
+                logger.warning(f"PDF {document_id}: {truncated_pages} of {page_count} pages truncated by time limits")
             
-            doc.close()
+            full_text = "\n".join(page_texts)
+            word_count = _count_words(full_text)
             
             # Calculate quality metrics
-            text_quality = self._calculate_text_quality(full_text)
+            text_quality = self._calculate_text_quality(full_text, word_count)
             
             return {
                 'extracted_content': {
@@ -167,9 +574,10 @@ class DocumentProcessor:
                 'quality_metrics': {
                     'text_quality_score': text_quality,
                     'total_characters': len(full_text),
-                    'total_words': len(full_text.split()),
+                    'total_words': word_count,
                     'tables_found': len(tables),
-                    'images_found': len(images)
+                    'images_found': len(images),
+                    'pages_truncated': truncated_pages
                 }
             }
             
@@ -177,31 +585,53 @@ class DocumentProcessor:
             logger.error(f"PDF processing error for {document_id}: {str(e)}")
             raise DocumentProcessingError(f"PDF processing failed: {str(e)}")
     
-    async def _process_pptx(self, file_path: str, document_id: str) -> Dict[str, Any]:
+    async def _run_in_pool(self, func, *args) -> Dict[str, Any]:
+        """Run a synchronous parser in the worker pool, off the event loop"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_get_process_pool(), func, *args)
+    
+    async def _process_pptx(
+        self,
+        file_path: str,
+        document_id: str,
+        detail_level: DetailLevel = "full"
+    ) -> Dict[str, Any]:
         """Process PowerPoint presentations"""
+        return await self._run_in_pool(self._process_pptx_sync, file_path, document_id, detail_level)
+    
+    def _process_pptx_sync(
+        self,
+        file_path: str,
+        document_id: str,
+        detail_level: DetailLevel = "full"
+    ) -> Dict[str, Any]:
+        """Parse a PowerPoint presentation; runs in a worker process"""
         logger.info(f"Processing PowerPoint document {document_id}")
         
+        from pptx import Presentation
+        from pptx.enum.shapes import MSO_SHAPE_TYPE
+        
         try:
             prs = Presentation(file_path)
             
             # Extract slides content
             slides_content = []
-            full_text = ""
+            slide_texts = []
             images = []
             charts = []
             
             for slide_num, slide in enumerate(prs.slides):
-                slide_text = ""
+                shape_texts = []
                 slide_images = []
                 slide_charts = []
                 
                 # Extract text from shapes
-                for shape in slide.shapes:
-                    if hasattr(shape, "text"):
-                        slide_text += shape.text + "\n"
+                for shape in _iter_shapes(slide.shapes):
+                    if shape.has_text_frame:
+                        shape_texts.append(shape.text_frame.text)
                     
                     # Check for images
-                    if shape.shape_type == 13:  # Picture
+                    if shape.shape_type == MSO_SHAPE_TYPE.PICTURE:
                         slide_images.append({
                             'slide_number': slide_num + 1,
                             'shape_id': shape.shape_id,
@@ -209,27 +639,33 @@ class DocumentProcessor:
                         })
                     
                     # Check for charts
-                    if hasattr(shape, 'chart'):
+                    if shape.has_chart:
                         slide_charts.append({
                             'slide_number': slide_num + 1,
                             'chart_type': str(shape.chart.chart_type),
                             'title': getattr(shape.chart, 'chart_title', ''),
                         })
                 
-                slides_content.append({
+                slide_text = "\n".join(shape_texts)
+                slide_content = {
                     'slide_number': slide_num + 1,
-                    'text': slide_text.strip(),
                     'char_count': len(slide_text),
                     'images_count': len(slide_images),
                     'charts_count': len(slide_charts)
-                })
+                }
+                if detail_level == "full":
+                    slide_content['text'] = slide_text.strip()
+                slides_content.append(slide_content)
                 
-                full_text += slide_text
+                slide_texts.append(slide_text)
                 images.extend(slide_images)
                 charts.extend(slide_charts)
             
+            full_text = "\n".join(slide_texts)
+            word_count = _count_words(full_text)
+            
             # Calculate quality metrics
-            text_quality = self._calculate_text_quality(full_text)
+            text_quality = self._calculate_text_quality(full_text, word_count)
             
             return {
                 'extracted_content': {
@@ -246,7 +682,7 @@ class DocumentProcessor:
                 'quality_metrics': {
                     'text_quality_score': text_quality,
                     'total_characters': len(full_text),
-                    'total_words': len(full_text.split()),
+                    'total_words': word_count,
                     'images_found': len(images),
                     'charts_found': len(charts)
                 }
@@ -256,61 +692,111 @@ class DocumentProcessor:
             logger.error(f"PowerPoint processing error for {document_id}: {str(e)}")
             raise DocumentProcessingError(f"PowerPoint processing failed: {str(e)}")
     
-    async def _process_ppt(self, file_path: str, document_id: str) -> Dict[str, Any]:
+    async def _process_ppt(
+        self,
+        file_path: str,
+        document_id: str,
+        detail_level: DetailLevel = "full"
+    ) -> Dict[str, Any]:
         """Process legacy PowerPoint files (redirect to pptx processor)"""
-        return await self._process_pptx(file_path, document_id)
+        return await self._process_pptx(file_path, document_id, detail_level)
     
-    async def _process_excel(self, file_path: str, document_id: str) -> Dict[str, Any]:
+    async def _process_excel(
+        self,
+        file_path: str,
+        document_id: str,
+        detail_level: DetailLevel = "full"
+    ) -> Dict[str, Any]:
         """Process Excel spreadsheets"""
+        return await self._run_in_pool(self._process_excel_sync, file_path, document_id, detail_level)
+    
+    def _process_excel_sync(
+        self,
+        file_path: str,
+        document_id: str,
+        detail_level: DetailLevel = "full"
+    ) -> Dict[str, Any]:
+        """Parse an Excel workbook; runs in a worker process"""
         logger.info(f"Processing Excel document {document_id}")
         
+        import openpyxl
+        
         try:
-            workbook = openpyxl.load_workbook(file_path, data_only=True)
+            # Read-only mode streams rows from the file instead of building
+            # every cell object up front
+            workbook = openpyxl.load_workbook(file_path, data_only=True, read_only=True)
             
             # Extract worksheets content
             worksheets_content = []
             financial_data = []
             tables = []
-            full_text = ""
+            sheet_texts = []
             
-            for sheet_name in workbook.sheetnames:
-                worksheet = workbook[sheet_name]
-                
-                # Extract data from worksheet
-                sheet_data = []
-                sheet_text = ""
-                
-                for row in worksheet.iter_rows(values_only=True):
-                    if any(cell is not None for cell in row):
+            try:
+                for sheet_name in workbook.sheetnames:
+                    worksheet = workbook[sheet_name]
+                    
+                    # Extract data from worksheet; only the text, the first
+                    # rows and the string cells are kept, not every row
+                    row_count = 0
+                    column_count = 0
+                    preview = []
+                    row_texts = []
+                    string_cells = []
+                    
+                    for row in worksheet.iter_rows(values_only=True):
+                        # tuple.count scans in C; skip rows with no values at all
+                        if row.count(None) == len(row):
+                            continue
+                        
                         row_data = [str(cell) if cell is not None else "" for cell in row]
-                        sheet_data.append(row_data)
-                        sheet_text += " ".join(row_data) + "\n"
-                
-                # Identify potential financial data
-                financial_indicators = self._identify_financial_data(sheet_data, sheet_name)
-                if financial_indicators:
-                    financial_data.extend(financial_indicators)
-                
-                # Identify tables
-                if len(sheet_data) > 1:  # Has header and data
-                    tables.append({
+                        row_texts.append(row_data[0] if len(row_data) == 1 else " ".join(row_data))
+                        
+                        if row_count == 0:
+                            column_count = len(row_data)
+                        if row_count < 5:
+                            preview.append(row_data)
+                        
+                        # Only text cells can hold a financial keyword
+                        string_cells.extend(
+                            (row_count, col_idx, cell, row_data[col_idx + 1] if col_idx + 1 < len(row_data) else None)
+                            for col_idx, cell in enumerate(row)
+                            if isinstance(cell, str) and cell
+                        )
+                        row_count += 1
+                    
+                    sheet_text = "\n".join(row_texts)
+                    
+                    # Identify potential financial data
+                    financial_indicators = self._identify_financial_data(string_cells, sheet_name)
+                    if financial_indicators:
+                        financial_data.extend(financial_indicators)
+                    
+                    # Identify tables
+                    if row_count > 1:  # Has header and data
+                        tables.append({
+                            'sheet_name': sheet_name,
+                            'rows': row_count,
+                            'columns': column_count,
+                            'data_preview': preview  # First 5 rows
+                        })
+                    
+                    worksheet_content = {
                         'sheet_name': sheet_name,
-                        'rows': len(sheet_data),
-                        'columns': len(sheet_data[0]) if sheet_data else 0,
-                        'data_preview': sheet_data[:5]  # First 5 rows
-                    })
-                
-                worksheets_content.append({
-                    'sheet_name': sheet_name,
-                    'text': sheet_text.strip(),
-                    'row_count': len(sheet_data),
-                    'column_count': len(sheet_data[0]) if sheet_data else 0,
-                    'has_financial_data': len(financial_indicators) > 0
-                })
-                
-                full_text += sheet_text
+                        'row_count': row_count,
+                        'column_count': column_count,
+                        'has_financial_data': len(financial_indicators) > 0
+                    }
+                    if detail_level == "full":
+                        worksheet_content['text'] = sheet_text.strip()
+                    worksheets_content.append(worksheet_content)
+                    
+                    sheet_texts.append(sheet_text)
+            finally:
+                # Read-only workbooks keep the file open until closed
+                workbook.close()
             
-            workbook.close()
+            full_text = "\n".join(sheet_texts)
             
             # Calculate quality metrics
             text_quality = self._calculate_text_quality(full_text)
@@ -338,44 +824,54 @@ class DocumentProcessor:
             logger.error(f"Excel processing error for {document_id}: {str(e)}")
             raise DocumentProcessingError(f"Excel processing failed: {str(e)}")
     
-    async def _process_word(self, file_path: str, document_id: str) -> Dict[str, Any]:
+    async def _process_word(
+        self,
+        file_path: str,
+        document_id: str,
+        detail_level: DetailLevel = "full"
+    ) -> Dict[str, Any]:
         """Process Word documents"""
+        return await self._run_in_pool(self._process_word_sync, file_path, document_id, detail_level)
+    
+    def _process_word_sync(
+        self,
+        file_path: str,
+        document_id: str,
+        detail_level: DetailLevel = "full"
+    ) -> Dict[str, Any]:
+        """Parse a Word document; runs in a worker process"""
         logger.info(f"Processing Word document {document_id}")
         
+        from lxml import etree
+        
         try:
-            doc = DocxDocument(file_path)
-            
-            # Extract paragraphs
-            paragraphs = []
-            full_text = ""
-            
-            for para in doc.paragraphs:
-                if para.text.strip():
-                    paragraphs.append({
-                        'text': para.text,
-                        'style': para.style.name if para.style else 'Normal'
-                    })
-                    full_text += para.text + "\n"
+            # Read the XML directly; fall back to python-docx when the
+            # package can't be read that way
+            try:
+                paragraphs, table_rows, properties = _read_docx(file_path)
+            except (zipfile.BadZipFile, KeyError, etree.XMLSyntaxError):
+                paragraphs, table_rows, properties = _read_docx_with_python_docx(file_path)
+            
+            full_text = "\n".join(paragraph['text'] for paragraph in paragraphs)
+            word_count = _count_words(full_text)
+            
+            if detail_level == "summary":
+                paragraphs = [
+                    {'style': paragraph['style'], 'char_count': len(paragraph['text'])}
+                    for paragraph in paragraphs
+                ]
             
             # Extract tables
             tables = []
-            for table in doc.tables:
-                table_data = []
-                for row in table.rows:
-                    row_data = [cell.text for cell in row.cells]
-                    table_data.append(row_data)
-                
+            for table_data in table_rows:
                 tables.append({
                     'rows': len(table_data),
                     'columns': len(table_data[0]) if table_data else 0,
                     'data_preview': table_data[:3]  # First 3 rows
                 })
             
-            # Extract document properties
-            core_props = doc.core_properties
-            
             # Calculate quality metrics
-            text_quality = self._calculate_text_quality(full_text)
+            text_quality = self._calculate_text_quality(full_text, word_count)
             
             return {
                 'extracted_content': {
@@ -384,18 +880,14 @@ class DocumentProcessor:
                     'tables': tables
                 },
                 'document_metadata': {
-                    'title': core_props.title or '',
-                    'author': core_props.author or '',
-                    'subject': core_props.subject or '',
-                    'created': core_props.created.isoformat() if core_props.created else '',
-                    'modified': core_props.modified.isoformat() if core_props.modified else '',
+                    **properties,
                     'paragraph_count': len(paragraphs),
                     'table_count': len(tables)
                 },
                 'quality_metrics': {
                     'text_quality_score': text_quality,
                     'total_characters': len(full_text),
-                    'total_words': len(full_text.split()),
+                    'total_words': word_count,
                     'tables_found': len(tables)
                 }
             }
@@ -404,7 +896,8 @@ class DocumentProcessor:
             logger.error(f"Word processing error for {document_id}: {str(e)}")
             raise DocumentProcessingError(f"Word processing failed: {str(e)}")
     
-    def _extract_pdf_tables(self, page) -> List[Dict[str, Any]]:
+    @staticmethod
+    def _extract_pdf_tables(page) -> List[Dict[str, Any]]:
         """Extract tables from PDF page (basic implementation)"""
         try:
             # This is a simplified table extraction
@@ -425,7 +918,8 @@ class DocumentProcessor:
         except:
             return []
     
-    def _extract_pdf_images(self, page, page_num: int) -> List[Dict[str, Any]]:
+    @staticmethod
+    def _extract_pdf_images(page, page_num: int) -> List[Dict[str, Any]]:
         """Extract images from PDF page"""
         try:
             image_list = page.get_images()
@@ -443,45 +937,70 @@ class DocumentProcessor:
         except:
             return []
     
-    def _identify_financial_data(self, sheet_data: List[List[str]], sheet_name: str) -> List[Dict[str, Any]]:
-        """Identify potential financial data in Excel sheets"""
-        financial_indicators = []
+    def _identify_financial_data(
+        self,
+        string_cells: List[Tuple[int, int, str, Optional[str]]],
+        sheet_name: str
+    ) -> List[Dict[str, Any]]:
+        """Identify potential financial data in Excel sheets
         
-        # Common financial keywords
-        financial_keywords = [
-            'revenue', 'income', 'profit', 'loss', 'cash', 'flow',
-            'balance', 'assets', 'liabilities', 'equity', 'expenses',
-            'cost', 'margin', 'ebitda', 'roi', 'irr', 'npv'
-        ]
+        ``string_cells`` holds the row, column, text and right-hand neighbour
+        of each non-empty text cell. The texts are joined and scanned once;
+        match offsets are mapped back to cells with a binary search over the
+        cell start offsets.
+        """
+        cell_starts = []
+        parts = []
+        offset = 0
+        for _, _, cell, _ in string_cells:
+            cell_starts.append(offset)
+            parts.append(cell)
+            offset += len(cell) + 1
+        
+        # "\n" never occurs in a keyword, so no match spans two cells
+        sheet_text = "\n".join(parts)
         
-        for row_idx, row in enumerate(sheet_data):
-            for col_idx, cell in enumerate(row):
-                if isinstance(cell, str):
-                    cell_lower = cell.lower()
-                    for keyword in financial_keywords:
-                        if keyword in cell_lower:
-                            financial_indicators.append({
-                                'sheet_name': sheet_name,
-                                'row': row_idx + 1,
-                                'column': col_idx + 1,
-                                'keyword': keyword,
-                                'context': cell,
-                                'value': row[col_idx + 1] if col_idx + 1 < len(row) else None
-                            })
+        # Keywords found per cell, in sheet order
+        found_by_cell: Dict[int, set] = {}
+        for match in FINANCIAL_KEYWORDS_RE.finditer(sheet_text):
+            cell_index = bisect.bisect_right(cell_starts, match.start()) - 1
+            found_by_cell.setdefault(cell_index, set()).add(match.group(1).lower())
+        
+        financial_indicators = []
+        for cell_index, found in found_by_cell.items():
+            row_idx, col_idx, cell, value = string_cells[cell_index]
+            for keyword in FINANCIAL_KEYWORDS:
+                if keyword in found:
+                    financial_indicators.append({
+                        'sheet_name': sheet_name,
+                        'row': row_idx + 1,
+                        'column': col_idx + 1,
+                        'keyword': keyword,
+                        'context': cell,
+                        'value': value
+                    })
         
         return financial_indicators
     
-    def _calculate_text_quality(self, text: str) -> float:
-        """Calculate text quality score based on various factors"""
+    def _calculate_text_quality(self, text: str, word_count: Optional[int] = None) -> float:
+        """Calculate text quality score based on various factors
+        
+        Pass ``word_count`` when the caller has already counted words.
+        """
         if not text or len(text.strip()) == 0:
             return 0.0
         
         # Basic quality metrics
         char_count = len(text)
-        word_count = len(text.split())
+        if word_count is None:
+            word_count = _count_words(text)
         
         # Check for readable content (not just symbols/numbers)
-        readable_chars = sum(1 for c in text if c.isalpha() or c.isspace())
+        if text.isascii():
+            codes = np.frombuffer(text.encode('ascii'), dtype=np.uint8)
+            readable_chars = int(_READABLE_ASCII[codes].sum())
+        else:
+            readable_chars = sum(1 for c in text if c.isalpha() or c.isspace())
         readability_ratio = readable_chars / char_count if char_count > 0 else 0
         
         # Check average word length (reasonable words)
@@ -4,11 +4,17 @@ Natural Language Processing service for text analysis and entity extraction
 
 import asyncio
 import logging
+import multiprocessing
+import os
 import re
-from typing import Dict, Any, List, Optional, Tuple
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import threading
+from functools import lru_cache
+from typing import Dict, Any, FrozenSet, List, Optional, Tuple
 from datetime import datetime
 import spacy
-from spacy.matcher import Matcher
+from spacy.matcher import Matcher, PhraseMatcher
 from spacy.util import filter_spans
 
 from app.core.config import settings
@@ -16,6 +22,358 @@ from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Only the entity recognizer's output is read, so the rest of the pipeline is
+# not loaded at all. The Matcher patterns use lexical attributes only.
+SPACY_EXCLUDED_COMPONENTS = ["parser", "tagger", "attribute_ruler", "lemmatizer"]
+SPACY_BATCH_SIZE = 64
+
+# The vocab's string store keeps every string it has seen; once this many
+# have been added since loading, the model is reloaded to release them
+SPACY_MAX_NEW_VOCAB_STRINGS = 500_000
+
+# Text cleanup in _preprocess_text. ASCII text, the common case, drops the
+# special characters with str.translate instead of the regex.
+_WHITESPACE_RE = re.compile(r'\s+')
+_SPECIAL_CHARACTER_RE = re.compile(r'[^\w\s\.\,\!\?\;\:\-\(\)\$\%]')
+_ASCII_SPECIAL_CHARACTERS = str.maketrans('', '', ''.join(
+    c for c in map(chr, range(128)) if _SPECIAL_CHARACTER_RE.match(c)
+))
+
+# Sentence boundaries for _split_sentences
+_SENTENCE_END_RE = re.compile(r'[.!?]+')
+
+# Entity bucket for each spaCy entity label; other labels are dropped
+_LABEL_TO_BUCKET = {
+    'ORG': 'organizations', 'CORP': 'organizations',
+    'PERSON': 'people', 'PER': 'people',
+    'GPE': 'locations', 'LOC': 'locations', 'LOCATION': 'locations',
+    'MONEY': 'money', 'CURRENCY': 'money',
+    'DATE': 'dates', 'TIME': 'dates',
+    'PRODUCT': 'products', 'WORK_OF_ART': 'products'
+}
+
+# Result sections produced by the extractors, in result order
+ALL_EXTRACTORS = (
+    'entities', 'financial_metrics', 'business_insights', 'market_analysis',
+    'team_information', 'risk_factors', 'sentiment', 'key_topics'
+)
+
+# Document types that only need some extractors; the rest get empty results.
+# Financial models are mostly figures, so the spaCy parse, team and market
+# scans and sentiment are skipped. Other types run everything.
+EXTRACTORS_BY_DOCUMENT_TYPE = {
+    'financial_model': ('financial_metrics', 'business_insights', 'risk_factors', 'key_topics'),
+}
+
+# Threads that run the spaCy model and the regex extractors off the event loop
+_thread_pool: Optional[ThreadPoolExecutor] = None
+
+# Processes for analyze_many, each with its own processor and model
+_process_pool: Optional[ProcessPoolExecutor] = None
+_worker_processor: Optional["NLPProcessor"] = None
+
+# Amount with optional "$" and k/m/b unit; groups: amount, unit
+_AMOUNT = r'\$?([0-9][0-9,]*(?:\.[0-9]+)?)\s*([kmb]?)'
+
+# Multiplier for each _AMOUNT unit
+_UNIT_MULTIPLIERS = {'': 1, 'k': 1e3, 'm': 1e6, 'b': 1e9}
+
+
+def _parse_amount(match: "re.Match[str]") -> float:
+    """Dollar value of the _AMOUNT in a _compile_alternation match"""
+    amount = match.group(match.lastindex + 1).replace(',', '')
+    unit = match.group(match.lastindex + 2).lower()
+    return float(amount) * _UNIT_MULTIPLIERS[unit]
+
+
+def _compile_alternation(patterns: List[str]) -> "re.Pattern[str]":
+    """Join patterns into one case-insensitive regex, one named group each
+    
+    Each alternative is wrapped in ``(?P<p{index}>...)``; since that group
+    closes last, ``match.lastindex`` points at it and the alternative's own
+    groups follow it.
+    """
+    return re.compile(
+        "|".join(f"(?P<p{index}>{pattern})" for index, pattern in enumerate(patterns)),
+        re.IGNORECASE
+    )
+
+
+# (bucket, metric type, pattern) for _extract_financial_metrics
+_FINANCIAL_PATTERNS = [
+    ('revenue_metrics', 'revenue', r'revenue[:\s]+' + _AMOUNT),
+    ('revenue_metrics', 'revenue', r'sales[:\s]+' + _AMOUNT),
+    ('revenue_metrics', 'revenue', r'income[:\s]+' + _AMOUNT),
+    ('revenue_metrics', 'revenue', r'\$([0-9][0-9,]*(?:\.[0-9]+)?)\s*([kmb]?)\s+revenue'),
+    ('funding_metrics', 'funding', r'raised[:\s]+' + _AMOUNT),
+    ('funding_metrics', 'funding', r'funding[:\s]+' + _AMOUNT),
+    ('funding_metrics', 'funding', r'investment[:\s]+' + _AMOUNT),
+    ('funding_metrics', 'funding', r'series\s+[abc][:\s]+' + _AMOUNT),
+    ('valuation_metrics', 'valuation', r'valuation[:\s]+' + _AMOUNT),
+    ('valuation_metrics', 'valuation', r'valued\s+at[:\s]+' + _AMOUNT),
+    ('valuation_metrics', 'valuation', r'worth[:\s]+' + _AMOUNT),
+]
+_FINANCIAL_RE = _compile_alternation([pattern for _, _, pattern in _FINANCIAL_PATTERNS])
+_FINANCIAL_BUCKETS = {
+    f"p{index}": (bucket, metric_type)
+    for index, (bucket, metric_type, _) in enumerate(_FINANCIAL_PATTERNS)
+}
+
+_MARKET_SIZE_RE = _compile_alternation([
+    r'market size[:\s]+' + _AMOUNT,
+    r'tam[:\s]+' + _AMOUNT,
+    r'total addressable market[:\s]+' + _AMOUNT,
+])
+
+_COMPETITOR_RE = re.compile(
+    r'(?:competitor|competition|rival|alternative)[s]?[:\s]+([A-Z][a-zA-Z\s]+(?:,\s*[A-Z][a-zA-Z\s]+)*)',
+    re.IGNORECASE
+)
+
+_FOUNDER_RE = _compile_alternation([
+    r'founder[s]?[:\s]+([A-Z][a-zA-Z\s]+)',
+    r'co-founder[s]?[:\s]+([A-Z][a-zA-Z\s]+)',
+    r'ceo[:\s]+([A-Z][a-zA-Z\s]+)',
+    r'founded by[:\s]+([A-Z][a-zA-Z\s]+)',
+])
+
+# Listed in order of preference when several match
+_TEAM_SIZE_RE = _compile_alternation([
+    r'team of ([0-9]+)',
+    r'([0-9]+) employees',
+    r'([0-9]+) team members',
+])
+
+# Keyword tables for the substring-presence checks below
+_BUSINESS_MODELS = {
+    'saas': ['saas', 'software as a service', 'subscription software'],
+    'marketplace': ['marketplace', 'platform', 'two-sided market'],
+    'e-commerce': ['e-commerce', 'online store', 'retail'],
+    'fintech': ['fintech', 'financial technology', 'payments'],
+    'healthtech': ['healthtech', 'medical', 'healthcare'],
+    'edtech': ['edtech', 'education', 'learning platform']
+}
+
+_REVENUE_MODELS = {
+    'subscription': ['subscription', 'monthly fee', 'recurring'],
+    'transaction': ['transaction fee', 'commission', 'per transaction'],
+    'freemium': ['freemium', 'free tier', 'premium features'],
+    'advertising': ['advertising', 'ads', 'sponsored content'],
+    'licensing': ['licensing', 'license fee', 'royalty']
+}
+
+_MARKET_INDICATORS = ['target market', 'customer segment', 'user base', 'audience']
+
+_RISK_CATEGORIES = {
+    'market': ['market risk', 'competition', 'market downturn', 'demand risk'],
+    'financial': ['cash flow', 'funding', 'burn rate', 'profitability'],
+    'operational': ['scalability', 'operations', 'supply chain', 'execution'],
+    'regulatory': ['regulation', 'compliance', 'legal', 'policy'],
+    'technology': ['technical risk', 'security', 'platform', 'infrastructure'],
+    'team': ['key person', 'talent', 'hiring', 'retention']
+}
+
+# (category, keyword) for each alternative of _RISK_RE
+_RISK_KEYWORDS = {
+    f"p{index}": entry
+    for index, entry in enumerate(
+        (category, keyword)
+        for category, keywords in _RISK_CATEGORIES.items()
+        for keyword in keywords
+    )
+}
+_RISK_RE = _compile_alternation([re.escape(keyword) for _, keyword in _RISK_KEYWORDS.values()])
+
+_TOPIC_KEYWORDS = {
+    'technology': ['ai', 'machine learning', 'blockchain', 'iot', 'cloud', 'mobile', 'web'],
+    'business': ['revenue', 'profit', 'growth', 'market', 'customer', 'sales'],
+    'finance': ['funding', 'investment', 'valuation', 'cash flow', 'burn rate'],
+    'product': ['product', 'feature', 'platform', 'solution', 'service'],
+    'market': ['market', 'industry', 'sector', 'competition', 'opportunity'],
+    'team': ['team', 'founder', 'employee', 'talent', 'experience']
+}
+
+_TECH_KEYWORDS = ('ai', 'ml', 'blockchain', 'iot', 'saas', 'api', 'cloud', 'mobile', 'web', 'app')
+
+_DOCUMENT_TYPES = {
+    'pitch_deck': ['pitch', 'deck', 'presentation', 'slide', 'investment opportunity'],
+    'business_plan': ['business plan', 'executive summary', 'strategy', 'operations'],
+    'financial_model': ['financial model', 'projections', 'forecast', 'revenue model'],
+    'market_analysis': ['market analysis', 'market research', 'competitive analysis'],
+    'technical_document': ['technical', 'architecture', 'development', 'api']
+}
+
+
+def _split_keywords(table: Dict[str, List[str]]) -> Dict[str, Tuple[FrozenSet[str], FrozenSet[str]]]:
+    """Split each keyword list into single words, matched as whole tokens,
+    and multi-word phrases, matched through the keyword scan"""
+    return {
+        name: (
+            frozenset(k for k in keywords if ' ' not in k),
+            frozenset(k for k in keywords if ' ' in k)
+        )
+        for name, keywords in table.items()
+    }
+
+
+_TOPIC_KEYWORD_SPLITS = _split_keywords(_TOPIC_KEYWORDS)
+_DOCUMENT_TYPE_SPLITS = _split_keywords(_DOCUMENT_TYPES)
+
+# Custom patterns. Metrics followed by an optional amount need token
+# attributes and go to the Matcher; fixed business and market terms are
+# matched case-insensitively by the much cheaper PhraseMatcher.
+_FINANCIAL_TOKEN_PATTERNS = [
+    [{"LOWER": {"IN": ["revenue", "income", "sales"]}},
+     {"IS_CURRENCY": True, "OP": "?"},
+     {"LIKE_NUM": True, "OP": "?"}],
+    [{"LOWER": {"IN": ["profit", "loss", "ebitda"]}},
+     {"IS_CURRENCY": True, "OP": "?"},
+     {"LIKE_NUM": True, "OP": "?"}],
+    [{"LOWER": {"IN": ["valuation", "funding", "investment"]}},
+     {"IS_CURRENCY": True, "OP": "?"},
+     {"LIKE_NUM": True, "OP": "?"}],
+    [{"LOWER": {"IN": ["burn", "runway"]}},
+     {"LOWER": "rate", "OP": "?"},
+     {"IS_CURRENCY": True, "OP": "?"},
+     {"LIKE_NUM": True, "OP": "?"}],
+]
+
+_CUSTOM_PHRASES = {
+    "BUSINESS_MODEL": [
+        "b2b", "b2c", "b2b2c",
+        "business model",
+        "saas", "marketplace", "platform",
+        "subscription", "freemium", "transaction",
+        "subscription model", "freemium model", "transaction model"
+    ],
+    "MARKET_INFO": [
+        "tam", "sam", "som",
+        "total addressable market",
+        "market size", "market opportunity", "market share",
+        "competitor", "competition", "competitive"
+    ]
+}
+
+# Sentiment indicator words, counted as whole words
+_POSITIVE_WORDS = frozenset(['growth', 'success', 'opportunity', 'strong', 'excellent', 'innovative', 'leading'])
+_NEGATIVE_WORDS = frozenset(['risk', 'challenge', 'problem', 'decline', 'loss', 'difficult', 'concern'])
+
+_TOKEN_RE = re.compile(r'\w+')
+
+_ALL_KEYWORDS = frozenset(
+    [keyword for table in (_BUSINESS_MODELS, _REVENUE_MODELS, _RISK_CATEGORIES, _TOPIC_KEYWORDS, _DOCUMENT_TYPES)
+     for keywords in table.values() for keyword in keywords]
+    + _MARKET_INDICATORS
+    + list(_TECH_KEYWORDS)
+)
+
+# Longest first, inside a lookahead so matches may overlap. Only one keyword
+# is reported per position, so each also implies the keywords that are its
+# prefixes ("market analysis" -> "market").
+_KEYWORD_RE = re.compile(
+    "(?=(" + "|".join(re.escape(k) for k in sorted(_ALL_KEYWORDS, key=len, reverse=True)) + "))"
+)
+_KEYWORD_PREFIXES = {
+    keyword: frozenset(other for other in _ALL_KEYWORDS if keyword.startswith(other))
+    for keyword in _ALL_KEYWORDS
+}
+
+
+def _get_extractors(document_type: str) -> Tuple[str, ...]:
+    """Names of the extractors to run for a document type"""
+    return EXTRACTORS_BY_DOCUMENT_TYPE.get(document_type, ALL_EXTRACTORS)
+
+
+def _get_worker_count() -> int:
+    """Number of NLP analysis threads, and of worker processes for analyze_many"""
+    return settings.NLP_WORKERS or os.cpu_count() or 1
+
+
+def _get_thread_pool() -> ThreadPoolExecutor:
+    """Shared thread pool for NLP analysis, created on first use"""
+    global _thread_pool
+    if _thread_pool is None:
+        _thread_pool = ThreadPoolExecutor(
+            max_workers=_get_worker_count(),
+            thread_name_prefix="nlp",
+        )
+    return _thread_pool
+
+
+def _get_process_pool() -> ProcessPoolExecutor:
+    """Shared process pool for batch analysis, created on first use"""
+    global _process_pool
+    if _process_pool is None:
+        # spawn: forking a process that runs an event loop and threads is unsafe
+        _process_pool = ProcessPoolExecutor(
+            max_workers=_get_worker_count(),
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_analysis_worker,
+        )
+    return _process_pool
+
+
+def _init_analysis_worker() -> None:
+    """Load the model once when a worker process starts"""
+    global _worker_processor
+    _worker_processor = NLPProcessor()
+
+
+def _analyze_in_worker(text: str, document_type: str) -> Dict[str, Any]:
+    """Analyze one text in a worker process"""
+    return _worker_processor.analyze_text_sync(text, document_type)
+
+
+@lru_cache(maxsize=1)
+def _load_nlp():
+    """Load the spaCy model once per process; raises OSError if it isn't installed"""
+    return spacy.load("en_core_web_sm", exclude=SPACY_EXCLUDED_COMPONENTS)
+
+
+def _count_keywords_present(
+    split_keywords: Tuple[FrozenSet[str], FrozenSet[str]],
+    token_counts: Counter,
+    keyword_hits: FrozenSet[str]
+) -> int:
+    """How many of a (single words, phrases) keyword split occur in a text"""
+    words, phrases = split_keywords
+    return len(words & token_counts.keys()) + len(phrases & keyword_hits)
+
+
+@lru_cache(maxsize=1)
+def _load_matchers() -> Tuple[Matcher, PhraseMatcher]:
+    """Build the custom pattern matchers once per process
+    
+    Raises OSError if the spaCy model isn't installed.
+    """
+    nlp = _load_nlp()
+    
+    matcher = Matcher(nlp.vocab)
+    matcher.add("FINANCIAL_METRICS", _FINANCIAL_TOKEN_PATTERNS)
+    
+    phrase_matcher = PhraseMatcher(nlp.vocab, attr="LOWER")
+    for label, phrases in _CUSTOM_PHRASES.items():
+        phrase_matcher.add(label, list(nlp.tokenizer.pipe(phrases)))
+    
+    return matcher, phrase_matcher
+
+
+def _count_tokens(text: str) -> Counter:
+    """Occurrences of each lowercased word in ``text``"""
+    return Counter(_TOKEN_RE.findall(text.lower()))
+
+
+def _find_keywords(text: str) -> FrozenSet[str]:
+    """Every keyword from the tables above that occurs in ``text``
+    
+    One lowercase and one regex pass; the analysis computes it once per
+    text and hands it to each extractor that needs it.
+    """
+    found = set()
+    for keyword in set(_KEYWORD_RE.findall(text.lower())):
+        found |= _KEYWORD_PREFIXES[keyword]
+    return frozenset(found)
+
 
 class NLPProcessingError(Exception):
     """Custom exception for NLP processing errors"""
@@ -28,6 +386,9 @@ class NLPProcessor:
     def __init__(self):
         self.nlp = None
         self.matcher = None
+        self.phrase_matcher = None
+        self._vocab_size_at_load = 0
+        self._reload_lock = threading.Lock()
         self._initialize_models()
     
     def _initialize_models(self):
@@ -36,11 +397,11 @@ class NLPProcessor:
             # Load English language model
             # Note: In production, you'd want to download this model first:
             # python -m spacy download en_core_web_lg
-            self.nlp = spacy.load("en_core_web_sm")  # Using small model for now
+            self.nlp = _load_nlp()  # Using small model for now
             
-            # Initialize matcher for custom patterns
-            self.matcher = Matcher(self.nlp.vocab)
-            self._setup_custom_patterns()
+            # Matchers for custom patterns, built once per process
+            self.matcher, self.phrase_matcher = _load_matchers()
+            self._vocab_size_at_load = len(self.nlp.vocab.strings)
             
             logger.info("NLP models initialized successfully")
             
@@ -48,49 +409,25 @@ class NLPProcessor:
             logger.warning("spaCy model not found, using basic processing")
             self.nlp = None
             self.matcher = None
+            self.phrase_matcher = None
     
-    def _setup_custom_patterns(self):
-        """Setup custom patterns for business and financial entities"""
-        if not self.matcher:
+    def _check_vocab_growth(self):
+        """Reload the model once its string store has grown past the limit
+        
+        Docs already parsed keep a reference to the old vocab and stay valid.
+        """
+        nlp = self.nlp
+        if nlp is None or len(nlp.vocab.strings) - self._vocab_size_at_load <= SPACY_MAX_NEW_VOCAB_STRINGS:
             return
         
-        # Financial metrics patterns
-        financial_patterns = [
-            [{"LOWER": {"IN": ["revenue", "income", "sales"]}},
-             {"IS_CURRENCY": True, "OP": "?"},
-             {"LIKE_NUM": True, "OP": "?"}],
-            [{"LOWER": {"IN": ["profit", "loss", "ebitda"]}},
-             {"IS_CURRENCY": True, "OP": "?"},
-             {"LIKE_NUM": True, "OP": "?"}],
-            [{"LOWER": {"IN": ["valuation", "funding", "investment"]}},
-             {"IS_CURRENCY": True, "OP": "?"},
-             {"LIKE_NUM": True, "OP": "?"}],
-            [{"LOWER": {"IN": ["burn", "runway"]}},
-             {"LOWER": "rate", "OP": "?"},
-             {"IS_CURRENCY": True, "OP": "?"},
-             {"LIKE_NUM": True, "OP": "?"}],
-        ]
-        
-        # Business model patterns
-        business_patterns = [
-            [{"LOWER": {"IN": ["b2b", "b2c", "b2b2c"]}},
-            [{"LOWER": "business"}, {"LOWER": "model"}],
-            [{"LOWER": {"IN": ["saas", "marketplace", "platform"]}},
-            [{"LOWER": {"IN": ["subscription", "freemium", "transaction"]}}, {"LOWER": "model", "OP": "?"}],
-        ]
-        
-        # Market patterns
-        market_patterns = [
-            [{"LOWER": {"IN": ["tam", "sam", "som"]}},
-            [{"LOWER": "total"}, {"LOWER": "addressable"}, {"LOWER": "market"}],
-            [{"LOWER": "market"}, {"LOWER": {"IN": ["size", "opportunity", "share"]}},
-            [{"LOWER": {"IN": ["competitor", "competition", "competitive"]}},
-        ]
-        
-        # Add patterns to matcher
-        self.matcher.add("FINANCIAL_METRICS", financial_patterns)
-        self.matcher.add("BUSINESS_MODEL", business_patterns)
-        self.matcher.add("MARKET_INFO", market_patterns)
+        with self._reload_lock:
+            if self.nlp is not nlp:
+                return  # Another thread already reloaded
+            
+            logger.info(f"Reloading spaCy model after vocab grew to {len(nlp.vocab.strings)} strings")
+            _load_nlp.cache_clear()
+            _load_matchers.cache_clear()
+            self._initialize_models()
     
     async def analyze_text(self, text: str, document_type: str = "general") -> Dict[str, Any]:
         """
@@ -105,53 +442,220 @@ class NLPProcessor:
         """
         logger.info(f"Starting NLP analysis for {document_type} document")
         
-        if not text or len(text.strip()) == 0:
+        if not text or text.isspace():
             return self._empty_analysis_result()
         
         try:
             # Basic text preprocessing
             cleaned_text = self._preprocess_text(text)
+            return await self._analyze_cleaned_text(text, cleaned_text, document_type)
             
-            # Perform different analyses
-            entities = await self._extract_entities(cleaned_text)
-            financial_metrics = await self._extract_financial_metrics(cleaned_text)
-            business_insights = await self._extract_business_insights(cleaned_text)
-            market_analysis = await self._extract_market_information(cleaned_text)
-            team_information = await self._extract_team_information(cleaned_text)
-            risk_factors = await self._identify_risk_factors(cleaned_text)
-            sentiment = await self._analyze_sentiment(cleaned_text)
+        except Exception as e:
+            logger.error(f"NLP analysis failed: {str(e)}")
+            raise NLPProcessingError(f"Text analysis failed: {str(e)}")
+    
+    async def analyze_texts(self, texts: List[str], document_type: str = "general") -> List[Dict[str, Any]]:
+        """
+        Analyze several texts, running the spaCy model over them as one batch
+        
+        Args:
+            texts: Text contents to analyze
+            document_type: Type of the documents (pitch_deck, financial_model, business_plan)
+            
+        Returns:
+            One analysis result per text, in input order
+        """
+        logger.info(f"Starting NLP analysis for {len(texts)} {document_type} documents")
+        
+        try:
+            cleaned_texts = [
+                self._preprocess_text(text) if text and not text.isspace() else None
+                for text in texts
+            ]
             
-            # Document-specific analysis
-            document_classification = self._classify_document_type(cleaned_text)
-            key_topics = await self._extract_key_topics(cleaned_text)
+            docs = [None] * len(texts)
+            if self.nlp and 'entities' in _get_extractors(document_type):
+                to_parse = [i for i, cleaned_text in enumerate(cleaned_texts) if cleaned_text is not None]
+                parsed = await self._run_in_thread(
+                    self._parse_batch, [cleaned_texts[i] for i in to_parse]
+                )
+                for i, doc in zip(to_parse, parsed):
+                    docs[i] = doc
             
-            return {
-                'text_analysis': {
-                    'original_length': len(text),
-                    'processed_length': len(cleaned_text),
-                    'word_count': len(cleaned_text.split()),
-                    'sentence_count': len(self._split_sentences(cleaned_text)),
-                    'language': 'en',  # Could be detected automatically
-                    'readability_score': self._calculate_readability(cleaned_text)
-                },
-                'entities': entities,
-                'financial_metrics': financial_metrics,
-                'business_insights': business_insights,
-                'market_analysis': market_analysis,
-                'team_information': team_information,
-                'risk_factors': risk_factors,
-                'sentiment': sentiment,
-                'document_classification': document_classification,
-                'key_topics': key_topics,
-                'confidence_score': self._calculate_overall_confidence(entities, financial_metrics, business_insights)
+            results = []
+            for text, cleaned_text, doc in zip(texts, cleaned_texts, docs):
+                if cleaned_text is None:
+                    results.append(self._empty_analysis_result())
+                else:
+                    results.append(await self._analyze_cleaned_text(text, cleaned_text, document_type, doc))
+            return results
+            
+        except Exception as e:
+            logger.error(f"NLP batch analysis failed: {str(e)}")
+            raise NLPProcessingError(f"Text analysis failed: {str(e)}")
+    
+    async def analyze_many(self, texts: List[str], document_type: str = "general") -> List[Dict[str, Any]]:
+        """
+        Analyze a large batch of texts across the analysis worker processes
+        
+        Unlike analyze_texts, which parses in this process, each text is
+        analyzed whole in a worker with its own copy of the model, so
+        regex and spaCy work isn't serialized behind one GIL.
+        
+        Args:
+            texts: Text contents to analyze
+            document_type: Type of the documents (pitch_deck, financial_model, business_plan)
+            
+        Returns:
+            One analysis result per text, in input order
+        """
+        logger.info(f"Starting NLP analysis for {len(texts)} {document_type} documents in worker processes")
+        
+        loop = asyncio.get_running_loop()
+        pool = _get_process_pool()
+        return await asyncio.gather(*[
+            loop.run_in_executor(pool, _analyze_in_worker, text, document_type)
+            for text in texts
+        ])
+    
+    def _parse_batch(self, texts: List[str]) -> list:
+        """Parse texts with the spaCy model in batches; runs in the NLP thread pool"""
+        docs = list(self.nlp.pipe(texts, batch_size=SPACY_BATCH_SIZE, n_process=1))
+        self._check_vocab_growth()
+        return docs
+    
+    async def _run_in_thread(self, func, *args):
+        """Run a synchronous extractor in the NLP thread pool, off the event loop"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_get_thread_pool(), func, *args)
+    
+    async def _analyze_cleaned_text(
+        self,
+        text: str,
+        cleaned_text: str,
+        document_type: str = "general",
+        doc=None
+    ) -> Dict[str, Any]:
+        """Run the document type's extractors over preprocessed text
+        
+        ``doc`` is the spaCy parse of ``cleaned_text`` when the caller already
+        has one (batch analysis); otherwise it is parsed here.
+        """
+        # Several extractors read the keyword and token scans; run each scan once here
+        # and pass the results in, rather than have every extractor rescan the text
+        keyword_hits = await self._run_in_thread(_find_keywords, cleaned_text)
+        token_counts = await self._run_in_thread(_count_tokens, cleaned_text)
+        
+        # Word and sentence splits are shared by the text statistics below
+        words, sentences = await self._run_in_thread(self._split_words_and_sentences, cleaned_text)
+        
+        extractors = {
+            'entities': lambda: self._extract_entities(cleaned_text, keyword_hits, doc),
+            'financial_metrics': lambda: self._extract_financial_metrics(cleaned_text),
+            'business_insights': lambda: self._extract_business_insights(cleaned_text, keyword_hits),
+            'market_analysis': lambda: self._extract_market_information(cleaned_text),
+            'team_information': lambda: self._extract_team_information(cleaned_text),
+            'risk_factors': lambda: self._identify_risk_factors(cleaned_text),
+            'sentiment': lambda: self._analyze_sentiment(cleaned_text, token_counts, len(words)),
+            'key_topics': lambda: self._extract_key_topics(token_counts, keyword_hits)
+        }
+        
+        # Perform different analyses; they share no state, so run them together
+        names = _get_extractors(document_type)
+        results = await asyncio.gather(*[extractors[name]() for name in names])
+        
+        return self._build_analysis_result(
+            text, cleaned_text, words, sentences, token_counts, keyword_hits, dict(zip(names, results))
+        )
+    
+    def analyze_text_sync(self, text: str, document_type: str = "general") -> Dict[str, Any]:
+        """Synchronous analyze_text, running each extractor in turn; used by
+        the analysis worker processes"""
+        if not text or text.isspace():
+            return self._empty_analysis_result()
+        
+        try:
+            cleaned_text = self._preprocess_text(text)
+            keyword_hits = _find_keywords(cleaned_text)
+            token_counts = _count_tokens(cleaned_text)
+            words, sentences = self._split_words_and_sentences(cleaned_text)
+            
+            extractors = {
+                'entities': lambda: self._extract_entities_sync(cleaned_text, keyword_hits),
+                'financial_metrics': lambda: self._extract_financial_metrics_sync(cleaned_text),
+                'business_insights': lambda: self._extract_business_insights_sync(cleaned_text, keyword_hits),
+                'market_analysis': lambda: self._extract_market_information_sync(cleaned_text),
+                'team_information': lambda: self._extract_team_information_sync(cleaned_text),
+                'risk_factors': lambda: self._identify_risk_factors_sync(cleaned_text),
+                'sentiment': lambda: self._analyze_sentiment_sync(cleaned_text, token_counts, len(words)),
+                'key_topics': lambda: self._extract_key_topics_sync(token_counts, keyword_hits)
             }
             
+            return self._build_analysis_result(
+                text, cleaned_text, words, sentences, token_counts, keyword_hits, {
+                    name: extractors[name]() for name in _get_extractors(document_type)
+                }
+            )
+            
         except Exception as e:
             logger.error(f"NLP analysis failed: {str(e)}")
             raise NLPProcessingError(f"Text analysis failed: {str(e)}")
     
-    async def _extract_entities(self, text: str) -> Dict[str, List[Dict[str, Any]]]:
+    def _build_analysis_result(
+        self,
+        text: str,
+        cleaned_text: str,
+        words: List[str],
+        sentences: List[str],
+        token_counts: Counter,
+        keyword_hits: FrozenSet[str],
+        extracted: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Combine the extractor outputs with text statistics and document classification
+        
+        Extractors that weren't run for the document type get their empty result.
+        """
+        empty = self._empty_analysis_result()
+        extracted = {name: extracted.get(name, empty[name]) for name in ALL_EXTRACTORS}
+        
+        # Document-specific analysis
+        document_classification = self._classify_document_type(token_counts, keyword_hits)
+        
+        return {
+            'text_analysis': {
+                'original_length': len(text),
+                'processed_length': len(cleaned_text),
+                'word_count': len(words),
+                'sentence_count': len(sentences),
+                'language': 'en',  # Could be detected automatically
+                'readability_score': self._calculate_readability(cleaned_text, words, sentences)
+            },
+            'entities': extracted['entities'],
+            'financial_metrics': extracted['financial_metrics'],
+            'business_insights': extracted['business_insights'],
+            'market_analysis': extracted['market_analysis'],
+            'team_information': extracted['team_information'],
+            'risk_factors': extracted['risk_factors'],
+            'sentiment': extracted['sentiment'],
+            'document_classification': document_classification,
+            'key_topics': extracted['key_topics'],
+            'confidence_score': self._calculate_overall_confidence(
+                sum(map(len, extracted['entities'].values())),
+                sum(map(len, extracted['financial_metrics'].values())),
+                sum(map(bool, extracted['business_insights'].values()))
+            )
+        }
+    
+    async def _extract_entities(
+        self, text: str, keyword_hits: FrozenSet[str], doc=None
+    ) -> Dict[str, List[Dict[str, Any]]]:
         """Extract named entities from text"""
+        return await self._run_in_thread(self._extract_entities_sync, text, keyword_hits, doc)
+    
+    def _extract_entities_sync(
+        self, text: str, keyword_hits: FrozenSet[str], doc=None
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Extract named entities from text; runs in the NLP thread pool"""
         entities = {
             'organizations': [],
             'people': [],
@@ -166,40 +670,32 @@ class NLPProcessor:
             return entities
         
         try:
-            doc = self.nlp(text)
+            if doc is None:
+                doc = self.nlp(text)
+                self._check_vocab_growth()
             
             for ent in doc.ents:
-                entity_info = {
+                # Categorize entities
+                label = ent.label_
+                bucket = _LABEL_TO_BUCKET.get(label)
+                if bucket is None:
+                    continue
+                
+                entities[bucket].append({
                     'text': ent.text,
-                    'label': ent.label_,
+                    'label': label,
                     'start': ent.start_char,
                     'end': ent.end_char,
                     'confidence': getattr(ent, 'confidence', 0.8)
-                }
-                
-                # Categorize entities
-                if ent.label_ in ['ORG', 'CORP']:
-                    entities['organizations'].append(entity_info)
-                elif ent.label_ in ['PERSON', 'PER']:
-                    entities['people'].append(entity_info)
-                elif ent.label_ in ['GPE', 'LOC', 'LOCATION']:
-                    entities['locations'].append(entity_info)
-                elif ent.label_ in ['MONEY', 'CURRENCY']:
-                    entities['money'].append(entity_info)
-                elif ent.label_ in ['DATE', 'TIME']:
-                    entities['dates'].append(entity_info)
-                elif ent.label_ in ['PRODUCT', 'WORK_OF_ART']:
-                    entities['products'].append(entity_info)
-            
-            # Extract technology-related terms
-            tech_keywords = ['ai', 'ml', 'blockchain', 'iot', 'saas', 'api', 'cloud', 'mobile', 'web', 'app']
-            for keyword in tech_keywords:
-                if keyword.lower() in text.lower():
-                    entities['technologies'].append({
-                        'text': keyword,
-                        'label': 'TECHNOLOGY',
-                        'confidence': 0.7
-                    })
+                })
+            
+            # Extract technology-related terms; set lookups against the
+            # shared keyword scan, in _TECH_KEYWORDS order
+            entities['technologies'] = [
+                {'text': keyword, 'label': 'TECHNOLOGY', 'confidence': 0.7}
+                for keyword in _TECH_KEYWORDS
+                if keyword in keyword_hits
+            ]
             
             return entities
             
@@ -209,6 +705,10 @@ class NLPProcessor:
     
     async def _extract_financial_metrics(self, text: str) -> Dict[str, List[Dict[str, Any]]]:
         """Extract financial metrics and numbers from text"""
+        return await self._run_in_thread(self._extract_financial_metrics_sync, text)
+    
+    def _extract_financial_metrics_sync(self, text: str) -> Dict[str, List[Dict[str, Any]]]:
+        """Extract financial metrics and numbers from text; runs in the NLP thread pool"""
         financial_metrics = {
             'revenue_metrics': [],
             'funding_metrics': [],
@@ -218,70 +718,15 @@ class NLPProcessor:
         }
         
         try:
-            # Revenue patterns
-            revenue_patterns = [
-                r'revenue[:\s]+\$?([0-9,]+(?:\.[0-9]+)?)\s*([kmb]?)',
-                r'sales[:\s]+\$?([0-9,]+(?:\.[0-9]+)?)\s*([kmb]?)',
-                r'income[:\s]+\$?([0-9,]+(?:\.[0-9]+)?)\s*([kmb]?)',
-                r'\$([0-9,]+(?:\.[0-9]+)?)\s*([kmb]?)\s+revenue',
-            ]
-            
-            for pattern in revenue_patterns:
-                matches = re.finditer(pattern, text, re.IGNORECASE)
-                for match in matches:
-                    amount = match.group(1).replace(',', '')
-                    unit = match.group(2).lower() if len(match.groups()) > 1 else ''
-                    
-                    financial_metrics['revenue_metrics'].append({
-                        'type': 'revenue',
-                        'amount': float(amount),
-                        'unit': unit,
-                        'text': match.group(0),
-                        'confidence': 0.8
-                    })
-            
-            # Funding patterns
-            funding_patterns = [
-                r'raised[:\s]+\$?([0-9,]+(?:\.[0-9]+)?)\s*([kmb]?)',
-                r'funding[:\s]+\$?([0-9,]+(?:\.[0-9]+)?)\s*([kmb]?)',
-                r'investment[:\s]+\$?([0-9,]+(?:\.[0-9]+)?)\s*([kmb]?)',
-                r'series\s+[abc][:\s]+\$?([0-9,]+(?:\.[0-9]+)?)\s*([kmb]?)',
-            ]
-            
-            for pattern in funding_patterns:
-                matches = re.finditer(pattern, text, re.IGNORECASE)
-                for match in matches:
-                    amount = match.group(1).replace(',', '')
-                    unit = match.group(2).lower() if len(match.groups()) > 1 else ''
-                    
-                    financial_metrics['funding_metrics'].append({
-                        'type': 'funding',
-                        'amount': float(amount),
-                        'unit': unit,
-                        'text': match.group(0),
-                        'confidence': 0.8
-                    })
-            
-            # Valuation patterns
-            valuation_patterns = [
-                r'valuation[:\s]+\$?([0-9,]+(?:\.[0-9]+)?)\s*([kmb]?)',
-                r'valued\s+at[:\s]+\$?([0-9,]+(?:\.[0-9]+)?)\s*([kmb]?)',
-                r'worth[:\s]+\$?([0-9,]+(?:\.[0-9]+)?)\s*([kmb]?)',
-            ]
-            
-            for pattern in valuation_patterns:
-                matches = re.finditer(pattern, text, re.IGNORECASE)
-                for match in matches:
-                    amount = match.group(1).replace(',', '')
-                    unit = match.group(2).lower() if len(match.groups()) > 1 else ''
-                    
-                    financial_metrics['valuation_metrics'].append({
-                        'type': 'valuation',
-                        'amount': float(amount),
-                        'unit': unit,
-                        'text': match.group(0),
-                        'confidence': 0.8
-                    })
+            # One pass over the text for every metric pattern
+            for match in _FINANCIAL_RE.finditer(text):
+                bucket, metric_type = _FINANCIAL_BUCKETS[match.lastgroup]
+                financial_metrics[bucket].append({
+                    'type': metric_type,
+                    'amount': _parse_amount(match),
+                    'text': match.group(0),
+                    'confidence': 0.8
+                })
             
             return financial_metrics
             
@@ -289,8 +734,12 @@ class NLPProcessor:
             logger.error(f"Financial metrics extraction failed: {str(e)}")
             return financial_metrics
     
-    async def _extract_business_insights(self, text: str) -> Dict[str, Any]:
+    async def _extract_business_insights(self, text: str, keyword_hits: FrozenSet[str]) -> Dict[str, Any]:
         """Extract business model and strategy insights"""
+        return await self._run_in_thread(self._extract_business_insights_sync, text, keyword_hits)
+    
+    def _extract_business_insights_sync(self, text: str, keyword_hits: FrozenSet[str]) -> Dict[str, Any]:
+        """Extract business model and strategy insights; runs in the NLP thread pool"""
         insights = {
             'business_model': None,
             'revenue_model': None,
@@ -301,40 +750,24 @@ class NLPProcessor:
         
         try:
             # Business model detection
-            business_models = {
-                'saas': ['saas', 'software as a service', 'subscription software'],
-                'marketplace': ['marketplace', 'platform', 'two-sided market'],
-                'e-commerce': ['e-commerce', 'online store', 'retail'],
-                'fintech': ['fintech', 'financial technology', 'payments'],
-                'healthtech': ['healthtech', 'medical', 'healthcare'],
-                'edtech': ['edtech', 'education', 'learning platform']
-            }
-            
-            text_lower = text.lower()
-            for model, keywords in business_models.items():
-                if any(keyword in text_lower for keyword in keywords):
+            for model, keywords in _BUSINESS_MODELS.items():
+                if not keyword_hits.isdisjoint(keywords):
                     insights['business_model'] = model
                     break
             
             # Revenue model detection
-            revenue_models = {
-                'subscription': ['subscription', 'monthly fee', 'recurring'],
-                'transaction': ['transaction fee', 'commission', 'per transaction'],
-                'freemium': ['freemium', 'free tier', 'premium features'],
-                'advertising': ['advertising', 'ads', 'sponsored content'],
-                'licensing': ['licensing', 'license fee', 'royalty']
-            }
-            
-            for model, keywords in revenue_models.items():
-                if any(keyword in text_lower for keyword in keywords):
+            for model, keywords in _REVENUE_MODELS.items():
+                if not keyword_hits.isdisjoint(keywords):
                     insights['revenue_model'] = model
                     break
             
             # Extract target market mentions
-            market_indicators = ['target market', 'customer segment', 'user base', 'audience']
-            for indicator in market_indicators:
-                if indicator in text_lower:
+            text_lower = None
+            for indicator in _MARKET_INDICATORS:
+                if indicator in keyword_hits:
                     # Extract surrounding context
+                    if text_lower is None:
+                        text_lower = text.lower()
                     start = text_lower.find(indicator)
                     context = text[max(0, start-50):start+200]
                     insights['target_market'].append(context.strip())
@@ -347,6 +780,10 @@ class NLPProcessor:
     
     async def _extract_market_information(self, text: str) -> Dict[str, Any]:
         """Extract market size, competition, and opportunity information"""
+        return await self._run_in_thread(self._extract_market_information_sync, text)
+    
+    def _extract_market_information_sync(self, text: str) -> Dict[str, Any]:
+        """Extract market size, competition, and opportunity information; runs in the NLP thread pool"""
         market_info = {
             'market_size': [],
             'competitors': [],
@@ -356,31 +793,16 @@ class NLPProcessor:
         
         try:
             # Market size patterns
-            market_size_patterns = [
-                r'market size[:\s]+\$?([0-9,]+(?:\.[0-9]+)?)\s*([kmb]?)',
-                r'tam[:\s]+\$?([0-9,]+(?:\.[0-9]+)?)\s*([kmb]?)',
-                r'total addressable market[:\s]+\$?([0-9,]+(?:\.[0-9]+)?)\s*([kmb]?)',
-            ]
-            
-            for pattern in market_size_patterns:
-                matches = re.finditer(pattern, text, re.IGNORECASE)
-                for match in matches:
-                    market_info['market_size'].append({
-                        'amount': match.group(1),
-                        'unit': match.group(2) if len(match.groups()) > 1 else '',
-                        'context': match.group(0)
-                    })
+            for match in _MARKET_SIZE_RE.finditer(text):
+                market_info['market_size'].append({
+                    'amount': _parse_amount(match),
+                    'context': match.group(0)
+                })
             
             # Competitor detection
-            competitor_indicators = ['competitor', 'competition', 'rival', 'alternative']
-            for indicator in competitor_indicators:
-                if indicator in text.lower():
-                    # Extract surrounding context for competitor names
-                    pattern = rf'{indicator}[s]?[:\s]+([A-Z][a-zA-Z\s]+(?:,\s*[A-Z][a-zA-Z\s]+)*)'
-                    matches = re.finditer(pattern, text, re.IGNORECASE)
-                    for match in matches:
-                        competitors = [comp.strip() for comp in match.group(1).split(',')]
-                        market_info['competitors'].extend(competitors)
+            for match in _COMPETITOR_RE.finditer(text):
+                competitors = [comp.strip() for comp in match.group(1).split(',')]
+                market_info['competitors'].extend(competitors)
             
             return market_info
             
@@ -390,6 +812,10 @@ class NLPProcessor:
     
     async def _extract_team_information(self, text: str) -> Dict[str, Any]:
         """Extract information about the founding team and key personnel"""
+        return await self._run_in_thread(self._extract_team_information_sync, text)
+    
+    def _extract_team_information_sync(self, text: str) -> Dict[str, Any]:
+        """Extract information about the founding team and key personnel; runs in the NLP thread pool"""
         team_info = {
             'founders': [],
             'key_personnel': [],
@@ -399,34 +825,19 @@ class NLPProcessor:
         
         try:
             # Founder patterns
-            founder_patterns = [
-                r'founder[s]?[:\s]+([A-Z][a-zA-Z\s]+)',
-                r'co-founder[s]?[:\s]+([A-Z][a-zA-Z\s]+)',
-                r'ceo[:\s]+([A-Z][a-zA-Z\s]+)',
-                r'founded by[:\s]+([A-Z][a-zA-Z\s]+)',
-            ]
-            
-            for pattern in founder_patterns:
-                matches = re.finditer(pattern, text, re.IGNORECASE)
-                for match in matches:
-                    team_info['founders'].append({
-                        'name': match.group(1).strip(),
-                        'role': 'founder',
-                        'context': match.group(0)
-                    })
-            
-            # Team size patterns
-            team_size_patterns = [
-                r'team of ([0-9]+)',
-                r'([0-9]+) employees',
-                r'([0-9]+) team members',
-            ]
+            for match in _FOUNDER_RE.finditer(text):
+                team_info['founders'].append({
+                    'name': match.group(match.lastindex + 1).strip(),
+                    'role': 'founder',
+                    'context': match.group(0)
+                })
             
-            for pattern in team_size_patterns:
-                match = re.search(pattern, text, re.IGNORECASE)
-                if match:
-                    team_info['team_size'] = int(match.group(1))
-                    break
+            # Team size patterns: first match of each, earliest pattern wins
+            team_sizes = {}
+            for match in _TEAM_SIZE_RE.finditer(text):
+                team_sizes.setdefault(match.lastindex, int(match.group(match.lastindex + 1)))
+            if team_sizes:
+                team_info['team_size'] = team_sizes[min(team_sizes)]
             
             return team_info
             
@@ -436,34 +847,28 @@ class NLPProcessor:
     
     async def _identify_risk_factors(self, text: str) -> List[Dict[str, Any]]:
         """Identify potential risk factors mentioned in the text"""
+        return await self._run_in_thread(self._identify_risk_factors_sync, text)
+    
+    def _identify_risk_factors_sync(self, text: str) -> List[Dict[str, Any]]:
+        """Identify potential risk factors mentioned in the text; runs in the NLP thread pool"""
         risk_factors = []
         
         try:
-            # Risk keywords and categories
-            risk_categories = {
-                'market': ['market risk', 'competition', 'market downturn', 'demand risk'],
-                'financial': ['cash flow', 'funding', 'burn rate', 'profitability'],
-                'operational': ['scalability', 'operations', 'supply chain', 'execution'],
-                'regulatory': ['regulation', 'compliance', 'legal', 'policy'],
-                'technology': ['technical risk', 'security', 'platform', 'infrastructure'],
-                'team': ['key person', 'talent', 'hiring', 'retention']
-            }
-            
-            text_lower = text.lower()
-            for category, keywords in risk_categories.items():
-                for keyword in keywords:
-                    if keyword in text_lower:
-                        # Extract context around the risk mention
-                        start = text_lower.find(keyword)
-                        context = text[max(0, start-100):start+100]
-                        
-                        risk_factors.append({
-                            'category': category,
-                            'keyword': keyword,
-                            'context': context.strip(),
-                            'severity': 'medium',  # Could be determined by additional analysis
-                            'confidence': 0.7
-                        })
+            # Every mention of every risk keyword, in one pass
+            for match in _RISK_RE.finditer(text):
+                category, keyword = _RISK_KEYWORDS[match.lastgroup]
+                
+                # Extract context around the risk mention
+                start = match.start()
+                context = text[max(0, start-100):start+100]
+                
+                risk_factors.append({
+                    'category': category,
+                    'keyword': keyword,
+                    'context': context.strip(),
+                    'severity': 'medium',  # Could be determined by additional analysis
+                    'confidence': 0.7
+                })
             
             return risk_factors
             
@@ -471,17 +876,21 @@ class NLPProcessor:
             logger.error(f"Risk factor identification failed: {str(e)}")
             return risk_factors
     
-    async def _analyze_sentiment(self, text: str) -> Dict[str, Any]:
+    async def _analyze_sentiment(
+        self, text: str, token_counts: Counter, word_count: Optional[int] = None
+    ) -> Dict[str, Any]:
         """Analyze overall sentiment of the text"""
+        return await self._run_in_thread(self._analyze_sentiment_sync, text, token_counts, word_count)
+    
+    def _analyze_sentiment_sync(
+        self, text: str, token_counts: Counter, word_count: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Analyze overall sentiment of the text; runs in the NLP thread pool"""
         # Basic sentiment analysis (in production, you'd use a proper sentiment model)
-        positive_words = ['growth', 'success', 'opportunity', 'strong', 'excellent', 'innovative', 'leading']
-        negative_words = ['risk', 'challenge', 'problem', 'decline', 'loss', 'difficult', 'concern']
+        positive_count = sum(token_counts[word] for word in _POSITIVE_WORDS)
+        negative_count = sum(token_counts[word] for word in _NEGATIVE_WORDS)
         
-        text_lower = text.lower()
-        positive_count = sum(1 for word in positive_words if word in text_lower)
-        negative_count = sum(1 for word in negative_words if word in text_lower)
-        
-        total_words = len(text.split())
+        total_words = len(text.split()) if word_count is None else word_count
         positive_ratio = positive_count / total_words if total_words > 0 else 0
         negative_ratio = negative_count / total_words if total_words > 0 else 0
         
@@ -504,25 +913,23 @@ class NLPProcessor:
             'negative_ratio': negative_ratio
         }
     
-    async def _extract_key_topics(self, text: str) -> List[Dict[str, Any]]:
-        """Extract key topics and themes from the text"""
+    async def _extract_key_topics(
+        self, token_counts: Counter, keyword_hits: FrozenSet[str]
+    ) -> List[Dict[str, Any]]:
+        """Extract key topics and themes from the text's token counts and keyword hits"""
+        return await self._run_in_thread(self._extract_key_topics_sync, token_counts, keyword_hits)
+    
+    def _extract_key_topics_sync(
+        self, token_counts: Counter, keyword_hits: FrozenSet[str]
+    ) -> List[Dict[str, Any]]:
+        """Extract key topics and themes from the text's token counts and keyword hits; runs in the NLP thread pool"""
         # Simple keyword-based topic extraction
         # In production, you'd use more sophisticated topic modeling
         
-        topic_keywords = {
-            'technology': ['ai', 'machine learning', 'blockchain', 'iot', 'cloud', 'mobile', 'web'],
-            'business': ['revenue', 'profit', 'growth', 'market', 'customer', 'sales'],
-            'finance': ['funding', 'investment', 'valuation', 'cash flow', 'burn rate'],
-            'product': ['product', 'feature', 'platform', 'solution', 'service'],
-            'market': ['market', 'industry', 'sector', 'competition', 'opportunity'],
-            'team': ['team', 'founder', 'employee', 'talent', 'experience']
-        }
-        
         topics = []
-        text_lower = text.lower()
         
-        for topic, keywords in topic_keywords.items():
-            keyword_count = sum(1 for keyword in keywords if keyword in text_lower)
+        for topic, keywords in _TOPIC_KEYWORDS.items():
+            keyword_count = _count_keywords_present(_TOPIC_KEYWORD_SPLITS[topic], token_counts, keyword_hits)
             if keyword_count > 0:
                 topics.append({
                     'topic': topic,
@@ -537,23 +944,41 @@ class NLPProcessor:
     def _preprocess_text(self, text: str) -> str:
         """Clean and preprocess text for analysis"""
         # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text)
+        text = _WHITESPACE_RE.sub(' ', text)
         
         # Remove special characters but keep punctuation
-        text = re.sub(r'[^\w\s\.\,\!\?\;\:\-\(\)\$\%]', '', text)
+        if text.isascii():
+            text = text.translate(_ASCII_SPECIAL_CHARACTERS)
+        else:
+            text = _SPECIAL_CHARACTER_RE.sub('', text)
         
         return text.strip()
     
     def _split_sentences(self, text: str) -> List[str]:
         """Split text into sentences"""
         # Simple sentence splitting
-        sentences = re.split(r'[.!?]+', text)
-        return [s.strip() for s in sentences if s.strip()]
+        sentences = _SENTENCE_END_RE.split(text)
+        return [s for s in map(str.strip, sentences) if s]
     
-    def _calculate_readability(self, text: str) -> float:
-        """Calculate basic readability score"""
-        words = text.split()
-        sentences = self._split_sentences(text)
+    def _split_words_and_sentences(self, text: str) -> Tuple[List[str], List[str]]:
+        """Split text into words and sentences"""
+        return text.split(), self._split_sentences(text)
+    
+    def _calculate_readability(
+        self,
+        text: str,
+        words: Optional[List[str]] = None,
+        sentences: Optional[List[str]] = None
+    ) -> float:
+        """Calculate basic readability score
+        
+        ``words`` and ``sentences`` are the splits of ``text`` when the caller
+        already has them.
+        """
+        if words is None:
+            words = text.split()
+        if sentences is None:
+            sentences = self._split_sentences(text)
         
         if len(sentences) == 0 or len(words) == 0:
             return 0.0
@@ -565,22 +990,20 @@ class NLPProcessor:
         readability = max(0, 1 - (avg_sentence_length / 20) - (avg_word_length / 10))
         return min(readability, 1.0)
     
-    def _calculate_overall_confidence(self, entities: Dict, financial_metrics: Dict, business_insights: Dict) -> float:
-        """Calculate overall confidence score for the analysis"""
+    def _calculate_overall_confidence(self, total_entities: int, total_financial: int, insights_found: int) -> float:
+        """Calculate overall confidence score for the analysis from the number
+        of entities, financial metrics and non-empty business insights found"""
         confidence_factors = []
         
         # Entity extraction confidence
-        total_entities = sum(len(ent_list) for ent_list in entities.values())
         if total_entities > 0:
             confidence_factors.append(min(total_entities / 10, 1.0))
         
         # Financial metrics confidence
-        total_financial = sum(len(metric_list) for metric_list in financial_metrics.values())
         if total_financial > 0:
             confidence_factors.append(min(total_financial / 5, 1.0))
         
         # Business insights confidence
-        insights_found = sum(1 for value in business_insights.values() if value)
         if insights_found > 0:
             confidence_factors.append(min(insights_found / 3, 1.0))
         
@@ -589,21 +1012,12 @@ class NLPProcessor:
         
         return sum(confidence_factors) / len(confidence_factors)
     
-    def _classify_document_type(self, text: str) -> Dict[str, Any]:
-        """Classify the type of document based on content"""
-        document_types = {
-            'pitch_deck': ['pitch', 'deck', 'presentation', 'slide', 'investment opportunity'],
-            'business_plan': ['business plan', 'executive summary', 'strategy', 'operations'],
-            'financial_model': ['financial model', 'projections', 'forecast', 'revenue model'],
-            'market_analysis': ['market analysis', 'market research', 'competitive analysis'],
-            'technical_document': ['technical', 'architecture', 'development', 'api']
-        }
-        
-        text_lower = text.lower()
+    def _classify_document_type(self, token_counts: Counter, keyword_hits: FrozenSet[str]) -> Dict[str, Any]:
+        """Classify the type of document from its token counts and keyword hits"""
         scores = {}
         
-        for doc_type, keywords in document_types.items():
-            score = sum(1 for keyword in keywords if keyword in text_lower)
+        for doc_type, keywords in _DOCUMENT_TYPES.items():
+            score = _count_keywords_present(_DOCUMENT_TYPE_SPLITS[doc_type], token_counts, keyword_hits)
             if score > 0:
                 scores[doc_type] = score / len(keywords)
         
@@ -686,5 +1100,7 @@ class NLPProcessor:
         }
 
 
-# Global NLP processor instance
-nlp_processor = NLPProcessor()
+@lru_cache(maxsize=1)
+def get_nlp_processor() -> NLPProcessor:
+    """Return the process-wide NLP processor, creating it on first use"""
+    return NLPProcessor()
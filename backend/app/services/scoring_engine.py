@@ -2,22 +2,99 @@
 Scoring engine for investment evaluation and risk assessment
 """
 
-import asyncio
+import bisect
+import copy
+import hashlib
 import logging
 import math
-from typing import Dict, Any, List, Optional, Tuple
+import re
+from collections import OrderedDict
+from typing import Dict, Any, FrozenSet, List, Optional, Tuple
 from datetime import datetime
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
+
+import numpy as np
+import orjson
 
 from app.core.config import settings
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Recent score results, keyed by a fingerprint of their inputs
+SCORE_CACHE_MAX_ENTRIES = 1024
+
+# Key topics that count as trending for the market score
+TRENDING_TOPICS = frozenset({'technology', 'ai', 'blockchain', 'fintech', 'healthtech'})
+
+# Substrings of founder context that indicate prior experience
+EXPERIENCE_INDICATORS = ('experience', 'previous', 'former', 'ex-')
+EXPERIENCE_RE = re.compile("|".join(map(re.escape, EXPERIENCE_INDICATORS)), re.IGNORECASE)
+
+# Substrings of organization names that count as a prestigious background
+PRESTIGIOUS_COMPANIES = (
+    'google', 'microsoft', 'apple', 'amazon', 'facebook', 'meta',
+    'tesla', 'uber', 'airbnb', 'stripe', 'salesforce'
+)
+PRESTIGIOUS_COMPANIES_RE = re.compile("|".join(map(re.escape, PRESTIGIOUS_COMPANIES)), re.IGNORECASE)
+
+# Risk score for each severity (lower is better for risk)
+SEVERITY_SCORES = {'low': 20, 'medium': 50, 'high': 80, 'critical': 95}
+HIGH_SEVERITIES = frozenset({'high', 'critical'})
+
+# Per-category keys of a risk assessment, and the index of each risk
+# category in that order
+RISK_CATEGORY_KEYS = (
+    'market_risk', 'financial_risk', 'operational_risk',
+    'regulatory_risk', 'technology_risk', 'team_risk'
+)
+RISK_CATEGORY_INDEX = {
+    key[:-len('_risk')]: index for index, key in enumerate(RISK_CATEGORY_KEYS)
+}
+
+# Scored dimensions, in the column order score_portfolio expects
+SCORE_DIMENSIONS = ('financial', 'market', 'team', 'product')
+
+# Recommendations from lowest to highest threshold
+RECOMMENDATIONS = ('pass', 'hold', 'buy', 'strong_buy')
+
+# Product development stage indicators and their points; the first one found
+# in this order scores
+DEVELOPMENT_INDICATORS = {
+    'mvp': 10,
+    'prototype': 8,
+    'beta': 12,
+    'launched': 15,
+    'customers': 15,
+    'users': 12,
+    'traction': 15
+}
+VALIDATION_PHRASES = frozenset({'customer feedback', 'user feedback', 'testimonial'})
+SCALABILITY_WORDS = frozenset({'scalable', 'scale', 'growth', 'expand'})
+
+# Every product keyword, found in one case-insensitive pass. Keywords must
+# start a word ("scale" not in "escalate") but may be followed by more
+# letters ("testimonials"). Longer keywords are tried first, so a keyword
+# that is a prefix of another is not reported where the longer one matches.
+# None is today ("scale" and "scalable" share only "scal"); a new keyword
+# that is one is safe only in the same group as the longer keyword.
+PRODUCT_KEYWORD_RE = re.compile(
+    r"\b(" + "|".join(
+        re.escape(keyword)
+        for keyword in sorted({*DEVELOPMENT_INDICATORS, *VALIDATION_PHRASES, *SCALABILITY_WORDS}, key=len, reverse=True)
+    ) + ")",
+    re.IGNORECASE
+)
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class ScoreResult:
-    """Data class for scoring results"""
+    """Data class for scoring results
+    
+    The cache keeps its own copy of each result and hands every caller a
+    copy of the reasoning, so editing a returned result never changes a
+    later cache hit.
+    """
     financial_score: float
     market_score: float
     team_score: float
@@ -29,6 +106,51 @@ class ScoreResult:
     reasoning: Dict[str, Any]
 
 
+@dataclass(slots=True)
+class _ScoringContext:
+    """The parts of an analysis the scorers read, looked up once"""
+    financial_metrics: Dict[str, Any]
+    market_analysis: Dict[str, Any]
+    team_info: Dict[str, Any]
+    business_insights: Dict[str, Any]
+    key_topics: List[Dict[str, Any]]
+    organizations: List[Dict[str, Any]]
+    risk_factors: List[Dict[str, Any]]
+    # Lowercased product keywords found in the document text
+    product_keywords: FrozenSet[str]
+    document_type: str
+    
+    @classmethod
+    def from_inputs(cls, nlp_analysis: Dict[str, Any], document_content: Dict[str, Any]) -> "_ScoringContext":
+        full_text = document_content.get('extracted_content', {}).get('full_text', '')
+        
+        return cls(
+            financial_metrics=nlp_analysis.get('financial_metrics', {}),
+            market_analysis=nlp_analysis.get('market_analysis', {}),
+            team_info=nlp_analysis.get('team_information', {}),
+            business_insights=nlp_analysis.get('business_insights', {}),
+            key_topics=nlp_analysis.get('key_topics', []),
+            organizations=nlp_analysis.get('entities', {}).get('organizations', []),
+            risk_factors=nlp_analysis.get('risk_factors', []),
+            product_keywords=frozenset(keyword.lower() for keyword in PRODUCT_KEYWORD_RE.findall(full_text)),
+            document_type=document_content.get('document_classification', {}).get('document_type', '')
+        )
+    
+    def cache_key_values(self) -> Tuple[Any, ...]:
+        """Every value the scorers read, in a fixed, serializable order"""
+        return (
+            self.financial_metrics,
+            self.market_analysis,
+            self.team_info,
+            self.business_insights,
+            self.key_topics,
+            self.organizations,
+            self.risk_factors,
+            sorted(self.product_keywords),
+            self.document_type
+        )
+
+
 class ScoringEngineError(Exception):
     """Custom exception for scoring engine errors"""
     pass
@@ -52,35 +174,99 @@ class ScoringEngine:
             'hold': 50,
             'pass': 0
         }
+        
+        # Lower bounds of every recommendation above 'pass', in the order of
+        # RECOMMENDATIONS; a score's index among them picks its recommendation
+        self._threshold_breaks = tuple(
+            self.recommendation_thresholds[label] for label in RECOMMENDATIONS[1:]
+        )
+        
+        self._score_cache: "OrderedDict[bytes, ScoreResult]" = OrderedDict()
+    
+    def _fingerprint(self, *values: Any) -> Optional[bytes]:
+        """Stable hash of JSON-like values, or None if they can't be serialized"""
+        try:
+            data = orjson.dumps(values, option=orjson.OPT_SORT_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+        except TypeError:
+            return None
+        return hashlib.blake2b(data, digest_size=16).digest()
     
     async def calculate_investment_score(
         self,
         nlp_analysis: Dict[str, Any],
         document_content: Dict[str, Any],
-        venture_data: Optional[Dict[str, Any]] = None
+        venture_data: Optional[Dict[str, Any]] = None,
+        detailed: bool = True
     ) -> ScoreResult:
         """
         Calculate comprehensive investment score based on multiple dimensions
         
+        Scoring is deterministic, so results are cached by a fingerprint of the
+        analysis values the scorers read and the current weights and
+        thresholds; repeat calls with the same content return the cached
+        ScoreResult, whatever their processing timestamps.
+        
         Args:
             nlp_analysis: Results from NLP analysis
             document_content: Extracted document content
             venture_data: Additional venture information
+            detailed: Compile the reasoning; ranking callers that only read
+                the scores and recommendation pass False and get empty reasoning
             
         Returns:
             ScoreResult with detailed scoring breakdown
         """
+        try:
+            # Look up the analysis sections once for every scorer
+            ctx = _ScoringContext.from_inputs(nlp_analysis, document_content)
+        except Exception as e:
+            logger.error("Scoring calculation failed: %s", e)
+            raise ScoringEngineError(f"Score calculation failed: {str(e)}")
+        
+        confidence = nlp_analysis.get('confidence_score', 0.5)
+        key = self._fingerprint(
+            ctx.cache_key_values(), confidence, detailed,
+            self.weights, self.recommendation_thresholds
+        )
+        
+        if key is not None:
+            cached = self._score_cache.get(key)
+            if cached is not None:
+                self._score_cache.move_to_end(key)
+                logger.info("Investment score served from cache")
+                return self._copy_result(cached)
+        
+        result = await self._calculate_investment_score(ctx, confidence, detailed)
+        
+        if key is not None:
+            self._score_cache[key] = self._copy_result(result)
+            if len(self._score_cache) > SCORE_CACHE_MAX_ENTRIES:
+                self._score_cache.popitem(last=False)
+        
+        return result
+    
+    def _copy_result(self, result: ScoreResult) -> ScoreResult:
+        """A result whose reasoning shares no mutable state with ``result``"""
+        return replace(result, reasoning=copy.deepcopy(result.reasoning))
+    
+    async def _calculate_investment_score(
+        self,
+        ctx: _ScoringContext,
+        confidence: float,
+        detailed: bool = True
+    ) -> ScoreResult:
+        """Score the inputs without consulting the cache"""
         logger.info("Starting investment score calculation")
         
         try:
-            # Calculate individual dimension scores
-            financial_score = await self._calculate_financial_score(nlp_analysis, document_content)
-            market_score = await self._calculate_market_score(nlp_analysis, document_content)
-            team_score = await self._calculate_team_score(nlp_analysis, document_content)
-            product_score = await self._calculate_product_score(nlp_analysis, document_content)
+            # Calculate individual dimension scores and the risk assessment
+            financial_score = self._calculate_financial_score(ctx)
+            market_score = self._calculate_market_score(ctx)
+            team_score = self._calculate_team_score(ctx)
+            product_score = self._calculate_product_score(ctx)
+            risk_factors = self._assess_risk_factors(ctx)
             
             # Calculate risk-adjusted scores
-            risk_factors = await self._assess_risk_factors(nlp_analysis, document_content)
             risk_score = risk_factors['overall_risk_score']
             
             # Apply risk adjustment to individual scores
@@ -100,33 +286,30 @@ class ScoringEngine:
             )
             
             # Calculate confidence interval
-            confidence_interval = self._calculate_confidence_interval(
-                overall_score, nlp_analysis.get('confidence_score', 0.5)
-            )
+            confidence_interval = self._calculate_confidence_interval(overall_score, confidence)
             
             # Generate recommendation
             recommendation = self._generate_recommendation(overall_score)
             
-            # Compile reasoning
-            reasoning = {
-                'financial_reasoning': self._get_financial_reasoning(nlp_analysis, financial_score),
-                'market_reasoning': self._get_market_reasoning(nlp_analysis, market_score),
-                'team_reasoning': self._get_team_reasoning(nlp_analysis, team_score),
-                'product_reasoning': self._get_product_reasoning(nlp_analysis, product_score),
-                'risk_assessment': risk_factors,
-                'key_strengths': self._identify_key_strengths(nlp_analysis, {
-                    'financial': adjusted_financial,
-                    'market': adjusted_market,
-                    'team': adjusted_team,
-                    'product': adjusted_product
-                }),
-                'key_concerns': self._identify_key_concerns(risk_factors, {
-                    'financial': financial_score,
-                    'market': market_score,
-                    'team': team_score,
-                    'product': product_score
-                })
-            }
+            # Generate detailed reasoning, unless the caller only ranks by score
+            reasoning = {}
+            if detailed:
+                reasoning = self._compile_reasoning(
+                    ctx,
+                    risk_factors,
+                    {
+                        'financial': financial_score,
+                        'market': market_score,
+                        'team': team_score,
+                        'product': product_score
+                    },
+                    {
+                        'financial': adjusted_financial,
+                        'market': adjusted_market,
+                        'team': adjusted_team,
+                        'product': adjusted_product
+                    }
+                )
             
             result = ScoreResult(
                 financial_score=round(adjusted_financial, 2),
@@ -140,23 +323,37 @@ class ScoringEngine:
                 reasoning=reasoning
             )
             
-            logger.info(f"Investment score calculation completed: {overall_score:.2f}")
+            logger.info("Investment score calculation completed: %.2f", overall_score)
             return result
             
         except Exception as e:
-            logger.error(f"Scoring calculation failed: {str(e)}")
+            logger.error("Scoring calculation failed: %s", e)
             raise ScoringEngineError(f"Score calculation failed: {str(e)}")
     
-    async def _calculate_financial_score(
-        self, 
-        nlp_analysis: Dict[str, Any], 
-        document_content: Dict[str, Any]
-    ) -> float:
+    def _compile_reasoning(
+        self,
+        ctx: _ScoringContext,
+        risk_factors: Dict[str, Any],
+        scores: Dict[str, float],
+        adjusted_scores: Dict[str, float]
+    ) -> Dict[str, Any]:
+        """Explain the dimension scores, strengths and concerns"""
+        return {
+            'financial_reasoning': self._get_financial_reasoning(ctx, scores['financial']),
+            'market_reasoning': self._get_market_reasoning(ctx, scores['market']),
+            'team_reasoning': self._get_team_reasoning(ctx, scores['team']),
+            'product_reasoning': self._get_product_reasoning(ctx, scores['product']),
+            'risk_assessment': risk_factors,
+            'key_strengths': self._identify_key_strengths(ctx, adjusted_scores),
+            'key_concerns': self._identify_key_concerns(risk_factors, scores)
+        }
+    
+    def _calculate_financial_score(self, ctx: _ScoringContext) -> float:
         """Calculate financial health score (0-100)"""
         score = 50.0  # Base score
         
         try:
-            financial_metrics = nlp_analysis.get('financial_metrics', {})
+            financial_metrics = ctx.financial_metrics
             
             # Revenue metrics analysis
             revenue_metrics = financial_metrics.get('revenue_metrics', [])
@@ -164,31 +361,20 @@ class ScoringEngine:
                 score += 15  # Has revenue data
                 
                 # Check for growth indicators
-                for metric in revenue_metrics:
-                    if metric.get('amount', 0) > 1000000:  # > $1M revenue
-                        score += 10
-                        break
+                if any(metric.get('amount', 0) > 1000000 for metric in revenue_metrics):  # > $1M revenue
+                    score += 10
             
             # Funding metrics analysis
             funding_metrics = financial_metrics.get('funding_metrics', [])
             if funding_metrics:
                 score += 10  # Has funding
                 
-                # Check funding amount
-                for metric in funding_metrics:
-                    amount = metric.get('amount', 0)
-                    unit = metric.get('unit', '').lower()
-                    
-                    # Convert to actual amount
-                    multiplier = {'k': 1000, 'm': 1000000, 'b': 1000000000}.get(unit, 1)
-                    actual_amount = amount * multiplier
-                    
-                    if actual_amount >= 5000000:  # >= $5M funding
-                        score += 15
-                        break
-                    elif actual_amount >= 1000000:  # >= $1M funding
-                        score += 10
-                        break
+                # Check funding amount; the first metric of at least $1M decides
+                amounts = (metric.get('amount', 0) for metric in funding_metrics)
+                amount = next((amount for amount in amounts if amount >= 1000000), None)
+                
+                if amount is not None:
+                    score += 15 if amount >= 5000000 else 10  # >= $5M / >= $1M funding
             
             # Valuation metrics
             valuation_metrics = financial_metrics.get('valuation_metrics', [])
@@ -196,8 +382,7 @@ class ScoringEngine:
                 score += 10  # Has valuation
             
             # Business model sustainability
-            business_insights = nlp_analysis.get('business_insights', {})
-            revenue_model = business_insights.get('revenue_model')
+            revenue_model = ctx.business_insights.get('revenue_model')
             
             if revenue_model in ['subscription', 'saas']:
                 score += 15  # Recurring revenue model
@@ -205,52 +390,39 @@ class ScoringEngine:
                 score += 10  # Scalable model
             
             # Financial document quality
-            if 'financial_model' in document_content.get('document_classification', {}).get('document_type', ''):
+            if 'financial_model' in ctx.document_type:
                 score += 10  # Has financial model document
             
             return min(score, 100.0)
             
         except Exception as e:
-            logger.error(f"Financial score calculation error: {str(e)}")
+            logger.error("Financial score calculation error: %s", e)
             return 50.0
     
-    async def _calculate_market_score(
-        self, 
-        nlp_analysis: Dict[str, Any], 
-        document_content: Dict[str, Any]
-    ) -> float:
+    def _calculate_market_score(self, ctx: _ScoringContext) -> float:
         """Calculate market opportunity score (0-100)"""
         score = 50.0  # Base score
         
         try:
-            market_analysis = nlp_analysis.get('market_analysis', {})
-            business_insights = nlp_analysis.get('business_insights', {})
+            market_analysis = ctx.market_analysis
+            business_insights = ctx.business_insights
             
             # Market size analysis
             market_size = market_analysis.get('market_size', [])
             if market_size:
                 score += 15  # Has market size data
                 
-                for size_info in market_size:
-                    amount = size_info.get('amount', '').replace(',', '')
-                    unit = size_info.get('unit', '').lower()
-                    
-                    try:
-                        amount_num = float(amount)
-                        multiplier = {'k': 1000, 'm': 1000000, 'b': 1000000000}.get(unit, 1)
-                        market_value = amount_num * multiplier
-                        
-                        if market_value >= 10000000000:  # >= $10B market
-                            score += 20
-                            break
-                        elif market_value >= 1000000000:  # >= $1B market
-                            score += 15
-                            break
-                        elif market_value >= 100000000:  # >= $100M market
-                            score += 10
-                            break
-                    except (ValueError, TypeError):
-                        continue
+                # The first market size of at least $100M decides
+                values = (size_info.get('amount', 0) for size_info in market_size)
+                market_value = next((value for value in values if value >= 100000000), None)
+                
+                if market_value is not None:
+                    if market_value >= 10000000000:  # >= $10B market
+                        score += 20
+                    elif market_value >= 1000000000:  # >= $1B market
+                        score += 15
+                    else:  # >= $100M market
+                        score += 10
             
             # Competition analysis
             competitors = market_analysis.get('competitors', [])
@@ -278,30 +450,23 @@ class ScoringEngine:
                 score += 10  # Market timing awareness
             
             # Technology trends alignment
-            key_topics = nlp_analysis.get('key_topics', [])
-            trending_topics = ['technology', 'ai', 'blockchain', 'fintech', 'healthtech']
-            
-            for topic in key_topics:
-                if topic.get('topic') in trending_topics:
+            for topic in ctx.key_topics:
+                if topic.get('topic') in TRENDING_TOPICS:
                     score += 5
                     break
             
             return min(score, 100.0)
             
         except Exception as e:
-            logger.error(f"Market score calculation error: {str(e)}")
+            logger.error("Market score calculation error: %s", e)
             return 50.0
     
-    async def _calculate_team_score(
-        self, 
-        nlp_analysis: Dict[str, Any], 
-        document_content: Dict[str, Any]
-    ) -> float:
+    def _calculate_team_score(self, ctx: _ScoringContext) -> float:
         """Calculate team strength score (0-100)"""
         score = 50.0  # Base score
         
         try:
-            team_info = nlp_analysis.get('team_information', {})
+            team_info = ctx.team_info
             
             # Founder information
             founders = team_info.get('founders', [])
@@ -311,12 +476,10 @@ class ScoringEngine:
                 if len(founders) >= 2:
                     score += 10  # Co-founder team
                 
-                # Check for experience indicators
-                for founder in founders:
-                    context = founder.get('context', '').lower()
-                    if any(exp in context for exp in ['experience', 'previous', 'former', 'ex-']):
-                        score += 10  # Experience mentioned
-                        break
+                # Check for experience indicators, in all founder contexts at once
+                contexts = '\n'.join(founder.get('context', '') for founder in founders)
+                if EXPERIENCE_RE.search(contexts):
+                    score += 10  # Experience mentioned
             
             # Team size
             team_size = team_info.get('team_size')
@@ -338,39 +501,24 @@ class ScoringEngine:
             if experience_highlights:
                 score += 15  # Documented experience
             
-            # Domain expertise indicators
-            entities = nlp_analysis.get('entities', {})
-            organizations = entities.get('organizations', [])
-            
-            # Check for prestigious company mentions
-            prestigious_companies = [
-                'google', 'microsoft', 'apple', 'amazon', 'facebook', 'meta',
-                'tesla', 'uber', 'airbnb', 'stripe', 'salesforce'
-            ]
-            
-            for org in organizations:
-                org_name = org.get('text', '').lower()
-                if any(company in org_name for company in prestigious_companies):
-                    score += 10  # Prestigious background
-                    break
+            # Domain expertise indicators: check for prestigious company
+            # mentions, in all organization names at once
+            org_names = '\n'.join(org.get('text', '') for org in ctx.organizations)
+            if PRESTIGIOUS_COMPANIES_RE.search(org_names):
+                score += 10  # Prestigious background
             
             return min(score, 100.0)
             
         except Exception as e:
-            logger.error(f"Team score calculation error: {str(e)}")
+            logger.error("Team score calculation error: %s", e)
             return 50.0
     
-    async def _calculate_product_score(
-        self, 
-        nlp_analysis: Dict[str, Any], 
-        document_content: Dict[str, Any]
-    ) -> float:
+    def _calculate_product_score(self, ctx: _ScoringContext) -> float:
         """Calculate product-market fit and product quality score (0-100)"""
         score = 50.0  # Base score
         
         try:
-            business_insights = nlp_analysis.get('business_insights', {})
-            key_topics = nlp_analysis.get('key_topics', [])
+            business_insights = ctx.business_insights
             
             # Product/solution clarity
             value_proposition = business_insights.get('value_proposition', [])
@@ -383,50 +531,35 @@ class ScoringEngine:
                 score += 15  # Identified competitive advantages
             
             # Technology innovation
-            tech_topics = [topic for topic in key_topics if topic.get('topic') == 'technology']
+            tech_topics = [topic for topic in ctx.key_topics if topic.get('topic') == 'technology']
             if tech_topics:
                 tech_score = tech_topics[0].get('relevance_score', 0)
                 score += tech_score * 20  # Up to 20 points for tech innovation
             
             # Product development stage indicators
-            text_analysis = nlp_analysis.get('text_analysis', {})
-            full_text = document_content.get('extracted_content', {}).get('full_text', '').lower()
+            found = ctx.product_keywords
             
             # Look for product development indicators
-            development_indicators = {
-                'mvp': 10,
-                'prototype': 8,
-                'beta': 12,
-                'launched': 15,
-                'customers': 15,
-                'users': 12,
-                'traction': 15
-            }
-            
-            for indicator, points in development_indicators.items():
-                if indicator in full_text:
+            for indicator, points in DEVELOPMENT_INDICATORS.items():
+                if indicator in found:
                     score += points
                     break  # Only count the highest indicator
             
             # Customer validation
-            if any(word in full_text for word in ['customer feedback', 'user feedback', 'testimonial']):
+            if not found.isdisjoint(VALIDATION_PHRASES):
                 score += 10
             
             # Scalability indicators
-            if any(word in full_text for word in ['scalable', 'scale', 'growth', 'expand']):
+            if not found.isdisjoint(SCALABILITY_WORDS):
                 score += 10
             
             return min(score, 100.0)
             
         except Exception as e:
-            logger.error(f"Product score calculation error: {str(e)}")
+            logger.error("Product score calculation error: %s", e)
             return 50.0
     
-    async def _assess_risk_factors(
-        self, 
-        nlp_analysis: Dict[str, Any], 
-        document_content: Dict[str, Any]
-    ) -> Dict[str, Any]:
+    def _assess_risk_factors(self, ctx: _ScoringContext) -> Dict[str, Any]:
         """Assess various risk factors and calculate overall risk score"""
         risk_assessment = {
             'market_risk': 50,
@@ -440,28 +573,23 @@ class ScoringEngine:
         }
         
         try:
-            identified_risks = nlp_analysis.get('risk_factors', [])
-            
-            # Categorize and score risks
-            risk_scores = {
-                'market': [],
-                'financial': [],
-                'operational': [],
-                'regulatory': [],
-                'technology': [],
-                'team': []
-            }
+            identified_risks = ctx.risk_factors
+            
+            # Category index and score of each risk in a known category
+            category_indexes = []
+            category_scores = []
             
             for risk in identified_risks:
                 category = risk.get('category', 'operational')
                 severity = risk.get('severity', 'medium')
                 
                 # Convert severity to score (lower is better for risk)
-                severity_scores = {'low': 20, 'medium': 50, 'high': 80, 'critical': 95}
-                risk_score = severity_scores.get(severity, 50)
+                risk_score = SEVERITY_SCORES.get(severity, 50)
                 
-                if category in risk_scores:
-                    risk_scores[category].append(risk_score)
+                category_index = RISK_CATEGORY_INDEX.get(category)
+                if category_index is not None:
+                    category_indexes.append(category_index)
+                    category_scores.append(risk_score)
                 
                 risk_assessment['risk_factors'].append({
                     'category': category,
@@ -470,30 +598,91 @@ class ScoringEngine:
                     'score': risk_score
                 })
             
-            # Calculate category risk scores
-            for category, scores in risk_scores.items():
-                if scores:
-                    avg_score = sum(scores) / len(scores)
-                    risk_assessment[f'{category}_risk'] = min(avg_score, 100)
+            # Calculate category risk scores: the mean score of each category's
+            # risks, or 50 for categories with none
+            category_indexes = np.asarray(category_indexes, dtype=np.intp)
+            counts = np.bincount(category_indexes, minlength=len(RISK_CATEGORY_KEYS))
+            totals = np.bincount(category_indexes, weights=category_scores, minlength=len(RISK_CATEGORY_KEYS))
+            category_risks = np.where(
+                counts > 0,
+                np.minimum(totals / np.maximum(counts, 1), 100),
+                50.0
+            )
             
-            # Calculate overall risk score
-            category_risks = [
-                risk_assessment['market_risk'],
-                risk_assessment['financial_risk'],
-                risk_assessment['operational_risk'],
-                risk_assessment['regulatory_risk'],
-                risk_assessment['technology_risk'],
-                risk_assessment['team_risk']
-            ]
+            for key, category_risk in zip(RISK_CATEGORY_KEYS, category_risks.tolist()):
+                risk_assessment[key] = category_risk
             
-            risk_assessment['overall_risk_score'] = sum(category_risks) / len(category_risks)
+            # Calculate overall risk score
+            risk_assessment['overall_risk_score'] = float(category_risks.mean())
             
             return risk_assessment
             
         except Exception as e:
-            logger.error(f"Risk assessment error: {str(e)}")
+            logger.error("Risk assessment error: %s", e)
             return risk_assessment
     
+    def score_portfolio(
+        self,
+        nlp_analyses: List[Dict[str, Any]],
+        document_contents: List[Dict[str, Any]]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Score many ventures at once
+        
+        Runs the dimension scorers and risk assessment for each venture, then
+        applies the same risk adjustment, weighting and recommendation
+        thresholds as calculate_investment_score as array operations. No
+        reasoning is compiled and the score cache is not consulted.
+        
+        Args:
+            nlp_analyses: Results from NLP analysis, one per venture
+            document_contents: Extracted document content, in the same order
+            
+        Returns:
+            Overall scores rounded to 2 places, and the recommendation for each
+        """
+        if len(nlp_analyses) != len(document_contents):
+            raise ScoringEngineError("Each venture needs both an NLP analysis and document content")
+        
+        try:
+            contexts = [
+                _ScoringContext.from_inputs(nlp_analysis, document_content)
+                for nlp_analysis, document_content in zip(nlp_analyses, document_contents)
+            ]
+            
+            # (N, 4) raw financial, market, team and product scores, and (N,) risk scores
+            dim_scores = np.array([
+                (
+                    self._calculate_financial_score(ctx),
+                    self._calculate_market_score(ctx),
+                    self._calculate_team_score(ctx),
+                    self._calculate_product_score(ctx)
+                )
+                for ctx in contexts
+            ], dtype=np.float64).reshape(-1, len(SCORE_DIMENSIONS))
+            risk_scores = np.array([
+                self._assess_risk_factors(ctx)['overall_risk_score'] for ctx in contexts
+            ], dtype=np.float64)
+        except Exception as e:
+            logger.error("Portfolio scoring failed: %s", e)
+            raise ScoringEngineError(f"Portfolio scoring failed: {str(e)}")
+        
+        # Max 30% reduction, as for a single venture
+        adjusted = dim_scores * (1 - risk_scores[:, None] / 100 * 0.3)
+        
+        # Sum the weighted columns in the same order as a single venture, so
+        # the totals (and threshold ties) match it exactly
+        overall = np.zeros(len(contexts))
+        for column, dimension in enumerate(SCORE_DIMENSIONS):
+            overall += adjusted[:, column] * self.weights[dimension]
+        
+        labels = np.array(RECOMMENDATIONS)
+        recommendations = labels[np.searchsorted(self._threshold_breaks, overall, side='right')]
+        
+        # Round as calculate_investment_score does; np.round scales by 100
+        # first and can land on the other side of a .xx5 tie
+        return np.array([round(score, 2) for score in overall.tolist()]), recommendations
+    
     def _calculate_confidence_interval(self, score: float, confidence: float) -> Tuple[float, float]:
         """Calculate confidence interval for the score"""
         # Simple confidence interval calculation
@@ -506,18 +695,11 @@ class ScoringEngine:
     
     def _generate_recommendation(self, overall_score: float) -> str:
         """Generate investment recommendation based on overall score"""
-        if overall_score >= self.recommendation_thresholds['strong_buy']:
-            return 'strong_buy'
-        elif overall_score >= self.recommendation_thresholds['buy']:
-            return 'buy'
-        elif overall_score >= self.recommendation_thresholds['hold']:
-            return 'hold'
-        else:
-            return 'pass'
+        return RECOMMENDATIONS[bisect.bisect_right(self._threshold_breaks, overall_score)]
     
-    def _get_financial_reasoning(self, nlp_analysis: Dict[str, Any], score: float) -> str:
+    def _get_financial_reasoning(self, ctx: _ScoringContext, score: float) -> str:
         """Generate reasoning for financial score"""
-        financial_metrics = nlp_analysis.get('financial_metrics', {})
+        financial_metrics = ctx.financial_metrics
         
         reasons = []
         
@@ -530,7 +712,7 @@ class ScoringEngine:
         if financial_metrics.get('valuation_metrics'):
             reasons.append("Valuation metrics identified")
         
-        business_model = nlp_analysis.get('business_insights', {}).get('business_model')
+        business_model = ctx.business_insights.get('business_model')
         if business_model:
             reasons.append(f"Business model: {business_model}")
         
@@ -541,9 +723,9 @@ class ScoringEngine:
         else:
             return f"Financial concerns: {', '.join(reasons) if reasons else 'Insufficient financial information'}"
     
-    def _get_market_reasoning(self, nlp_analysis: Dict[str, Any], score: float) -> str:
+    def _get_market_reasoning(self, ctx: _ScoringContext, score: float) -> str:
         """Generate reasoning for market score"""
-        market_analysis = nlp_analysis.get('market_analysis', {})
+        market_analysis = ctx.market_analysis
         
         reasons = []
         
@@ -561,9 +743,9 @@ class ScoringEngine:
         else:
             return f"Market concerns: {', '.join(reasons) if reasons else 'Insufficient market information'}"
     
-    def _get_team_reasoning(self, nlp_analysis: Dict[str, Any], score: float) -> str:
+    def _get_team_reasoning(self, ctx: _ScoringContext, score: float) -> str:
         """Generate reasoning for team score"""
-        team_info = nlp_analysis.get('team_information', {})
+        team_info = ctx.team_info
         
         reasons = []
         
@@ -582,9 +764,9 @@ class ScoringEngine:
         else:
             return f"Team concerns: {', '.join(reasons) if reasons else 'Insufficient team information'}"
     
-    def _get_product_reasoning(self, nlp_analysis: Dict[str, Any], score: float) -> str:
+    def _get_product_reasoning(self, ctx: _ScoringContext, score: float) -> str:
         """Generate reasoning for product score"""
-        business_insights = nlp_analysis.get('business_insights', {})
+        business_insights = ctx.business_insights
         
         reasons = []
         
@@ -601,7 +783,7 @@ class ScoringEngine:
         else:
             return f"Product concerns: {', '.join(reasons) if reasons else 'Limited product information'}"
     
-    def _identify_key_strengths(self, nlp_analysis: Dict[str, Any], scores: Dict[str, float]) -> List[str]:
+    def _identify_key_strengths(self, ctx: _ScoringContext, scores: Dict[str, float]) -> List[str]:
         """Identify key strengths based on analysis and scores"""
         strengths = []
         
@@ -611,18 +793,18 @@ class ScoringEngine:
                 strengths.append(f"Strong {dimension} performance ({score:.1f}/100)")
         
         # Specific strengths from analysis
-        financial_metrics = nlp_analysis.get('financial_metrics', {})
+        financial_metrics = ctx.financial_metrics
         if financial_metrics.get('revenue_metrics'):
             strengths.append("Revenue generation demonstrated")
         
         if financial_metrics.get('funding_metrics'):
             strengths.append("Secured funding")
         
-        market_analysis = nlp_analysis.get('market_analysis', {})
+        market_analysis = ctx.market_analysis
         if market_analysis.get('market_size'):
             strengths.append("Large market opportunity")
         
-        team_info = nlp_analysis.get('team_information', {})
+        team_info = ctx.team_info
         if len(team_info.get('founders', [])) >= 2:
             strengths.append("Co-founder team")
         
@@ -638,8 +820,7 @@ class ScoringEngine:
                 concerns.append(f"Weak {dimension} indicators ({score:.1f}/100)")
         
         # High-risk categories
-        risk_categories = ['market_risk', 'financial_risk', 'operational_risk', 'regulatory_risk', 'technology_risk', 'team_risk']
-        for category in risk_categories:
+        for category in RISK_CATEGORY_KEYS:
             risk_score = risk_factors.get(category, 50)
             if risk_score >= 70:
                 category_name = category.replace('_risk', '')
@@ -647,7 +828,7 @@ class ScoringEngine:
         
         # Specific risk factors
         identified_risks = risk_factors.get('risk_factors', [])
-        high_severity_risks = [risk for risk in identified_risks if risk.get('severity') in ['high', 'critical']]
+        high_severity_risks = [risk for risk in identified_risks if risk.get('severity') in HIGH_SEVERITIES]
         
         for risk in high_severity_risks[:3]:  # Top 3 high-severity risks
             concerns.append(f"{risk.get('category', 'General')} risk: {risk.get('description', '')[:50]}...")
@@ -0,0 +1,163 @@
+"""
+Object storage service for document files (S3/MinIO)
+"""
+
+import asyncio
+import os
+import tempfile
+from typing import Optional, Tuple
+from urllib.parse import quote
+
+import boto3
+from botocore.config import Config as BotoConfig
+from botocore.exceptions import ClientError
+
+from app.core.config import settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+S3_URI_PREFIX = "s3://"
+
+
+def _content_disposition(filename: str) -> str:
+    """Attachment header for a user-supplied file name
+    
+    The quoted ``filename`` is an ASCII fallback with quotes and backslashes
+    escaped; ``filename*`` carries the exact name, percent-encoded UTF-8
+    (RFC 6266), so quotes, semicolons and non-ASCII can't break the header.
+    """
+    fallback = filename.encode("ascii", "replace").decode("ascii")
+    fallback = "".join(char if char.isprintable() else "_" for char in fallback)
+    fallback = fallback.replace("\\", "\\\\").replace('"', '\\"')
+    return f"attachment; filename=\"{fallback}\"; filename*=UTF-8''{quote(filename, safe='')}"
+
+
+class StorageError(Exception):
+    """Custom exception for object storage errors"""
+    pass
+
+
+class StorageService:
+    """Presigned-URL based access to the document bucket
+    
+    File bytes go directly between the client and the bucket; the API only
+    signs URLs and reads objects back when a document needs processing.
+    """
+    
+    def __init__(self):
+        self.bucket = settings.S3_BUCKET_NAME
+        self._client = None
+    
+    @property
+    def enabled(self) -> bool:
+        """Whether object storage credentials are configured"""
+        return bool(settings.S3_ACCESS_KEY and settings.S3_SECRET_KEY)
+    
+    @property
+    def client(self):
+        """Lazily created boto3 S3 client"""
+        if self._client is None:
+            if not self.enabled:
+                raise StorageError("Object storage is not configured")
+            
+            self._client = boto3.client(
+                "s3",
+                endpoint_url=settings.S3_ENDPOINT,
+                aws_access_key_id=settings.S3_ACCESS_KEY,
+                aws_secret_access_key=settings.S3_SECRET_KEY,
+                region_name=settings.S3_REGION,
+                config=BotoConfig(signature_version="s3v4"),
+            )
+        return self._client
+    
+    @staticmethod
+    def is_object_path(storage_path: str) -> bool:
+        """Whether a Document.storage_path points into object storage"""
+        return storage_path.startswith(S3_URI_PREFIX)
+    
+    def to_storage_path(self, key: str) -> str:
+        """Build the ``s3://bucket/key`` form stored on Document.storage_path"""
+        return f"{S3_URI_PREFIX}{self.bucket}/{key}"
+    
+    def parse_storage_path(self, storage_path: str) -> Tuple[str, str]:
+        """Split an ``s3://bucket/key`` path into bucket and key"""
+        bucket, _, key = storage_path[len(S3_URI_PREFIX):].partition("/")
+        return bucket, key
+    
+    def create_upload_url(self, key: str, content_type: str) -> str:
+        """Presigned PUT URL the client uploads the file to"""
+        return self.client.generate_presigned_url(
+            "put_object",
+            Params={"Bucket": self.bucket, "Key": key, "ContentType": content_type},
+            ExpiresIn=settings.S3_PRESIGNED_URL_EXPIRE_SECONDS,
+        )
+    
+    def create_download_url(
+        self,
+        storage_path: str,
+        filename: str,
+        content_type: Optional[str] = None
+    ) -> str:
+        """Presigned GET URL that downloads the object under its original name"""
+        bucket, key = self.parse_storage_path(storage_path)
+        params = {
+            "Bucket": bucket,
+            "Key": key,
+            "ResponseContentDisposition": _content_disposition(filename),
+        }
+        if content_type:
+            params["ResponseContentType"] = content_type
+        
+        return self.client.generate_presigned_url(
+            "get_object",
+            Params=params,
+            ExpiresIn=settings.S3_PRESIGNED_URL_EXPIRE_SECONDS,
+        )
+    
+    async def get_object_size(self, key: str) -> Optional[int]:
+        """Size in bytes of an uploaded object, or None if it doesn't exist"""
+        try:
+            head = await asyncio.to_thread(
+                self.client.head_object, Bucket=self.bucket, Key=key
+            )
+        except ClientError:
+            return None
+        return head["ContentLength"]
+    
+    async def object_exists(self, storage_path: str) -> bool:
+        """Whether the object behind a storage path still exists"""
+        bucket, key = self.parse_storage_path(storage_path)
+        try:
+            await asyncio.to_thread(self.client.head_object, Bucket=bucket, Key=key)
+        except ClientError:
+            return False
+        return True
+    
+    async def delete_object(self, storage_path: str) -> None:
+        """Delete the object behind a storage path"""
+        bucket, key = self.parse_storage_path(storage_path)
+        await asyncio.to_thread(self.client.delete_object, Bucket=bucket, Key=key)
+    
+    async def download_to_tempfile(self, storage_path: str) -> str:
+        """Copy an object to a local temporary file and return its path
+        
+        The document parsers need a real file; callers delete it when done.
+        """
+        bucket, key = self.parse_storage_path(storage_path)
+        suffix = os.path.splitext(key)[1]
+        fd, local_path = tempfile.mkstemp(suffix=suffix)
+        os.close(fd)
+        
+        try:
+            await asyncio.to_thread(self.client.download_file, bucket, key, local_path)
+        except Exception as e:
+            os.unlink(local_path)
+            logger.error(f"Failed to download {storage_path}: {str(e)}")
+            raise StorageError(f"Download failed: {str(e)}")
+        
+        return local_path
+
+
+# Global storage service instance
+storage_service = StorageService()
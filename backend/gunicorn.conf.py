@@ -0,0 +1,22 @@
+"""
+Gunicorn configuration for multi-worker deployments
+
+    gunicorn app.main:app -c gunicorn.conf.py
+"""
+
+import multiprocessing
+import os
+
+bind = "0.0.0.0:8000"
+worker_class = "uvicorn.workers.UvicornWorker"
+workers = int(os.getenv("WEB_CONCURRENCY", multiprocessing.cpu_count()))
+
+# Import the app in the master, so the NLP model loaded below is shared
+# copy-on-write by the forked workers instead of loaded once per worker
+preload_app = True
+
+
+def when_ready(server):
+    """Load the NLP model in the master before any worker is forked"""
+    from app.services.nlp_processor import get_nlp_processor
+    get_nlp_processor()
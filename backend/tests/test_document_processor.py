@@ -0,0 +1,114 @@
+"""
+Tests for spreadsheet financial keyword detection
+"""
+
+import random
+
+import pytest
+
+from app.services.document_processor import FINANCIAL_KEYWORDS, document_processor
+
+
+def _string_cells(rows):
+    """Text cells with their right-hand neighbour, as _process_excel_sync builds them"""
+    cells = []
+    for row_idx, row in enumerate(rows):
+        row_data = [str(cell) if cell is not None else "" for cell in row]
+        cells.extend(
+            (row_idx, col_idx, cell, row_data[col_idx + 1] if col_idx + 1 < len(row_data) else None)
+            for col_idx, cell in enumerate(row)
+            if isinstance(cell, str) and cell
+        )
+    return cells
+
+
+def _substring_indicators(rows, sheet_name):
+    """The original per-cell substring check"""
+    indicators = []
+    for row_idx, row in enumerate(rows):
+        row_data = [str(cell) if cell is not None else "" for cell in row]
+        for col_idx, cell in enumerate(row):
+            if isinstance(cell, str):
+                cell_lower = cell.lower()
+                for keyword in FINANCIAL_KEYWORDS:
+                    if keyword in cell_lower:
+                        indicators.append({
+                            'sheet_name': sheet_name,
+                            'row': row_idx + 1,
+                            'column': col_idx + 1,
+                            'keyword': keyword,
+                            'context': cell,
+                            'value': row_data[col_idx + 1] if col_idx + 1 < len(row_data) else None
+                        })
+    return indicators
+
+
+@pytest.mark.parametrize("rows", [
+    # Keyword is the whole cell, starts it, or ends it
+    [["Revenue", 100], ["Revenue growth", 5], ["Net revenue", 7]],
+    # Adjacent text cells: a keyword never spans two cells
+    [["reve", "nue", "cash", "flow"]],
+    [["Cash", "Flow", 3]],
+    # Overlapping keywords in one cell, in any case
+    [["CASHFLOW"], ["cashflow"], ["Profit/Loss", None, "x"]],
+    # One-character cells and keywords on both sides of a cell boundary
+    [["a", "cost", "b"], ["margin", "roi"], ["ebitda", "", "irr"]],
+    # Keyword in the last cell of a row, with no neighbour
+    [[1, 2, "equity"]],
+    # No text cells at all
+    [[1, 2, 3], [None, 4.5, None]],
+])
+def test_identify_financial_data_matches_substring_check(rows):
+    found = document_processor._identify_financial_data(_string_cells(rows), "Sheet1")
+    
+    assert found == _substring_indicators(rows, "Sheet1")
+
+
+def test_identify_financial_data_matches_substring_check_on_random_sheets():
+    rng = random.Random(1234)
+    pieces = list(FINANCIAL_KEYWORDS) + ["x", "Q1", "total", "a b", " ", "-"]
+    
+    for _ in range(200):
+        rows = [
+            [
+                rng.choice([
+                    None,
+                    rng.randint(0, 10_000),
+                    "".join(rng.choice(pieces) for _ in range(rng.randint(1, 3))).upper()
+                    if rng.random() < 0.3 else
+                    "".join(rng.choice(pieces) for _ in range(rng.randint(1, 3))),
+                ])
+                for _ in range(rng.randint(1, 6))
+            ]
+            for _ in range(rng.randint(1, 8))
+        ]
+        
+        found = document_processor._identify_financial_data(_string_cells(rows), "S")
+        
+        assert found == _substring_indicators(rows, "S")
+
+
+def test_process_excel_reports_keywords_with_their_cells(tmp_path):
+    openpyxl = pytest.importorskip("openpyxl")
+    
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.title = "P&L"
+    rows = [
+        ["Metric", "2023"],
+        [None, None],
+        ["Revenue", 1200],
+        ["Operating cost", 800],
+        ["EBITDA margin", "33%"],
+    ]
+    for row in rows:
+        sheet.append(row)
+    path = tmp_path / "model.xlsx"
+    workbook.save(path)
+    
+    result = document_processor._process_excel_sync(str(path), "doc-1")
+    
+    # Empty rows are skipped before numbering, as before
+    non_empty_rows = [row for row in rows if any(cell is not None for cell in row)]
+    assert result['extracted_content']['financial_data'] == _substring_indicators(non_empty_rows, "P&L")
+    assert result['extracted_content']['worksheets'][0]['row_count'] == len(non_empty_rows)
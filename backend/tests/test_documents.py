@@ -0,0 +1,187 @@
+"""
+Tests for the document endpoints
+
+The pure pagination helpers are tested in test_pagination.py; these tests
+exercise the routes themselves, which need the ORM models.
+"""
+
+import uuid
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException, Request, Response
+
+pytest.importorskip("app.models", reason="the ORM models are not in this tree")
+
+from app.api.v1.endpoints.documents import get_document, list_documents
+from app.schemas.document import DocumentPage
+
+
+def _document_row(created_at: datetime) -> SimpleNamespace:
+    """Row shaped like the DOCUMENT_LIST_COLUMNS select"""
+    return SimpleNamespace(
+        id=uuid.uuid4(),
+        venture_id=uuid.uuid4(),
+        filename="deck.pdf",
+        original_filename="deck.pdf",
+        file_type="application/pdf",
+        file_size=1024,
+        processing_status="completed",
+        document_type=None,
+        confidence_score=None,
+        text_quality=None,
+        created_at=created_at,
+        processing_completed_at=None,
+    )
+
+
+class _FakeResult:
+    def __init__(self, rows):
+        self._rows = rows
+    
+    def all(self):
+        return self._rows
+    
+    def first(self):
+        return self._rows[0] if self._rows else None
+
+
+class _FakeSession:
+    """Session that returns fixed rows and records the statements it ran"""
+    
+    def __init__(self, rows, document=None):
+        self.rows = rows
+        self.document = document
+        self.statements = []
+        self.loaded = []
+    
+    async def execute(self, statement, params=None):
+        self.statements.append(statement)
+        return _FakeResult(self.rows)
+    
+    async def get(self, entity, ident, options=None):
+        self.loaded.append(ident)
+        return self.document
+
+
+async def _list(db, limit, before_created_at=None, before_id=None):
+    return await list_documents(
+        venture_id=None,
+        processing_status=None,
+        before_created_at=before_created_at,
+        before_id=before_id,
+        limit=limit,
+        db=db,
+        current_user=None,
+    )
+
+
+@pytest.mark.parametrize("cursor", [
+    {"before_created_at": datetime(2024, 1, 1)},
+    {"before_id": uuid.uuid4()},
+])
+async def test_half_specified_cursor_is_rejected(cursor):
+    db = _FakeSession([])
+    
+    with pytest.raises(HTTPException) as exc_info:
+        await _list(db, 10, **cursor)
+    
+    assert exc_info.value.status_code == 422
+    assert db.statements == []
+
+
+async def test_full_page_returns_cursor_past_last_row():
+    now = datetime(2024, 1, 1, 12)
+    rows = [_document_row(now), _document_row(now - timedelta(minutes=1))]
+    
+    page = DocumentPage.model_validate(await _list(_FakeSession(rows), 2))
+    
+    assert [doc.id for doc in page.data] == [row.id for row in rows]
+    assert page.next_cursor is not None
+    assert page.next_cursor.before_created_at == rows[-1].created_at
+    assert page.next_cursor.before_id == rows[-1].id
+
+
+async def test_short_page_has_no_cursor():
+    rows = [_document_row(datetime(2024, 1, 1))]
+    
+    page = DocumentPage.model_validate(await _list(_FakeSession(rows), 2))
+    
+    assert page.next_cursor is None
+    # The route excludes None fields, so the last page has no next_cursor key
+    assert "next_cursor" not in page.model_dump(exclude_none=True)
+
+
+def _request(if_none_match=None):
+    headers = [(b"if-none-match", if_none_match.encode())] if if_none_match else []
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": headers})
+
+
+def _processed_document(processing_status, started_at=None, completed_at=None):
+    """Document loaded with DOCUMENT_DETAIL_COLUMNS"""
+    document = _document_row(datetime(2024, 1, 1))
+    document.processing_status = processing_status
+    document.processing_started_at = started_at
+    document.processing_completed_at = completed_at
+    document.data_completeness = None
+    document.processing_error = None
+    return document
+
+
+async def test_get_document_sets_etag_and_304s_on_match():
+    document = _processed_document(
+        "completed", datetime(2024, 1, 1, 12), datetime(2024, 1, 1, 12, 5)
+    )
+    
+    db = _FakeSession([], document=document)
+    response = Response()
+    body = await get_document(document.id, _request(), response, db=db, current_user=None)
+    
+    etag = response.headers["ETag"]
+    assert etag.startswith('W/"')
+    assert response.headers["Cache-Control"] == "private, no-cache"
+    assert body.id == document.id
+    # One load serves both the ETag and the body
+    assert db.loaded == [document.id]
+    assert db.statements == []
+    
+    # Revalidating with the same ETag, alone or in a list, gets a 304
+    for if_none_match in (etag, f'"other", {etag}', "*"):
+        not_modified = await get_document(
+            document.id, _request(if_none_match), Response(),
+            db=_FakeSession([], document=document), current_user=None
+        )
+        
+        assert not_modified.status_code == 304
+        assert not_modified.headers["ETag"] == etag
+
+
+async def test_get_document_etag_changes_when_processing_finishes():
+    started = datetime(2024, 1, 1, 12)
+    processing = _processed_document("processing", started)
+    completed = _processed_document("completed", started, started + timedelta(minutes=5))
+    completed.id = processing.id
+    
+    first = Response()
+    await get_document(
+        processing.id, _request(), first,
+        db=_FakeSession([], document=processing), current_user=None
+    )
+    
+    # The stale ETag no longer matches, so the full document comes back
+    second = Response()
+    body = await get_document(
+        completed.id, _request(first.headers["ETag"]), second,
+        db=_FakeSession([], document=completed), current_user=None
+    )
+    
+    assert second.headers["ETag"] != first.headers["ETag"]
+    assert body.processing_status == "completed"
+
+
+async def test_get_document_404s_for_a_missing_document():
+    with pytest.raises(HTTPException) as exc_info:
+        await get_document(uuid.uuid4(), _request(), Response(), db=_FakeSession([]), current_user=None)
+    
+    assert exc_info.value.status_code == 404
@@ -0,0 +1,53 @@
+"""
+Tests for If-None-Match revalidation
+"""
+
+import pytest
+from fastapi import Request
+
+from app.api.v1.etags import etag_matches, not_modified
+
+ETAG = 'W/"doc-1-completed-1704110400.000000-1704110700.000000"'
+
+
+def _request(if_none_match=None):
+    headers = [(b"if-none-match", if_none_match.encode())] if if_none_match else []
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": headers})
+
+
+@pytest.mark.parametrize("if_none_match", [
+    ETAG,
+    "*",
+    " * ",
+    f'"stale", {ETAG}',
+    f'{ETAG},"stale"',
+    # Weak comparison ignores the W/ prefix
+    ETAG[2:],
+    '"a,b", ' + ETAG,
+])
+def test_matching_if_none_match(if_none_match):
+    assert etag_matches(if_none_match, ETAG)
+
+
+@pytest.mark.parametrize("if_none_match", [
+    None,
+    "",
+    '"stale"',
+    'W/"stale", "other"',
+    # A tag containing the ETag's value is not the ETag
+    '"x-doc-1-completed-1704110400.000000-1704110700.000000"',
+])
+def test_non_matching_if_none_match(if_none_match):
+    assert not etag_matches(if_none_match, ETAG)
+
+
+def test_not_modified_response_carries_validators():
+    response = not_modified(_request(f'"stale", {ETAG}'), ETAG, "private, no-cache")
+    
+    assert response.status_code == 304
+    assert response.headers["ETag"] == ETAG
+    assert response.headers["Cache-Control"] == "private, no-cache"
+
+
+def test_modified_returns_none():
+    assert not_modified(_request('"stale"'), ETAG, "private, no-cache") is None
@@ -0,0 +1,93 @@
+"""
+Tests for keyset pagination
+"""
+
+import uuid
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import Column, DateTime, MetaData, String, Table, create_engine, select
+
+from app.api.v1.pagination import check_cursor, newest_first_page, next_cursor
+from app.schemas.document import DocumentPage
+
+
+@pytest.mark.parametrize("cursor", [
+    (datetime(2024, 1, 1), None),
+    (None, uuid.uuid4()),
+])
+def test_half_specified_cursor_is_rejected(cursor):
+    with pytest.raises(HTTPException) as exc_info:
+        check_cursor(*cursor)
+    
+    assert exc_info.value.status_code == 422
+
+
+@pytest.mark.parametrize("cursor", [
+    (None, None),
+    (datetime(2024, 1, 1), uuid.uuid4()),
+])
+def test_whole_or_missing_cursor_is_accepted(cursor):
+    check_cursor(*cursor)
+
+
+def test_full_page_returns_cursor_past_last_row():
+    now = datetime(2024, 1, 1, 12)
+    rows = [
+        SimpleNamespace(id=uuid.uuid4(), created_at=now),
+        SimpleNamespace(id=uuid.uuid4(), created_at=now - timedelta(minutes=1)),
+    ]
+    
+    page = DocumentPage.model_validate({'data': [], 'next_cursor': next_cursor(rows, 2)})
+    
+    assert page.next_cursor.before_created_at == rows[-1].created_at
+    assert page.next_cursor.before_id == rows[-1].id
+
+
+def test_short_page_has_no_cursor():
+    rows = [SimpleNamespace(id=uuid.uuid4(), created_at=datetime(2024, 1, 1))]
+    
+    page = DocumentPage.model_validate({'data': [], 'next_cursor': next_cursor(rows, 2)})
+    
+    assert page.next_cursor is None
+    # The route excludes None fields, so the last page has no next_cursor key
+    assert "next_cursor" not in page.model_dump(exclude_none=True)
+
+
+def test_keyset_paging_walks_ties_on_created_at_once_each():
+    metadata = MetaData()
+    documents = Table(
+        "documents", metadata,
+        Column("id", String, primary_key=True),
+        Column("created_at", DateTime, nullable=False),
+    )
+    engine = create_engine("sqlite://")
+    metadata.create_all(engine)
+    
+    # Three rows share each timestamp, so pages end in the middle of ties
+    base = datetime(2024, 1, 1)
+    rows = [
+        {"id": f"doc-{index:02d}", "created_at": base + timedelta(minutes=index // 3)}
+        for index in range(10)
+    ]
+    expected = [row["id"] for row in sorted(rows, key=lambda row: (row["created_at"], row["id"]), reverse=True)]
+    
+    with engine.begin() as conn:
+        conn.execute(documents.insert(), rows)
+        
+        seen = []
+        cursor = (None, None)
+        while True:
+            page = conn.execute(
+                newest_first_page(select(documents), documents.c.created_at, documents.c.id, *cursor, 4)
+            ).all()
+            seen.extend(row.id for row in page)
+            
+            cursor_values = next_cursor(page, 4)
+            if cursor_values is None:
+                break
+            cursor = (cursor_values['before_created_at'], cursor_values['before_id'])
+    
+    assert seen == expected
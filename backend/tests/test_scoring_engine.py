@@ -0,0 +1,199 @@
+"""
+Tests for investment score caching and portfolio scoring
+"""
+
+import copy
+import dataclasses
+import json
+import random
+
+import orjson
+
+from app.services.scoring_engine import (
+    DEVELOPMENT_INDICATORS,
+    PRODUCT_KEYWORD_RE,
+    SCALABILITY_WORDS,
+    VALIDATION_PHRASES,
+    ScoringEngine,
+)
+
+
+NLP_ANALYSIS = {
+    'financial_metrics': {
+        'revenue_metrics': [{'amount': 2500000}],
+        'funding_metrics': [{'amount': 6000000}],
+        'valuation_metrics': []
+    },
+    'market_analysis': {
+        'market_size': [{'amount': 20000000000}],
+        'competitors': [{'name': 'Acme'}, {'name': 'Globex'}],
+        'market_trends': ['remote work']
+    },
+    'team_information': {
+        'founders': [
+            {'name': 'A. Founder', 'context': 'former engineer at a bank'},
+            {'name': 'B. Founder', 'context': 'first startup'}
+        ],
+        'team_size': 12,
+        'key_personnel': [],
+        'experience_highlights': ['10 years in payments']
+    },
+    'business_insights': {
+        'business_model': 'saas',
+        'revenue_model': 'subscription',
+        'target_market': ['SMBs'],
+        'value_proposition': ['faster invoicing'],
+        'competitive_advantages': ['proprietary data']
+    },
+    'key_topics': [{'topic': 'technology', 'relevance_score': 0.5}],
+    'entities': {'organizations': [{'text': 'Stripe'}]},
+    'risk_factors': [
+        {'category': 'market', 'severity': 'high', 'context': 'crowded market'},
+        {'category': 'financial', 'severity': 'low', 'context': 'runway'}
+    ],
+    'confidence_score': 0.8
+}
+
+DOCUMENT_CONTENT = {
+    'extracted_content': {'full_text': 'Our MVP is launched with paying customers and scalable growth.'},
+    'document_classification': {'document_type': 'pitch_deck'},
+    'processing_metadata': {'processed_at': '2024-01-01T00:00:00', 'processing_time_seconds': 1.25}
+}
+
+
+async def test_rescoring_same_content_hits_cache():
+    engine = ScoringEngine()
+    first = await engine.calculate_investment_score(NLP_ANALYSIS, DOCUMENT_CONTENT)
+
+    # Reprocessing the same document only changes its processing metadata
+    reprocessed = copy.deepcopy(DOCUMENT_CONTENT)
+    reprocessed['processing_metadata'] = {'processed_at': '2024-01-02T09:30:00', 'processing_time_seconds': 0.9}
+    second = await engine.calculate_investment_score(copy.deepcopy(NLP_ANALYSIS), reprocessed)
+
+    assert second == first
+    assert len(engine._score_cache) == 1
+
+
+async def test_mutating_returned_reasoning_leaves_cache_hits_unchanged():
+    engine = ScoringEngine()
+    first = await engine.calculate_investment_score(NLP_ANALYSIS, DOCUMENT_CONTENT)
+    expected = copy.deepcopy(first.reasoning)
+
+    first.reasoning['key_strengths'].append('edited by a caller')
+    first.reasoning['risk_assessment']['risk_factors'].clear()
+    first.reasoning['financial_reasoning'] = ''
+
+    second = await engine.calculate_investment_score(NLP_ANALYSIS, DOCUMENT_CONTENT)
+    assert second.reasoning == expected
+
+    # Nor does editing a cache hit change the next one
+    second.reasoning['key_concerns'].append('edited again')
+    third = await engine.calculate_investment_score(NLP_ANALYSIS, DOCUMENT_CONTENT)
+    assert third.reasoning == expected
+
+
+async def test_changed_scoring_input_misses_cache():
+    engine = ScoringEngine()
+    first = await engine.calculate_investment_score(NLP_ANALYSIS, DOCUMENT_CONTENT)
+
+    changed = copy.deepcopy(NLP_ANALYSIS)
+    changed['risk_factors'][0]['severity'] = 'critical'
+    second = await engine.calculate_investment_score(changed, DOCUMENT_CONTENT)
+
+    assert second is not first
+    assert second.risk_score > first.risk_score
+    assert len(engine._score_cache) == 2
+
+
+async def test_weight_change_misses_cache():
+    engine = ScoringEngine()
+    first = await engine.calculate_investment_score(NLP_ANALYSIS, DOCUMENT_CONTENT)
+
+    engine.weights = {'financial': 0.55, 'market': 0.15, 'team': 0.15, 'product': 0.15}
+    second = await engine.calculate_investment_score(NLP_ANALYSIS, DOCUMENT_CONTENT)
+
+    assert second is not first
+    assert len(engine._score_cache) == 2
+
+
+async def test_reasoning_is_a_serializable_dict():
+    engine = ScoringEngine()
+    result = await engine.calculate_investment_score(NLP_ANALYSIS, DOCUMENT_CONTENT)
+
+    assert type(result.reasoning) is dict
+    assert set(result.reasoning) == {
+        'financial_reasoning', 'market_reasoning', 'team_reasoning', 'product_reasoning',
+        'risk_assessment', 'key_strengths', 'key_concerns'
+    }
+    assert json.loads(json.dumps(result.reasoning)) == result.reasoning
+    assert orjson.loads(orjson.dumps(dataclasses.asdict(result)))['reasoning'] == result.reasoning
+
+
+def _random_venture(rng):
+    """An analysis with a random subset of NLP_ANALYSIS's sections and risks"""
+    nlp_analysis = copy.deepcopy(NLP_ANALYSIS)
+    for section in ('financial_metrics', 'market_analysis', 'team_information', 'business_insights', 'key_topics'):
+        if rng.random() < 0.4:
+            del nlp_analysis[section]
+    nlp_analysis['risk_factors'] = [
+        {
+            'category': rng.choice(['market', 'financial', 'operational', 'regulatory', 'technology', 'team', 'other']),
+            'severity': rng.choice(['low', 'medium', 'high', 'critical']),
+            'context': 'risk'
+        }
+        for _ in range(rng.randint(0, 8))
+    ]
+    document_content = copy.deepcopy(DOCUMENT_CONTENT)
+    if rng.random() < 0.5:
+        document_content['extracted_content']['full_text'] = 'A prototype.'
+    return nlp_analysis, document_content
+
+
+async def test_score_portfolio_matches_single_venture_scores():
+    rng = random.Random(0)
+    ventures = [_random_venture(rng) for _ in range(200)]
+    engine = ScoringEngine()
+
+    overall, recommendations = engine.score_portfolio(
+        [nlp_analysis for nlp_analysis, _ in ventures],
+        [document_content for _, document_content in ventures]
+    )
+
+    assert len(overall) == len(recommendations) == len(ventures)
+    for (nlp_analysis, document_content), score, recommendation in zip(ventures, overall, recommendations):
+        result = await engine.calculate_investment_score(nlp_analysis, document_content)
+        assert score == result.overall_score
+        assert recommendation == result.recommendation
+
+
+def test_score_portfolio_empty():
+    overall, recommendations = ScoringEngine().score_portfolio([], [])
+
+    assert overall.shape == recommendations.shape == (0,)
+
+
+async def test_undetailed_score_skips_reasoning():
+    engine = ScoringEngine()
+    detailed = await engine.calculate_investment_score(NLP_ANALYSIS, DOCUMENT_CONTENT)
+    ranked = await engine.calculate_investment_score(NLP_ANALYSIS, DOCUMENT_CONTENT, detailed=False)
+
+    assert ranked.reasoning == {}
+    assert ranked.overall_score == detailed.overall_score
+    assert ranked.recommendation == detailed.recommendation
+    # A ranking call must not leave an empty result for detailed callers
+    assert (await engine.calculate_investment_score(NLP_ANALYSIS, DOCUMENT_CONTENT)).reasoning
+
+
+def test_no_product_keyword_hides_one_from_another_group():
+    groups = {
+        **{keyword: 'development' for keyword in DEVELOPMENT_INDICATORS},
+        **{keyword: 'validation' for keyword in VALIDATION_PHRASES},
+        **{keyword: 'scalability' for keyword in SCALABILITY_WORDS},
+    }
+
+    for keyword, group in groups.items():
+        # Each keyword is found on its own, even though longer ones are tried first
+        assert [match.lower() for match in PRODUCT_KEYWORD_RE.findall(keyword)] == [keyword]
+        for other, other_group in groups.items():
+            if other != keyword and other.startswith(keyword):
+                assert other_group == group, f"{other!r} would hide {keyword!r}"
@@ -0,0 +1,41 @@
+"""
+Tests for presigned download headers
+"""
+
+from urllib.parse import unquote
+
+import pytest
+
+pytest.importorskip("boto3")
+
+from app.services.storage import _content_disposition
+
+
+def _extended_filename(header):
+    """The exact name carried by the filename* parameter"""
+    _, _, encoded = header.partition("; filename*=UTF-8''")
+    return unquote(encoded, encoding="utf-8", errors="strict")
+
+
+@pytest.mark.parametrize("filename", [
+    "deck.pdf",
+    'pitch "final"; v2.pdf',
+    "back\\slash.xlsx",
+    "Résumé – 2024.docx",
+    "plan\r\nSet-Cookie: x=1.pdf",
+])
+def test_content_disposition_round_trips_the_filename(filename):
+    header = _content_disposition(filename)
+    
+    assert header.isascii()
+    assert "\r" not in header and "\n" not in header
+    assert header.startswith('attachment; filename="')
+    # The extended parameter is one token, so nothing in the name can end it early
+    assert ";" not in header.partition("filename*=")[2]
+    assert _extended_filename(header) == filename
+
+
+def test_content_disposition_ascii_fallback_is_escaped():
+    header = _content_disposition('a"b\\c.pdf')
+    
+    assert header.startswith('attachment; filename="a\\"b\\\\c.pdf"; ')
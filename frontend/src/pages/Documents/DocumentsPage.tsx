@@ -48,10 +48,19 @@ interface Document {
   processing_completed_at?: string;
 }
 
+interface DocumentCursor {
+  before_created_at: string;
+  before_id: string;
+}
+
+// Documents per request; the API's maximum, and its old unpaginated default
+const PAGE_SIZE = 100;
+
 const DocumentsPage: React.FC = () => {
   const [activeTab, setActiveTab] = useState(0);
   const [documents, setDocuments] = useState<Document[]>([]);
   const [loading, setLoading] = useState(true);
+  const [nextCursor, setNextCursor] = useState<DocumentCursor | null>(null);
   const [uploadDialogOpen, setUploadDialogOpen] = useState(false);
   const [selectedVentureId, setSelectedVentureId] = useState('');
 
@@ -59,18 +68,26 @@ const DocumentsPage: React.FC = () => {
     fetchDocuments();
   }, []);
 
-  const fetchDocuments = async () => {
+  // Fetch the first page, or the page after `cursor` and append it
+  const fetchDocuments = async (cursor?: DocumentCursor) => {
     try {
       setLoading(true);
-      const response = await fetch('/v1/documents/', {
+      const params = new URLSearchParams({ limit: String(PAGE_SIZE) });
+      if (cursor) {
+        params.set('before_created_at', cursor.before_created_at);
+        params.set('before_id', cursor.before_id);
+      }
+
+      const response = await fetch(`/v1/documents/?${params}`, {
         headers: {
           'Authorization': `Bearer ${localStorage.getItem('access_token')}`,
         },
       });
 
       if (response.ok) {
-        const data = await response.json();
-        setDocuments(data);
+        const page = await response.json();
+        setDocuments(previous => (cursor ? [...previous, ...page.data] : page.data));
+        setNextCursor(page.next_cursor ?? null);
       }
     } catch (error) {
       console.error('Failed to fetch documents:', error);
@@ -117,6 +134,9 @@ const DocumentsPage: React.FC = () => {
     });
   };
 
+  // Counts cover the loaded pages; a trailing + means more can be loaded
+  const countLabel = (count: number) => `${count}${nextCursor ? '+' : ''}`;
+
   const handleTabChange = (event: React.SyntheticEvent, newValue: number) => {
     setActiveTab(newValue);
   };
@@ -144,7 +164,7 @@ const DocumentsPage: React.FC = () => {
           <Button
             variant="outlined"
             startIcon={<Refresh />}
-            onClick={fetchDocuments}
+            onClick={() => fetchDocuments()}
             disabled={loading}
           >
             Refresh
@@ -165,7 +185,7 @@ const DocumentsPage: React.FC = () => {
           <Card>
             <CardContent>
               <Typography variant="h4" component="div">
-                {documents.length}
+                {countLabel(documents.length)}
               </Typography>
               <Typography variant="body2" color="text.secondary">
                 Total Documents
@@ -216,7 +236,7 @@ const DocumentsPage: React.FC = () => {
         <CardContent>
           <Box sx={{ borderBottom: 1, borderColor: 'divider', mb: 2 }}>
             <Tabs value={activeTab} onChange={handleTabChange}>
-              <Tab label={`All (${documents.length})`} />
+              <Tab label={`All (${countLabel(documents.length)})`} />
               <Tab label={`Processing (${documents.filter(d => ['pending', 'processing'].includes(d.processing_status)).length})`} />
               <Tab label={`Completed (${documents.filter(d => d.processing_status === 'completed').length})`} />
               <Tab label={`Failed (${documents.filter(d => d.processing_status === 'failed').length})`} />
@@ -319,6 +339,18 @@ const DocumentsPage: React.FC = () => {
               </Table>
             </TableContainer>
           )}
+
+          {nextCursor && (
+            <Box sx={{ display: 'flex', justifyContent: 'center', mt: 2 }}>
+              <Button
+                variant="outlined"
+                onClick={() => fetchDocuments(nextCursor)}
+                disabled={loading}
+              >
+                Load More
+              </Button>
+            </Box>
+          )}
         </CardContent>
       </Card>
 